@@ -7,9 +7,7 @@ from alembic import context
 
 from sqlmodel import SQLModel
 from app.infrastructure.database.models import *  # noqa
-from app.shared.config import get_settings
-
-settings = get_settings()
+from app.infrastructure.database.tenant_migrations import get_sync_database_url
 
 
 config = context.config
@@ -24,15 +22,19 @@ target_metadata = SQLModel.metadata
 
 def get_url():
     """Get database URL from settings."""
-    # Alembic needs synchronous connection, so convert async URL to sync
-    db_url = settings.database_url
-    if db_url.startswith("sqlite+aiosqlite"):
-        # Convert aiosqlite to regular sqlite for Alembic
-        db_url = db_url.replace("sqlite+aiosqlite", "sqlite")
-    elif db_url.startswith("postgresql+asyncpg"):
-        # Convert asyncpg to psycopg2 for Alembic
-        db_url = db_url.replace("postgresql+asyncpg", "postgresql+psycopg2")
-    return db_url
+    return get_sync_database_url()
+
+
+def get_tenant_schema():
+    """
+    Schema to migrate instead of public, set by the tenant migration runner
+    or passed as ``alembic -x tenant_schema=tenant_<id> upgrade head``.
+    """
+    tenant_schema = config.attributes.get("tenant_schema")
+    if tenant_schema is None:
+        tenant_schema = context.get_x_argument(as_dictionary=True).get("tenant_schema")
+        config.attributes["tenant_schema"] = tenant_schema
+    return tenant_schema
 
 
 def run_migrations_offline() -> None:
@@ -66,6 +68,12 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        # The tenant migration runner hands over its own connection.
+        do_run_migrations(connection)
+        return
+
     configuration = config.get_section(config.config_ini_section)
     configuration["sqlalchemy.url"] = get_url()
     
@@ -76,12 +84,26 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
+        do_run_migrations(connection)
+
+
+def do_run_migrations(connection) -> None:
+    tenant_schema = get_tenant_schema()
+    if tenant_schema:
+        # Migrations target "public"; redirect them (and the version table)
+        # to the tenant schema.
+        connection = connection.execution_options(
+            schema_translate_map={"public": tenant_schema}
         )
 
-        with context.begin_transaction():
-            context.run_migrations()
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        version_table_schema=tenant_schema,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,87 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.database.tenant_migrations import is_tenant_schema_migration
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('password', sa.String(), nullable=True),
+        sa.Column('tenant_id', sa.Uuid(), nullable=True),
+        sa.Column('full_name', sa.String(), nullable=True),
+        sa.Column('role', sa.String(), nullable=False),
+        sa.Column('permissions', sa.String(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        schema='public',
+    )
+    op.create_index('ix_public_users_email', 'users', ['email'], unique=True, schema='public')
+    op.create_index('ix_public_users_username', 'users', ['username'], unique=True, schema='public')
+    op.create_index('ix_public_users_tenant_id', 'users', ['tenant_id'], unique=False, schema='public')
+
+    op.create_table(
+        'refresh_tokens',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('token', sa.String(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('is_revoked', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['public.users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        schema='public',
+    )
+    op.create_index('ix_public_refresh_tokens_token', 'refresh_tokens', ['token'], unique=True, schema='public')
+    op.create_index('ix_public_refresh_tokens_user_id', 'refresh_tokens', ['user_id'], unique=False, schema='public')
+
+    if is_tenant_schema_migration():
+        return
+
+    op.create_table(
+        'tenants',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('domain', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        schema='public',
+    )
+    op.create_index('ix_public_tenants_domain', 'tenants', ['domain'], unique=True, schema='public')
+    op.create_index('ix_public_tenants_name', 'tenants', ['name'], unique=False, schema='public')
+
+
+def downgrade() -> None:
+    if not is_tenant_schema_migration():
+        op.drop_index('ix_public_tenants_name', table_name='tenants', schema='public')
+        op.drop_index('ix_public_tenants_domain', table_name='tenants', schema='public')
+        op.drop_table('tenants', schema='public')
+    op.drop_index('ix_public_refresh_tokens_user_id', table_name='refresh_tokens', schema='public')
+    op.drop_index('ix_public_refresh_tokens_token', table_name='refresh_tokens', schema='public')
+    op.drop_table('refresh_tokens', schema='public')
+    op.drop_index('ix_public_users_tenant_id', table_name='users', schema='public')
+    op.drop_index('ix_public_users_username', table_name='users', schema='public')
+    op.drop_index('ix_public_users_email', table_name='users', schema='public')
+    op.drop_table('users', schema='public')
@@ -0,0 +1,35 @@
+"""tenant provisioning status
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.database.tenant_migrations import is_tenant_schema_migration
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if is_tenant_schema_migration():
+        return
+    # Existing tenants predate background provisioning and are considered ready.
+    op.add_column(
+        'tenants',
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='ready'),
+        schema='public',
+    )
+
+
+def downgrade() -> None:
+    if is_tenant_schema_migration():
+        return
+    op.drop_column('tenants', 'status', schema='public')
@@ -0,0 +1,24 @@
+"""users created_at, id index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backs the (created_at, id) keyset pagination of GET /users
+    op.create_index('ix_public_users_created_at_id', 'users', ['created_at', 'id'], unique=False, schema='public')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_public_users_created_at_id', table_name='users', schema='public')
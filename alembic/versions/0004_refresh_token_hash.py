@@ -0,0 +1,56 @@
+"""store refresh tokens as sha256 digests
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.database.tenant_migrations import migration_schema
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def _refresh_tokens(schema: str):
+    return sa.table(
+        'refresh_tokens',
+        sa.column('token', sa.String()),
+        sa.column('token_hash', sa.LargeBinary()),
+        schema=schema,
+    )
+
+
+def upgrade() -> None:
+    schema = migration_schema()
+    refresh_tokens = _refresh_tokens(schema)
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.LargeBinary(32), nullable=True), schema=schema)
+    # Same digest as hash_token() in the repository, existing sessions stay valid
+    op.execute(
+        refresh_tokens.update().values(
+            token_hash=sa.func.sha256(sa.func.convert_to(refresh_tokens.c.token, 'UTF8'))
+        )
+    )
+    op.alter_column('refresh_tokens', 'token_hash', nullable=False, schema=schema)
+    op.create_index(
+        'ix_public_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], unique=True, schema=schema
+    )
+    op.drop_index('ix_public_refresh_tokens_token', table_name='refresh_tokens', schema=schema)
+    op.drop_column('refresh_tokens', 'token', schema=schema)
+
+
+def downgrade() -> None:
+    schema = migration_schema()
+    # Tokens cannot be recovered from their digests: drop the stored sessions,
+    # users have to log in again.
+    op.execute(_refresh_tokens(schema).delete())
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(), nullable=False), schema=schema)
+    op.create_index('ix_public_refresh_tokens_token', 'refresh_tokens', ['token'], unique=True, schema=schema)
+    op.drop_index('ix_public_refresh_tokens_token_hash', table_name='refresh_tokens', schema=schema)
+    op.drop_column('refresh_tokens', 'token_hash', schema=schema)
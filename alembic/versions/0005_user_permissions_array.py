@@ -0,0 +1,109 @@
+"""store user permissions as text[] with a GIN index (expand)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 14:00:00.000000
+
+Adds users.permissions_array next to the JSON permissions column and keeps
+the two in step both ways, so application instances on either side of the
+release keep working while it rolls out. 0006 drops the JSON column once
+no instance reads it any more.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.database.tenant_migrations import migration_schema
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+# Old code only writes the JSON column, new code only the array: whichever
+# one a statement set is copied into the other. An INSERT from new code
+# leaves the JSON column NULL (it has no default).
+SYNC_FUNCTION = """
+CREATE OR REPLACE FUNCTION "{schema}".users_sync_permissions_array() RETURNS trigger AS $$
+BEGIN
+    IF (TG_OP = 'INSERT' AND NEW.permissions IS NULL)
+        OR (TG_OP = 'UPDATE' AND NEW.permissions IS NOT DISTINCT FROM OLD.permissions
+            AND NEW.permissions_array IS DISTINCT FROM OLD.permissions_array) THEN
+        NEW.permissions := to_jsonb(NEW.permissions_array)::text;
+    ELSE
+        NEW.permissions_array := ARRAY(SELECT jsonb_array_elements_text(NULLIF(NEW.permissions, '')::jsonb));
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+SYNC_TRIGGER = """
+CREATE TRIGGER users_sync_permissions_array
+BEFORE INSERT OR UPDATE OF permissions, permissions_array ON "{schema}".users
+FOR EACH ROW EXECUTE FUNCTION "{schema}".users_sync_permissions_array()
+"""
+
+# Touches the next BATCH_SIZE rows by primary key, the trigger converts them,
+# and returns the last id of the batch (no row once past the end). Rows
+# holding '[]' keep the '{}' column default and are not rewritten.
+BACKFILL_BATCH = """
+WITH batch AS (
+    SELECT id FROM "{schema}".users WHERE id > :after ORDER BY id LIMIT :batch_size
+), converted AS (
+    UPDATE "{schema}".users
+    SET permissions = users.permissions
+    FROM batch
+    WHERE users.id = batch.id AND coalesce(users.permissions, '') NOT IN ('', '[]')
+)
+SELECT id FROM batch ORDER BY id DESC LIMIT 1
+"""
+
+
+def create_sync_trigger(schema: str) -> None:
+    op.execute(SYNC_FUNCTION.format(schema=schema))
+    op.execute(f'DROP TRIGGER IF EXISTS users_sync_permissions_array ON "{schema}".users')
+    op.execute(SYNC_TRIGGER.format(schema=schema))
+
+
+def drop_sync_trigger(schema: str) -> None:
+    op.execute(f'DROP TRIGGER IF EXISTS users_sync_permissions_array ON "{schema}".users')
+    op.execute(f'DROP FUNCTION IF EXISTS "{schema}".users_sync_permissions_array()')
+
+
+def upgrade() -> None:
+    schema = migration_schema()
+    # The backfill below commits as it goes: these steps tolerate a rerun
+    # after an interrupted upgrade.
+    op.execute(
+        f'ALTER TABLE "{schema}".users '
+        f"ADD COLUMN IF NOT EXISTS permissions_array TEXT[] NOT NULL DEFAULT '{{}}'"
+    )
+    create_sync_trigger(schema)
+
+    # Each batch commits on its own so row locks are held briefly, and the
+    # index is built without blocking writes.
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        statement = sa.text(BACKFILL_BATCH.format(schema=schema)).bindparams(
+            sa.bindparam('after', type_=postgresql.UUID()),
+        )
+        after = '00000000-0000-0000-0000-000000000000'
+        while after is not None:
+            after = connection.execute(statement, {'after': after, 'batch_size': BATCH_SIZE}).scalar()
+        op.create_index(
+            'ix_public_users_permissions', 'users', ['permissions_array'], schema=schema,
+            postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    schema = migration_schema()
+    op.drop_index('ix_public_users_permissions', table_name='users', schema=schema)
+    drop_sync_trigger(schema)
+    op.drop_column('users', 'permissions_array', schema=schema)
@@ -0,0 +1,42 @@
+"""drop the JSON users.permissions column (contract)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 14:30:00.000000
+
+Apply only once every application instance reads permissions_array: until
+then instances still on the previous release read and write the JSON
+column that this drops.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.database.tenant_migrations import migration_schema
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# Only drops what the application no longer uses: the code runs on 0005 too
+contract = True
+
+
+def _expand_revision():
+    return op.get_context().script.get_revision('0005').module
+
+
+def upgrade() -> None:
+    schema = migration_schema()
+    _expand_revision().drop_sync_trigger(schema)
+    op.drop_column('users', 'permissions', schema=schema)
+
+
+def downgrade() -> None:
+    schema = migration_schema()
+    op.add_column('users', sa.Column('permissions', sa.String(), nullable=True), schema=schema)
+    op.execute(f'UPDATE "{schema}".users SET permissions = to_jsonb(permissions_array)::text')
+    _expand_revision().create_sync_trigger(schema)
@@ -0,0 +1,74 @@
+import csv
+from typing import AsyncIterator, List, Optional
+
+from pydantic import ValidationError
+
+from app.application.dtos.user_dtos import CreateUserRequest
+from app.application.use_cases.user_use_cases import BulkUserRow
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+CSV_CONTENT_TYPES = ("text/csv",)
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines without buffering the whole body."""
+    buffer = b""
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+
+
+async def parse_ndjson_users(stream: AsyncIterator[bytes]) -> AsyncIterator[BulkUserRow]:
+    line_number = 0
+    async for line in iter_lines(stream):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_number, CreateUserRequest.model_validate_json(line)
+        except ValidationError as e:
+            yield line_number, _format_validation_error(e)
+
+
+async def parse_csv_users(stream: AsyncIterator[bytes]) -> AsyncIterator[BulkUserRow]:
+    """CSV with a header row (email, username, password[, full_name]), one record per line."""
+    header: Optional[List[str]] = None
+    line_number = 0
+    async for line in iter_lines(stream):
+        line_number += 1
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [column.strip().lower() for column in values]
+            continue
+        if len(values) != len(header):
+            yield line_number, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        record = {column: value for column, value in zip(header, values) if value != ""}
+        try:
+            yield line_number, CreateUserRequest.model_validate(record)
+        except ValidationError as e:
+            yield line_number, _format_validation_error(e)
+
+
+def parse_users(content_type: str, stream: AsyncIterator[bytes]) -> Optional[AsyncIterator[BulkUserRow]]:
+    """Pick the parser for a Content-Type, None when it is not supported."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in NDJSON_CONTENT_TYPES:
+        return parse_ndjson_users(stream)
+    if media_type in CSV_CONTENT_TYPES:
+        return parse_csv_users(stream)
+    return None
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    parts = []
+    for detail in error.errors():
+        location = ".".join(str(part) for part in detail["loc"])
+        parts.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return "; ".join(parts)
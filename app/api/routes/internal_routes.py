@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+
+from app.infrastructure.database.connection import get_pool_statistics
+from app.infrastructure.database.dependencies import _get_container
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/db-pool")
+async def db_pool_statistics():
+    return get_pool_statistics()
+
+
+@router.get("/tenant-registry")
+async def tenant_registry_statistics():
+    container = _get_container()
+    return container.tenant_registry().stats()
+
+
+@router.get("/tenant-domain-index")
+async def tenant_domain_index_statistics():
+    container = _get_container()
+    return container.tenant_domain_index().stats()
+
+
+@router.get("/password-hashing")
+async def password_hashing_statistics():
+    container = _get_container()
+    return container.token_service().password_hashing_stats()
+
+
+@router.get("/refresh-token-sweeper")
+async def refresh_token_sweeper_statistics():
+    container = _get_container()
+    return container.refresh_token_sweeper().stats()
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,8 +10,11 @@ from app.application.dtos.tenant_dtos import (
     CursorPagedTenantResponse,
     PaginationDirection
 )
+from app.application.exceptions.tenant_exceptions import TenantVersionConflictError
 from app.infrastructure.database.connection import get_db_session
-from app.infrastructure.database.dependencies import _get_container
+from app.shared.etag import etag_matches, make_etag
+from app.shared.pagination import TotalCountMode
+from app.infrastructure.database.dependencies import _get_container, get_read_db_session
 from app.ioc.container import (
     get_create_tenant_use_case_with_session,
     get_get_tenant_use_case_with_session,
@@ -38,6 +41,7 @@ async def create_tenant(
             name=tenant.name,
             domain=tenant.domain,
             is_active=tenant.is_active,
+            status=tenant.status.value,
             created_at=tenant.created_at,
             updated_at=tenant.updated_at
         )
@@ -51,18 +55,28 @@ async def create_tenant(
 @router.get("/{tenant_id}", response_model=TenantResponse)
 async def get_tenant(
     tenant_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
   
     container = _get_container()
     get_tenant_use_case = get_get_tenant_use_case_with_session(container, db)
+    if if_none_match:
+        version = await get_tenant_use_case.get_version(tenant_id)
+        if version is not None:
+            etag = make_etag(tenant_id, version)
+            if etag_matches(if_none_match, etag, weak=True):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
     try:
         tenant = await get_tenant_use_case.execute(tenant_id)
+        response.headers["ETag"] = make_etag(tenant.tenant_id, tenant.version)
         return TenantResponse(
             id=tenant.tenant_id,
             name=tenant.name,
             domain=tenant.domain,
             is_active=tenant.is_active,
+            status=tenant.status.value,
             created_at=tenant.created_at,
             updated_at=tenant.updated_at
         )
@@ -77,21 +91,30 @@ async def get_tenant(
 async def update_tenant(
     tenant_id: UUID,
     request: UpdateTenantRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db_session),
 ):
   
     container = _get_container()
     update_tenant_use_case = get_update_tenant_use_case_with_session(container, db)
     try:
-        tenant = await update_tenant_use_case.execute(tenant_id, request)
+        tenant = await update_tenant_use_case.execute(tenant_id, request, if_match=if_match)
+        response.headers["ETag"] = make_etag(tenant.tenant_id, tenant.version)
         return TenantResponse(
             id=tenant.tenant_id,
             name=tenant.name,
             domain=tenant.domain,
             is_active=tenant.is_active,
+            status=tenant.status.value,
             created_at=tenant.created_at,
             updated_at=tenant.updated_at
         )
+    except TenantVersionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -104,7 +127,8 @@ async def list_tenants(
     cursor: Optional[str] = Query(None),
     page_size: int = Query(10, ge=1, le=100),
     direction: PaginationDirection = Query(PaginationDirection.FORWARD),
-    db: AsyncSession = Depends(get_db_session),
+    include_total: TotalCountMode = Query(TotalCountMode.NONE),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
  
     container = _get_container()
@@ -112,9 +136,13 @@ async def list_tenants(
     request = CursorPagedTenantRequest(
         cursor=cursor,
         page_size=page_size,
-        direction=direction
+        direction=direction,
+        include_total=include_total,
     )
-    result = await list_tenants_use_case.execute(request)
+    try:
+        result = await list_tenants_use_case.execute(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     return CursorPagedTenantResponse(
         items=[TenantResponse(
@@ -122,6 +150,7 @@ async def list_tenants(
             name=item.name,
             domain=item.domain,
             is_active=item.is_active,
+            status=item.status.value,
             created_at=item.created_at,
             updated_at=item.updated_at
         ) for item in result.items],
@@ -129,7 +158,9 @@ async def list_tenants(
         previous_cursor=result.previous_cursor,
         has_next_page=result.has_next_page,
         has_previous_page=result.has_previous_page,
-        page_size=result.page_size
+        page_size=result.page_size,
+        total_count=result.total_count,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
@@ -1,24 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
+from app.api.bulk_input import parse_users
 from app.application.dtos.user_dtos import (
+    BulkCreateUsersResponse,
     CreateUserRequest,
+    CursorPagedUserRequest,
+    CursorPagedUserResponse,
     UpdateUserRequest,
     UserResponse,
     LoginRequest,
     TokenResponse,
     RefreshTokenRequest,
 )
-from app.infrastructure.database.dependencies import get_tenant_db, _get_container
+from app.infrastructure.database.dependencies import (
+    get_request_tenant_id,
+    get_tenant_db,
+    get_tenant_read_db,
+    _get_container,
+)
 from app.application.exceptions.user_exceptions import (
     UserNotFoundError,
     InvalidUserDataError,
     UserAlreadyExistsError,
+    UserVersionConflictError,
 )
 from app.infrastructure.authentication.token_service import TokenService
+from app.shared.etag import etag_matches, make_etag
+from app.shared.pagination import PaginationDirection, TotalCountMode
 from app.ioc.container import (
+    get_bulk_create_users_use_case_with_session,
     get_create_user_use_case_with_session,
     get_get_user_use_case_with_session,
+    get_list_users_use_case_with_session,
     get_update_user_use_case_with_session,
     get_login_use_case_with_session,
     get_refresh_token_use_case_with_session,
@@ -43,7 +58,7 @@ async def create_user(
     container = _get_container()
     create_user_use_case = get_create_user_use_case_with_session(container, db)
     tenant_id = None
-    x_tenant_id = request_obj.headers.get("X-Tenant-ID")
+    x_tenant_id = get_request_tenant_id(request_obj)
     if x_tenant_id:
         try:
             tenant_id = UUID(x_tenant_id)
@@ -53,7 +68,7 @@ async def create_user(
                 detail="Invalid tenant ID format",
             )
 
-    hashed_password = token_service.get_password_hash(request.password)
+    hashed_password = await token_service.hash_password(request.password)
     try:
         user = await create_user_use_case.execute(
             email=request.email,
@@ -75,15 +90,111 @@ async def create_user(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/bulk", response_model=BulkCreateUsersResponse)
+async def bulk_create_users(
+    request_obj: Request,
+    db: AsyncSession = Depends(get_tenant_db),
+):
+    """
+    Create users from a streamed NDJSON (application/x-ndjson) or CSV
+    (text/csv, header row required) body. Rows that fail validation or
+    already exist are reported in ``errors`` with their line number.
+    """
+    rows = parse_users(request_obj.headers.get("content-type", ""), request_obj.stream())
+    if rows is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send the users as application/x-ndjson or text/csv",
+        )
+
+    tenant_id = None
+    x_tenant_id = get_request_tenant_id(request_obj)
+    if x_tenant_id:
+        try:
+            tenant_id = UUID(x_tenant_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid tenant ID format",
+            )
+
+    container = _get_container()
+    bulk_create_users_use_case = get_bulk_create_users_use_case_with_session(container, db)
+    return await bulk_create_users_use_case.execute(rows, tenant_id=tenant_id)
+
+
+@router.get("/", response_model=CursorPagedUserResponse)
+async def list_users(
+    cursor: Optional[str] = Query(None),
+    page_size: int = Query(10, ge=1, le=100),
+    direction: PaginationDirection = Query(PaginationDirection.FORWARD),
+    include_total: TotalCountMode = Query(TotalCountMode.NONE),
+    permission: Optional[str] = Query(None, min_length=1),
+    db: AsyncSession = Depends(get_tenant_read_db),
+):
+    """
+    Users ordered by creation time (oldest first, newest first with
+    ``direction=backward``). Pass ``next_cursor`` back as ``cursor`` to get
+    the following page.
+
+    ``include_total=estimate`` fills ``total_count`` from planner statistics
+    without scanning the table, ``exact`` counts (cached for a few seconds).
+
+    ``permission`` keeps only the users holding that permission (GIN index).
+    """
+    container = _get_container()
+    list_users_use_case = get_list_users_use_case_with_session(container, db)
+    request = CursorPagedUserRequest(
+        cursor=cursor,
+        page_size=page_size,
+        direction=direction,
+        include_total=include_total,
+        permission=permission,
+    )
+    try:
+        result = await list_users_use_case.execute(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return CursorPagedUserResponse(
+        items=[UserResponse(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            created_at=user.created_at.isoformat(),
+            updated_at=user.updated_at.isoformat() if user.updated_at else None,
+        ) for user in result.items],
+        next_cursor=result.next_cursor,
+        previous_cursor=result.previous_cursor,
+        has_next_page=result.has_next_page,
+        has_previous_page=result.has_previous_page,
+        page_size=result.page_size,
+        total_count=result.total_count,
+        total_is_estimate=result.total_is_estimate,
+    )
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_tenant_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_tenant_read_db),
 ):
     try:
         container = _get_container()
         get_user_use_case = get_get_user_use_case_with_session(container, db)
+        if if_none_match:
+            # Revalidation reads the version only, the row is loaded on a miss
+            version = await get_user_use_case.get_version(user_id)
+            if version is not None:
+                etag = make_etag(user_id, version)
+                if etag_matches(if_none_match, etag, weak=True):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
         user = await get_user_use_case.execute(user_id)
+        response.headers["ETag"] = make_etag(user.id, user.version)
         return UserResponse(
             id=user.id,
             email=user.email,
@@ -101,12 +212,15 @@ async def get_user(
 async def update_user(
     user_id: UUID,
     request: UpdateUserRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_tenant_db),
 ):
     try:
         container = _get_container()
         update_user_use_case = get_update_user_use_case_with_session(container, db)
-        user = await update_user_use_case.execute(user_id, request)
+        user = await update_user_use_case.execute(user_id, request, if_match=if_match)
+        response.headers["ETag"] = make_etag(user.id, user.version)
         return UserResponse(
             id=user.id,
             email=user.email,
@@ -118,6 +232,10 @@ async def update_user(
         )
     except UserNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UserAlreadyExistsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except UserVersionConflictError as e:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e))
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -3,6 +3,7 @@ from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
+from app.shared.pagination import TotalCountMode
 
 class PaginationDirection(str, Enum):
     FORWARD = "forward"
@@ -24,6 +25,7 @@ class TenantResponse(BaseModel):
     name: str
     domain: str
     is_active: bool
+    status: str = "ready"
     created_at: datetime
     updated_at: datetime
     
@@ -45,8 +47,11 @@ class CursorPagedTenantResponse(BaseModel):
     has_next_page: bool
     has_previous_page: bool
     page_size: int
+    total_count: Optional[int] = None
+    total_is_estimate: bool = False
     
 class CursorPagedTenantRequest(BaseModel):
     cursor: Optional[str] = None
     page_size: int = 10
-    direction: PaginationDirection = PaginationDirection.FORWARD
\ No newline at end of file
+    direction: PaginationDirection = PaginationDirection.FORWARD
+    include_total: TotalCountMode = TotalCountMode.NONE
\ No newline at end of file
@@ -1,8 +1,9 @@
 from uuid import UUID
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.domain.entities.user import User
+from app.shared.pagination import PaginationDirection, TotalCountMode
 
 class CreateUserRequest(BaseModel):
     email: str
@@ -48,6 +49,38 @@ class UserResponse(BaseModel):
             updated_at=datetime.fromisoformat(self.updated_at) if self.updated_at else None
         )
         
+class CursorPagedUserRequest(BaseModel):
+    cursor: Optional[str] = None
+    page_size: int = 10
+    direction: PaginationDirection = PaginationDirection.FORWARD
+    include_total: TotalCountMode = TotalCountMode.NONE
+    permission: Optional[str] = None
+
+
+class CursorPagedUserResponse(BaseModel):
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+    has_next_page: bool
+    has_previous_page: bool
+    page_size: int
+    total_count: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+class BulkCreateUserError(BaseModel):
+    line: int
+    error: str
+    email: Optional[str] = None
+
+
+class BulkCreateUsersResponse(BaseModel):
+    received: int
+    created: int
+    failed: int
+    errors: List[BulkCreateUserError] = []
+
+        
 class TokenResponse(BaseModel):
     access_token: str
     refresh_token: str
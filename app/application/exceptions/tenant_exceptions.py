@@ -13,6 +13,10 @@ class TenantNotFoundError(TenantApplicationError):
     def __init__(self, reason: str):
         super().__init__(reason)
 
+class TenantVersionConflictError(TenantApplicationError):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+
 class TenantInvalidDataError(TenantApplicationError):
     fields_with_errors: Optional[List[str]] = None
     def __init__(self, reason: str, fields_with_errors: List[str]):
@@ -16,6 +16,11 @@ class UserNotFoundError(UserApplicationError):
         super().__init__(reason)
 
 
+class UserVersionConflictError(UserApplicationError):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+
+
 class InvalidUserDataError(UserApplicationError):
     fields_with_errors = Optional[List[str]]
     def __init__(self, reason: str):
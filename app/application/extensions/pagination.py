@@ -1,7 +1,13 @@
 from typing import TypeVar, List, Optional, Any
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
 from pydantic import BaseModel, Field
+from sqlalchemy import bindparam, tuple_
 import base64
-import json
+import hashlib
+import hmac
+import struct
+from app.shared.config import get_settings
 from app.shared.pagination import PaginationDirection, CursorPagedResult, ICursorPaginationHelper
 
 T = TypeVar('T')
@@ -39,31 +45,125 @@ class CursorPaginationRequest(BaseModel):
             self.page_size = 10
 
 
+# Cursor layout: version byte, typed key values, truncated HMAC-SHA256,
+# base64url without padding. Each value is a one byte tag plus its payload.
+CURSOR_VERSION = 1
+SIGNATURE_SIZE = 12
+
+_INT64 = struct.Struct(">q")
+_FLOAT64 = struct.Struct(">d")
+_STR_LENGTH = struct.Struct(">H")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _pack_value(value: Any) -> bytes:
+    if value is None:
+        return b"n"
+    if isinstance(value, bool):
+        return b"b\x01" if value else b"b\x00"
+    if isinstance(value, int):
+        return b"i" + _INT64.pack(value)
+    if isinstance(value, UUID):
+        return b"u" + value.bytes
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return b"D" + _INT64.pack((value - _NAIVE_EPOCH) // _MICROSECOND)
+        return b"d" + _INT64.pack((value - _EPOCH) // _MICROSECOND)
+    if isinstance(value, float):
+        return b"f" + _FLOAT64.pack(value)
+    if isinstance(value, str):
+        data = value.encode("utf-8")
+        return b"s" + _STR_LENGTH.pack(len(data)) + data
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _unpack_values(data: bytes, offset: int) -> List[Any]:
+    values = []
+    while offset < len(data):
+        tag = data[offset:offset + 1]
+        offset += 1
+        if tag == b"n":
+            values.append(None)
+        elif tag == b"b":
+            values.append(data[offset] == 1)
+            offset += 1
+        elif tag == b"i":
+            values.append(_INT64.unpack_from(data, offset)[0])
+            offset += 8
+        elif tag == b"u":
+            values.append(UUID(bytes=data[offset:offset + 16]))
+            offset += 16
+        elif tag == b"d":
+            values.append(_EPOCH + _INT64.unpack_from(data, offset)[0] * _MICROSECOND)
+            offset += 8
+        elif tag == b"D":
+            values.append(_NAIVE_EPOCH + _INT64.unpack_from(data, offset)[0] * _MICROSECOND)
+            offset += 8
+        elif tag == b"f":
+            values.append(_FLOAT64.unpack_from(data, offset)[0])
+            offset += 8
+        elif tag == b"s":
+            (length,) = _STR_LENGTH.unpack_from(data, offset)
+            offset += 2
+            values.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        else:
+            raise ValueError(f"Unknown cursor value tag: {tag!r}")
+    if offset != len(data):
+        raise ValueError("Truncated cursor")
+    return values
+
+
 class CursorPaginationHelper(ICursorPaginationHelper):
-   
-    @staticmethod
-    def encode_cursor(value: Any) -> str:
+    """
+    Cursors carry the key of a page boundary row as typed values (UUID,
+    datetime, int, str, ...) in a compact binary form, signed with HMAC so a
+    client can only send back cursors the API handed out.
+    """
+
+    def __init__(self, secret_key: Optional[str] = None):
+        if secret_key is None:
+            settings = get_settings()
+            secret_key = settings.cursor_secret_key or settings.secret_key
+        # Derived key, cursors never share a MAC key with the JWTs. The keyed
+        # state is computed once and copied for every cursor.
+        signing_key = hashlib.sha256(b"cursor:" + secret_key.encode("utf-8")).digest()
+        self._mac = hmac.new(signing_key, digestmod=hashlib.sha256)
+
+    def _sign(self, payload: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(payload)
+        return mac.digest()[:SIGNATURE_SIZE]
+
+    def encode_cursor(self, value: Any) -> str:
+        """Encode a key value, or a list/tuple of them for a composite key."""
+        values = value if isinstance(value, (list, tuple)) else (value,)
         try:
-            json_str = json.dumps(value, default=str)
-            bytes_data = json_str.encode('utf-8')
-            return base64.b64encode(bytes_data).decode('utf-8')
-        except Exception as e:
+            payload = bytes((CURSOR_VERSION,)) + b"".join(_pack_value(item) for item in values)
+        except (TypeError, struct.error) as e:
             raise ValueError(f"Failed to encode cursor: {e}")
-    
-    @staticmethod
-    def decode_cursor(cursor: str, target_type: type = None) -> Any:
+        return base64.urlsafe_b64encode(payload + self._sign(payload)).rstrip(b"=").decode("ascii")
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        """Verify a cursor and return its key values (always a list)."""
         try:
-            bytes_data = base64.b64decode(cursor.encode('utf-8'))
-            json_str = bytes_data.decode('utf-8')
-            if target_type is not None:
-                return json.loads(json_str, object_hook=lambda d: target_type(**d))
-            return json.loads(json_str)
-        except Exception as e:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Failed to decode cursor: {e}")
+        payload, signature = raw[:-SIGNATURE_SIZE], raw[-SIGNATURE_SIZE:]
+        if len(payload) < 1 or not hmac.compare_digest(signature, self._sign(payload)):
+            raise ValueError("Invalid cursor signature")
+        if payload[0] != CURSOR_VERSION:
+            raise ValueError(f"Unsupported cursor version: {payload[0]}")
+        try:
+            return _unpack_values(payload, 1)
+        except (struct.error, UnicodeDecodeError, ValueError) as e:
             raise ValueError(f"Failed to decode cursor: {e}")
-    
 
-    @staticmethod
     def build_cursor_query(
+        self,
         base_query,
         model_class,
         key_selector: str,
@@ -71,58 +171,77 @@ class CursorPaginationHelper(ICursorPaginationHelper):
         page_size: int = 10,
         direction: PaginationDirection = PaginationDirection.FORWARD
     ):
+        return self.build_keyset_query(base_query, model_class, [key_selector], cursor, page_size, direction)
+
+    def apply_cursor_pagination_to_query_result(
+        self,
+        items: List[T],
+        key_selector: str,
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        direction: PaginationDirection = PaginationDirection.FORWARD
+    ) -> CursorPagedResult[T]:
+        return self.apply_keyset_pagination_to_query_result(items, [key_selector], cursor, page_size, direction)
+
+    def build_keyset_query(
+        self,
+        base_query,
+        model_class,
+        key_selectors: List[str],
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        direction: PaginationDirection = PaginationDirection.FORWARD
+    ):
+        # The last key is expected to be unique (usually the primary key) so
+        # rows sharing the leading values keep a total, stable order. A row
+        # value comparison lets the database seek a matching composite index.
+        columns = [getattr(model_class, key_selector) for key_selector in key_selectors]
         
         if cursor:
-            try:
-                cursor_value = CursorPaginationHelper.decode_cursor(cursor)
-                if direction == PaginationDirection.FORWARD:
-                    base_query = base_query.where(getattr(model_class, key_selector) > cursor_value)
-                else:
-                    base_query = base_query.where(getattr(model_class, key_selector) < cursor_value)
-            except ValueError:
+            key = self.decode_cursor(cursor)
+            if len(key) != len(columns):
                 raise ValueError(f"Invalid cursor: {cursor}")
+            if len(columns) == 1:
+                left, right = columns[0], key[0]
+            else:
+                left = tuple_(*columns)
+                right = tuple_(*[
+                    bindparam(f"cursor_{column.key}", value, type_=column.type)
+                    for column, value in zip(columns, key)
+                ])
+            if direction == PaginationDirection.FORWARD:
+                base_query = base_query.where(left > right)
+            else:
+                base_query = base_query.where(left < right)
         
         if direction == PaginationDirection.FORWARD:
-            base_query = base_query.order_by(getattr(model_class, key_selector))
+            base_query = base_query.order_by(*columns)
         else:
-            base_query = base_query.order_by(getattr(model_class, key_selector).desc())
-        
-        base_query = base_query.limit(page_size + 1)
+            base_query = base_query.order_by(*[column.desc() for column in columns])
         
-        return base_query
+        return base_query.limit(page_size + 1)
 
-    @staticmethod
-    def apply_cursor_pagination_to_query_result(
+    def apply_keyset_pagination_to_query_result(
+        self,
         items: List[T],
-        key_selector: str,
+        key_selectors: List[str],
         cursor: Optional[str] = None,
         page_size: int = 10,
         direction: PaginationDirection = PaginationDirection.FORWARD
     ) -> CursorPagedResult[T]:
         
-        if not items:
-            return CursorPagedResult[T](
-                items=[],
-                next_cursor=None,
-                previous_cursor=None,
-                has_next_page=False,
-                has_previous_page=False,
-                page_size=page_size
-            )
-        
         has_next_page = len(items) > page_size
-        
         paginated_items = items[:page_size]
         
         next_cursor = None
         previous_cursor = None
         
         if paginated_items:
-            last_item_key = getattr(paginated_items[-1], key_selector)
-            first_item_key = getattr(paginated_items[0], key_selector)
+            last_item_key = [getattr(paginated_items[-1], key_selector) for key_selector in key_selectors]
+            first_item_key = [getattr(paginated_items[0], key_selector) for key_selector in key_selectors]
             
-            next_cursor = CursorPaginationHelper.encode_cursor(last_item_key) if has_next_page else None
-            previous_cursor = CursorPaginationHelper.encode_cursor(first_item_key) if cursor else None
+            next_cursor = self.encode_cursor(last_item_key) if has_next_page else None
+            previous_cursor = self.encode_cursor(first_item_key) if cursor else None
         
         return CursorPagedResult[T](
             items=paginated_items,
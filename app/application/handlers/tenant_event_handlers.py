@@ -0,0 +1,19 @@
+from fastapi_events.handlers.base import BaseEventHandler
+from fastapi_events.typing import Event
+
+from app.domain.interfaces.tenant_domain_index import ITenantDomainIndex
+
+
+class TenantDomainIndexEventHandler(BaseEventHandler):
+    """Keeps the host routing index in step with tenant.created/updated/deleted."""
+
+    def __init__(self, tenant_domain_index: ITenantDomainIndex):
+        self.tenant_domain_index = tenant_domain_index
+
+    async def handle(self, event: Event) -> None:
+        event_name, payload = event
+
+        if event_name == "tenant.deleted":
+            self.tenant_domain_index.remove(payload["tenant_id"])
+        else:
+            self.tenant_domain_index.set(payload["tenant_id"], payload["domain"])
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi_events.handlers.base import BaseEventHandler
 from fastapi_events.typing import Event
 
@@ -5,6 +7,7 @@ from app.domain.events.user_events import (
     UserCreatedEvent,
     UserLoggedInEvent,
     UserUpdatedEvent,
+    UsersBulkCreatedEvent,
 )
 from app.domain.interfaces.mail_service import IMailService
 from app.domain.interfaces.message_queue_service import IMessageQueueService
@@ -79,6 +82,85 @@ class UserCreatedEventHandler(BaseEventHandler):
             print(f"Failed to send welcome email to {event.email}: {e}")
 
 
+class UsersBulkCreatedEventHandler(BaseEventHandler):
+    # Welcome emails sent at the same time for one batch
+    email_concurrency = 10
+
+    def __init__(
+        self,
+        email_service: IMailService,
+        message_queue_service: IMessageQueueService = None,
+    ):
+        self.email_service = email_service
+        self.message_queue_service = message_queue_service
+        self.template_loader = LoadTemplates()
+
+    async def handle(self, event: Event) -> None:
+        event_name, payload = event
+
+        bulk_event = UsersBulkCreatedEvent(
+            tenant_id=payload["tenant_id"],
+            users=payload["users"],
+            event_id=payload["event_id"],
+            occurred_at=payload["occurred_at"],
+            event_type=payload["event_type"],
+        )
+
+        # One message for the whole batch
+        if self.message_queue_service:
+            await self._publish_to_rabbitmq("user.bulk_created", bulk_event)
+
+        semaphore = asyncio.Semaphore(self.email_concurrency)
+
+        async def send(user):
+            async with semaphore:
+                await self._send_welcome_email(bulk_event, user)
+
+        await asyncio.gather(*(send(user) for user in bulk_event.users))
+
+    async def _publish_to_rabbitmq(
+        self, routing_key: str, event: UsersBulkCreatedEvent
+    ) -> None:
+        try:
+            message = {
+                "event_type": event.event_type,
+                "tenant_id": str(event.tenant_id),
+                "users": [
+                    {
+                        "user_id": str(user["user_id"]),
+                        "email": user["email"],
+                        "username": user["username"],
+                        "full_name": user.get("full_name"),
+                    }
+                    for user in event.users
+                ],
+                "occurred_at": event.occurred_at.isoformat()
+                if hasattr(event.occurred_at, "isoformat")
+                else str(event.occurred_at),
+                "event_id": str(event.event_id) if hasattr(event, "event_id") else None,
+            }
+            await self.message_queue_service.publish(routing_key, message)
+        except Exception as e:
+            print(f"Failed to publish user.bulk_created event to RabbitMQ: {e}")
+
+    async def _send_welcome_email(self, event: UsersBulkCreatedEvent, user: dict) -> None:
+        try:
+            html_content = self.template_loader.render_welcome_email(
+                full_name=user.get("full_name"),
+                email=user["email"],
+                username=user["username"],
+                tenant_id=event.tenant_id,
+            )
+
+            await self.email_service.send_email(
+                to=user["email"],
+                subject=f"¡Bienvenido {user.get('full_name') or user['username']}!",
+                html=html_content,
+            )
+        except Exception as e:
+            print(f"Failed to send welcome email to {user['email']}: {e}")
+
+
 class UserUpdatedEventHandler(BaseEventHandler):
     def __init__(
         self,
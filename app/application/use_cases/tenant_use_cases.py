@@ -1,16 +1,31 @@
 from app.domain.interfaces.tenant_repository import TenantRepository
+from app.domain.interfaces.tenant_registry import ITenantRegistry
+from app.domain.interfaces.tenant_provisioner import ITenantProvisioner
+from app.domain.interfaces.unit_of_work import IUnitOfWork
+from app.domain.interfaces.event_dispatcher import EventDispatcher as IEventDispatcher
+from app.domain.events.tenant_events import TenantCreatedEvent, TenantDeletedEvent, TenantUpdatedEvent
 from app.application.dtos.tenant_dtos import CreateTenantRequest, UpdateTenantRequest, CursorPagedTenantRequest
-from app.domain.entities.tenant import Tenant
-from app.application.exceptions.tenant_exceptions import TenantNotFoundError, TenantAlreadyExistsError
+from app.domain.entities.tenant import Tenant, TenantStatus
+from app.application.exceptions.tenant_exceptions import (
+    TenantNotFoundError,
+    TenantAlreadyExistsError,
+    TenantVersionConflictError,
+)
+from app.shared.etag import etag_matches, make_etag
 from app.shared.pagination import CursorPagedResult
-from typing import Any
+from datetime import datetime
+from functools import partial
+from typing import Any, Optional
 from uuid import UUID
 
 
 class CreateTenantUseCase:
     
-    def __init__(self, tenant_repository: TenantRepository):
+    def __init__(self, tenant_repository: TenantRepository, unit_of_work: IUnitOfWork, tenant_provisioner: ITenantProvisioner = None, event_dispatcher: IEventDispatcher = None):
         self.tenant_repository = tenant_repository
+        self.unit_of_work = unit_of_work
+        self.tenant_provisioner = tenant_provisioner
+        self.event_dispatcher = event_dispatcher
     
     async def execute(self, request: CreateTenantRequest) -> Tenant:
         
@@ -21,10 +36,28 @@ class CreateTenantUseCase:
         tenant = Tenant(
             name=request.name,
             domain=request.domain,
-            is_active=True
+            is_active=True,
+            status=TenantStatus.PROVISIONING if self.tenant_provisioner else TenantStatus.READY
         )
         
-        return await self.tenant_repository.create(tenant)
+        async with self.unit_of_work:
+            created_tenant = await self.tenant_repository.create(tenant)
+            
+            # The schema is built in the background once the row is committed;
+            # requests for the tenant are rejected with 503 until the
+            # provisioner marks it ready.
+            if self.tenant_provisioner:
+                self.unit_of_work.on_commit(partial(self.tenant_provisioner.schedule, created_tenant.tenant_id))
+            if self.event_dispatcher:
+                event = TenantCreatedEvent(
+                    tenant_id=created_tenant.tenant_id,
+                    name=created_tenant.name,
+                    domain=created_tenant.domain,
+                )
+                self.unit_of_work.on_commit(partial(self.event_dispatcher.dispatch_tenant_created, event))
+            await self.unit_of_work.commit()
+        
+        return created_tenant
 
 
 class GetTenantUseCase:
@@ -38,19 +71,33 @@ class GetTenantUseCase:
         if not tenant:
             raise TenantNotFoundError(f"Tenant with id {tenant_id} not found")
         return tenant
+    
+    async def get_version(self, tenant_id: UUID) -> Optional[datetime]:
+        """For If-None-Match: the version alone, the row is not loaded."""
+        return await self.tenant_repository.get_version(tenant_id)
 
 
 class UpdateTenantUseCase:
 
     
-    def __init__(self, tenant_repository: TenantRepository):
+    def __init__(self, tenant_repository: TenantRepository, unit_of_work: IUnitOfWork, tenant_registry: ITenantRegistry = None, event_dispatcher: IEventDispatcher = None):
         self.tenant_repository = tenant_repository
+        self.unit_of_work = unit_of_work
+        self.tenant_registry = tenant_registry
+        self.event_dispatcher = event_dispatcher
     
-    async def execute(self, tenant_id: UUID, request: UpdateTenantRequest) -> Tenant:
+    async def execute(self, tenant_id: UUID, request: UpdateTenantRequest, if_match: Optional[str] = None) -> Tenant:
 
         existing_tenant = await self.tenant_repository.get_by_id(tenant_id)
         if not existing_tenant:
             raise TenantNotFoundError(f"Tenant with id {tenant_id} not found")
+        
+        # If-Match: checked here and again by the UPDATE's WHERE clause
+        expected_version = None
+        if if_match is not None:
+            if not etag_matches(if_match, make_etag(tenant_id, existing_tenant.version), weak=False):
+                raise TenantVersionConflictError(f"Tenant with id {tenant_id} has been modified")
+            expected_version = existing_tenant.version
     
         existing_tenant.update_info(
             name=request.name,
@@ -64,9 +111,22 @@ class UpdateTenantUseCase:
                 
                 existing_tenant.deactivate()
         
-        updated_tenant = await self.tenant_repository.update(existing_tenant)
-        if not updated_tenant:
-            raise TenantNotFoundError(f"Tenant with id {tenant_id} not found")
+        async with self.unit_of_work:
+            updated_tenant = await self.tenant_repository.update(existing_tenant, expected_version)
+            if not updated_tenant:
+                if expected_version is not None:
+                    raise TenantVersionConflictError(f"Tenant with id {tenant_id} has been modified")
+                raise TenantNotFoundError(f"Tenant with id {tenant_id} not found")
+            if self.tenant_registry:
+                self.unit_of_work.on_commit(partial(self.tenant_registry.invalidate, tenant_id))
+            if self.event_dispatcher:
+                event = TenantUpdatedEvent(
+                    tenant_id=updated_tenant.tenant_id,
+                    name=updated_tenant.name,
+                    domain=updated_tenant.domain,
+                )
+                self.unit_of_work.on_commit(partial(self.event_dispatcher.dispatch_tenant_updated, event))
+            await self.unit_of_work.commit()
         
         return updated_tenant
 
@@ -82,19 +142,31 @@ class ListTenantsUseCase:
         return await self.tenant_repository.list_all_with_cursor(
             cursor=request.cursor,
             limit=request.page_size,
-            direction=request.direction
+            direction=request.direction,
+            include_total=request.include_total,
         )
 
 
 class DeleteTenantUseCase:
   
     
-    def __init__(self, tenant_repository: TenantRepository):
+    def __init__(self, tenant_repository: TenantRepository, unit_of_work: IUnitOfWork, tenant_registry: ITenantRegistry = None, event_dispatcher: IEventDispatcher = None):
         self.tenant_repository = tenant_repository
+        self.unit_of_work = unit_of_work
+        self.tenant_registry = tenant_registry
+        self.event_dispatcher = event_dispatcher
     
     async def execute(self, tenant_id: UUID) -> bool:
         tenant = await self.tenant_repository.get_by_id(tenant_id)
         if not tenant:
             raise TenantNotFoundError(f"Tenant with id {tenant_id} not found")
         
-        return await self.tenant_repository.delete(tenant_id)
+        async with self.unit_of_work:
+            deleted = await self.tenant_repository.delete(tenant_id)
+            if self.tenant_registry:
+                self.unit_of_work.on_commit(partial(self.tenant_registry.invalidate, tenant_id))
+            if self.event_dispatcher:
+                event = TenantDeletedEvent(tenant_id=tenant_id)
+                self.unit_of_work.on_commit(partial(self.event_dispatcher.dispatch_tenant_deleted, event))
+            await self.unit_of_work.commit()
+        return deleted
@@ -1,4 +1,6 @@
-from typing import Optional
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from app.domain.entities.user import User
@@ -6,30 +8,42 @@ from app.domain.events.user_events import (
     UserCreatedEvent,
     UserLoggedInEvent,
     UserUpdatedEvent,
+    UsersBulkCreatedEvent,
 )
 from app.domain.interfaces.user_repository import UserRepository
 from app.domain.interfaces.event_dispatcher import EventDispatcher as IEventDispatcher
 from app.domain.interfaces.refresh_token_repository import RefreshTokenRepository
+from app.domain.interfaces.unit_of_work import IUnitOfWork
 from app.application.exceptions.user_exceptions import (
     InvalidUserDataError,
-    UserAlreadyExistsError,
     UserNotFoundError,
+    UserVersionConflictError,
 )
 from app.application.dtos.user_dtos import (
+    BulkCreateUserError,
+    BulkCreateUsersResponse,
+    CreateUserRequest,
+    CursorPagedUserRequest,
     LoginRequest,
     TokenResponse,
     UpdateUserRequest,
     RefreshTokenRequest,
 )
 from app.domain.interfaces.token_service import ITokenService
+from app.shared.etag import etag_matches, make_etag
+from app.shared.pagination import CursorPagedResult
 
 
 class CreateUserUseCase:
     def __init__(
-        self, user_repository: UserRepository, event_dispatcher: IEventDispatcher
+        self,
+        user_repository: UserRepository,
+        event_dispatcher: IEventDispatcher,
+        unit_of_work: IUnitOfWork,
     ):
         self.user_repository = user_repository
         self.event_dispatcher = event_dispatcher
+        self.unit_of_work = unit_of_work
 
     async def execute(
         self,
@@ -39,16 +53,6 @@ class CreateUserUseCase:
         full_name: Optional[str] = None,
         password: str = None,
     ) -> User:
-        existing_user = await self.user_repository.get_by_email(email)
-        if existing_user:
-            raise UserAlreadyExistsError(f"User with email {email} already exists")
-
-        existing_user = await self.user_repository.get_by_username(username)
-        if existing_user:
-            raise UserAlreadyExistsError(
-                f"User with username {username} already exists"
-            )
-
         user = User(
             email=email,
             username=username,
@@ -57,20 +61,150 @@ class CreateUserUseCase:
             full_name=full_name,
         )
 
-        created_user = await self.user_repository.create(user)
+        async with self.unit_of_work:
+            # Raises UserAlreadyExistsError when the email or username is taken
+            created_user = await self.user_repository.create(user)
 
-        event = UserCreatedEvent(
-            user_id=created_user.id,
-            email=created_user.email,
-            username=created_user.username,
-            tenant_id=created_user.tenant_id,
-            full_name=created_user.full_name,
-        )
-        self.event_dispatcher.dispatch_user_created(event)
+            event = UserCreatedEvent(
+                user_id=created_user.id,
+                email=created_user.email,
+                username=created_user.username,
+                tenant_id=created_user.tenant_id,
+                full_name=created_user.full_name,
+            )
+            self.unit_of_work.on_commit(partial(self.event_dispatcher.dispatch_user_created, event))
+            await self.unit_of_work.commit()
 
         return created_user
 
 
+# (line number, parsed row or the reason it could not be parsed)
+BulkUserRow = Tuple[int, Union[CreateUserRequest, str]]
+
+
+class BulkCreateUsersUseCase:
+    """
+    Create users from a stream of rows, ``batch_size`` at a time: one query
+    to skip rows that already exist, parallel password hashing, one INSERT
+    and one user.bulk_created event per batch. Each batch commits on its own,
+    so re-running an interrupted import only creates what is missing.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        token_service: ITokenService,
+        event_dispatcher: IEventDispatcher,
+        unit_of_work: IUnitOfWork,
+        batch_size: int = 500,
+    ):
+        self.user_repository = user_repository
+        self.token_service = token_service
+        self.event_dispatcher = event_dispatcher
+        self.unit_of_work = unit_of_work
+        self.batch_size = batch_size
+
+    async def execute(
+        self, rows: AsyncIterator[BulkUserRow], tenant_id: Optional[UUID] = None
+    ) -> BulkCreateUsersResponse:
+        result = BulkCreateUsersResponse(received=0, created=0, failed=0)
+        batch: List[Tuple[int, CreateUserRequest]] = []
+
+        async for line, row in rows:
+            result.received += 1
+            if isinstance(row, str):
+                result.errors.append(BulkCreateUserError(line=line, error=row))
+                continue
+            batch.append((line, row))
+            if len(batch) >= self.batch_size:
+                await self._create_batch(batch, tenant_id, result)
+                batch = []
+
+        if batch:
+            await self._create_batch(batch, tenant_id, result)
+
+        result.errors.sort(key=lambda error: error.line)
+        result.failed = len(result.errors)
+        return result
+
+    async def _create_batch(
+        self,
+        batch: List[Tuple[int, CreateUserRequest]],
+        tenant_id: Optional[UUID],
+        result: BulkCreateUsersResponse,
+    ) -> None:
+        async with self.unit_of_work:
+            await self._insert_batch(batch, tenant_id, result)
+            await self.unit_of_work.commit()
+
+    async def _insert_batch(
+        self,
+        batch: List[Tuple[int, CreateUserRequest]],
+        tenant_id: Optional[UUID],
+        result: BulkCreateUsersResponse,
+    ) -> None:
+        existing_emails, existing_usernames = (
+            await self.user_repository.find_existing_emails_and_usernames(
+                [row.email for _, row in batch], [row.username for _, row in batch]
+            )
+        )
+
+        # Drop conflicts before hashing, argon2 is the expensive part
+        pending: List[Tuple[int, CreateUserRequest]] = []
+        for line, row in batch:
+            if row.email in existing_emails:
+                error = f"User with email {row.email} already exists"
+            elif row.username in existing_usernames:
+                error = f"User with username {row.username} already exists"
+            else:
+                existing_emails.add(row.email)
+                existing_usernames.add(row.username)
+                pending.append((line, row))
+                continue
+            result.errors.append(BulkCreateUserError(line=line, error=error, email=row.email))
+
+        if not pending:
+            return
+
+        hashed_passwords = await self.token_service.get_password_hashes(
+            [row.password for _, row in pending]
+        )
+        users = [
+            User(
+                email=row.email,
+                username=row.username,
+                password=hashed_password,
+                tenant_id=tenant_id,
+                full_name=row.full_name,
+            )
+            for (_, row), hashed_password in zip(pending, hashed_passwords)
+        ]
+
+        created_users = await self.user_repository.create_many(users)
+        created_ids = {user.id for user in created_users}
+        for (line, row), user in zip(pending, users):
+            if user.id not in created_ids:
+                # Inserted concurrently by someone else since the existence check
+                result.errors.append(BulkCreateUserError(
+                    line=line, error="User with this email or username already exists", email=row.email
+                ))
+        result.created += len(created_users)
+
+        if created_users:
+            self.unit_of_work.on_commit(partial(self.event_dispatcher.dispatch_users_bulk_created, UsersBulkCreatedEvent(
+                tenant_id=tenant_id,
+                users=[
+                    {
+                        "user_id": user.id,
+                        "email": user.email,
+                        "username": user.username,
+                        "full_name": user.full_name,
+                    }
+                    for user in created_users
+                ],
+            )))
+
+
 class GetUserUseCase:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
@@ -81,35 +215,71 @@ class GetUserUseCase:
             raise UserNotFoundError(f"User with id {user_id} not found")
         return user
 
+    async def get_version(self, user_id: UUID) -> Optional[datetime]:
+        """For If-None-Match: the version alone, the row is not loaded."""
+        return await self.user_repository.get_version(user_id)
+
+
+class ListUsersUseCase:
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(self, request: CursorPagedUserRequest) -> CursorPagedResult[Any]:
+        return await self.user_repository.list_all(
+            cursor=request.cursor,
+            limit=request.page_size,
+            direction=request.direction,
+            include_total=request.include_total,
+            permission=request.permission,
+        )
+
 
 class UpdateUserUseCase:
     def __init__(
-        self, user_repository: UserRepository, event_dispatcher: IEventDispatcher
+        self,
+        user_repository: UserRepository,
+        event_dispatcher: IEventDispatcher,
+        unit_of_work: IUnitOfWork,
     ):
         self.user_repository = user_repository
         self.event_dispatcher = event_dispatcher
+        self.unit_of_work = unit_of_work
 
-    async def execute(self, user_id: UUID, request: UpdateUserRequest) -> User:
+    async def execute(
+        self, user_id: UUID, request: UpdateUserRequest, if_match: Optional[str] = None
+    ) -> User:
         user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise UserNotFoundError(f"User with id {user_id} not found")
+
+        # If-Match: the client's copy must be the current one, and stay so
+        # until the UPDATE, which repeats the check in its WHERE clause
+        expected_version = None
+        if if_match is not None:
+            if not etag_matches(if_match, make_etag(user.id, user.version), weak=False):
+                raise UserVersionConflictError(f"User with id {user_id} has been modified")
+            expected_version = user.version
+
         user.update_profile(
             email=request.email, username=request.username, full_name=request.full_name
         )
-        updated_user = await self.user_repository.update(user)
-        if not updated_user:
-            raise UserNotFoundError(f"User with id {user_id} not found")
-
-        event = UserUpdatedEvent(
-            user_id=updated_user.id,
-            tenant_id=updated_user.tenant_id,
-            email=updated_user.email,
-            username=updated_user.username,
-            full_name=updated_user.full_name,
-            is_active=updated_user.is_active,
-        )
-
-        self.event_dispatcher.dispatch_user_updated(event)
+        async with self.unit_of_work:
+            updated_user = await self.user_repository.update(user, expected_version)
+            if not updated_user:
+                if expected_version is not None:
+                    raise UserVersionConflictError(f"User with id {user_id} has been modified")
+                raise UserNotFoundError(f"User with id {user_id} not found")
+
+            event = UserUpdatedEvent(
+                user_id=updated_user.id,
+                tenant_id=updated_user.tenant_id,
+                email=updated_user.email,
+                username=updated_user.username,
+                full_name=updated_user.full_name,
+                is_active=updated_user.is_active,
+            )
+            self.unit_of_work.on_commit(partial(self.event_dispatcher.dispatch_user_updated, event))
+            await self.unit_of_work.commit()
 
         return updated_user
 
@@ -121,11 +291,13 @@ class LoginUseCase:
         token_service: ITokenService,
         event_dispatcher: IEventDispatcher,
         refresh_token_repository: RefreshTokenRepository,
+        unit_of_work: IUnitOfWork,
     ):
         self.user_repository = user_repository
         self.token_service = token_service
         self.event_dispatcher = event_dispatcher
         self.refresh_token_repository = refresh_token_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(self, request: LoginRequest) -> TokenResponse:
         user = await self.user_repository.get_by_email(request.email)
@@ -133,17 +305,13 @@ class LoginUseCase:
             raise UserNotFoundError("User not found")
         if not user.password:
             raise InvalidUserDataError("User has no password set")
-        if not self.token_service.verify_password(request.password, user.password):
+        if not await self.token_service.verify_password(request.password, user.password):
             raise InvalidUserDataError("Invalid password")
 
         # Generate tokens
         access_token = self.token_service.generate_token(user)
         refresh_token = self.token_service.generate_refresh_token(user)
 
-        # Store refresh token in database
-        expires_at = self.token_service.get_refresh_token_expires_at()
-        await self.refresh_token_repository.create(user.id, refresh_token, expires_at)
-
         event = UserLoggedInEvent(
             user_id=user.id,
             email=user.email,
@@ -153,7 +321,12 @@ class LoginUseCase:
             refresh_token=refresh_token,
         )
 
-        self.event_dispatcher.dispatch_user_logged_in(event)
+        # Store refresh token in database
+        async with self.unit_of_work:
+            expires_at = self.token_service.get_refresh_token_expires_at()
+            await self.refresh_token_repository.create(user.id, refresh_token, expires_at)
+            self.unit_of_work.on_commit(partial(self.event_dispatcher.dispatch_user_logged_in, event))
+            await self.unit_of_work.commit()
 
         return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
@@ -164,17 +337,14 @@ class RefreshTokenUseCase:
         user_repository: UserRepository,
         token_service: ITokenService,
         refresh_token_repository: RefreshTokenRepository,
+        unit_of_work: IUnitOfWork,
     ):
         self.user_repository = user_repository
         self.token_service = token_service
         self.refresh_token_repository = refresh_token_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(self, request: RefreshTokenRequest) -> TokenResponse:
-        if not await self.refresh_token_repository.is_token_valid(
-            request.refresh_token
-        ):
-            raise InvalidUserDataError("Invalid or expired refresh token")
-
         try:
             payload = self.token_service.decode_token(request.refresh_token)
         except ValueError as e:
@@ -188,14 +358,17 @@ class RefreshTokenUseCase:
         if not user:
             raise UserNotFoundError("User not found")
 
-        await self.refresh_token_repository.revoke_token(request.refresh_token)
-
         access_token = self.token_service.generate_token(user)
         new_refresh_token = self.token_service.generate_refresh_token(user)
 
-        expires_at = self.token_service.get_refresh_token_expires_at()
-        await self.refresh_token_repository.create(
-            user.id, new_refresh_token, expires_at
-        )
+        # Revokes the presented token and stores the new one atomically; fails
+        # if the token is unknown, expired or was already exchanged.
+        async with self.unit_of_work:
+            expires_at = self.token_service.get_refresh_token_expires_at()
+            if not await self.refresh_token_repository.rotate(
+                request.refresh_token, user.id, new_refresh_token, expires_at
+            ):
+                raise InvalidUserDataError("Invalid or expired refresh token")
+            await self.unit_of_work.commit()
 
         return TokenResponse(access_token=access_token, refresh_token=new_refresh_token)
@@ -0,0 +1,36 @@
+from typing import Any, FrozenSet
+
+_UNSET = object()
+
+
+class ChangeTracking:
+    """
+    Records which persisted attributes were assigned a different value since
+    the entity was built, so repositories write only those. After saving they
+    return a newly built entity, which starts with no changes.
+
+    Assignments made in ``__init__`` are not changes. Mutating a value in
+    place (e.g. appending to a list) is not seen, assign a new value instead.
+    """
+
+    __slots__ = ("_changed_fields",)
+
+    _tracked_fields: FrozenSet[str] = frozenset()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._tracked_fields:
+            current = getattr(self, name, _UNSET)
+            if current is not _UNSET and current != value:
+                try:
+                    self._changed_fields.add(name)
+                except AttributeError:
+                    object.__setattr__(self, "_changed_fields", {name})
+        object.__setattr__(self, name, value)
+
+    @property
+    def changed_fields(self) -> FrozenSet[str]:
+        return frozenset(getattr(self, "_changed_fields", ()))
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(getattr(self, "_changed_fields", None))
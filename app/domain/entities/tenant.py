@@ -1,34 +1,59 @@
 
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-class Tenant:
+from app.domain.entities.change_tracking import ChangeTracking
+
+
+class TenantStatus(str, Enum):
+    PROVISIONING = "provisioning"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class Tenant(ChangeTracking):
+    __slots__ = ("tenant_id", "name", "domain", "is_active", "status", "created_at", "updated_at")
+    _tracked_fields = frozenset({"name", "domain", "is_active", "status", "updated_at"})
     
     def __init__(self, name: str, domain: str, is_active: bool = True, 
                  tenant_id: UUID = None, created_at: datetime = None, 
-                 updated_at: datetime = None):
+                 updated_at: datetime = None, status: str = TenantStatus.READY):
         self.tenant_id = tenant_id or uuid4()
         self.name = name
         self.domain = domain
         self.is_active = is_active
+        self.status = TenantStatus(status)
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
     
     def activate(self) -> None:
-        self.is_active = True
-        self.updated_at = datetime.now(timezone.utc)
+        if not self.is_active:
+            self.is_active = True
+            self.updated_at = datetime.now(timezone.utc)
     
     def deactivate(self) -> None:
-        self.is_active = False
-        self.updated_at = datetime.now(timezone.utc)
+        if self.is_active:
+            self.is_active = False
+            self.updated_at = datetime.now(timezone.utc)
+    
+    @property
+    def version(self) -> datetime:
+        """Moves on every change, the ETag and If-Match precondition derive from it."""
+        return self.updated_at or self.created_at
+    
+    @property
+    def is_ready(self) -> bool:
+        return self.status == TenantStatus.READY
     
     def update_info(self, name: Optional[str] = None, domain: Optional[str] = None) -> None:
         if name is not None:
             self.name = name
         if domain is not None:
             self.domain = domain
-        self.updated_at = datetime.now(timezone.utc)
+        if self.has_changes:
+            self.updated_at = datetime.now(timezone.utc)
     
     def __repr__(self) -> str:
         return f"Tenant(id={self.tenant_id}, name={self.name}, domain={self.domain})"
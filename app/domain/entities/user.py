@@ -2,8 +2,19 @@ from datetime import datetime, timezone
 from typing import Optional, List
 from uuid import UUID, uuid4
 
+from app.domain.entities.change_tracking import ChangeTracking
+
+
+class User(ChangeTracking):
+    __slots__ = (
+        "id", "email", "username", "tenant_id", "password", "full_name",
+        "is_active", "role", "permissions", "created_at", "updated_at",
+    )
+    _tracked_fields = frozenset({
+        "email", "username", "tenant_id", "password", "full_name",
+        "is_active", "role", "permissions", "updated_at",
+    })
 
-class User:
     def __init__(
         self,
         email: str,
@@ -30,13 +41,20 @@ class User:
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
 
+    @property
+    def version(self) -> datetime:
+        """Moves on every change, the ETag and If-Match precondition derive from it."""
+        return self.updated_at or self.created_at
+
     def activate(self) -> None:
-        self.is_active = True
-        self.updated_at = datetime.now(timezone.utc)
+        if not self.is_active:
+            self.is_active = True
+            self.updated_at = datetime.now(timezone.utc)
 
     def deactivate(self) -> None:
-        self.is_active = False
-        self.updated_at = datetime.now(timezone.utc)
+        if self.is_active:
+            self.is_active = False
+            self.updated_at = datetime.now(timezone.utc)
 
     def update_profile(
         self,
@@ -50,7 +68,8 @@ class User:
             self.username = username
         if full_name is not None:
             self.full_name = full_name
-        self.updated_at = datetime.now(timezone.utc)
+        if self.has_changes:
+            self.updated_at = datetime.now(timezone.utc)
 
     def __repr__(self) -> str:
         return f"User(id={self.id}, email={self.email}, tenant_id={self.tenant_id})"
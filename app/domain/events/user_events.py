@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from app.shared.events import DomainEvent
 
@@ -15,6 +15,17 @@ class UserCreatedEvent(DomainEvent):
         self.full_name = full_name
         self.event_type = "user.created"
 
+class UsersBulkCreatedEvent(DomainEvent):
+    """One event per inserted batch of a bulk import instead of one user.created per user."""
+    __event_name__ = "user.bulk_created"
+    
+    def __init__(self, tenant_id: Optional[UUID], users: List[Dict[str, Any]], **kwargs):
+        super().__init__(**kwargs)
+        self.tenant_id = tenant_id
+        # user_id, email, username and full_name of each created user
+        self.users = users
+        self.event_type = "user.bulk_created"
+
 class UserUpdatedEvent(DomainEvent):
     __event_name__ = "user.updated"
     
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 
 
-from app.domain.events.user_events import UserCreatedEvent, UserUpdatedEvent
+from app.domain.events.user_events import UserCreatedEvent, UserUpdatedEvent, UsersBulkCreatedEvent
 from app.domain.events.tenant_events import TenantCreatedEvent, TenantUpdatedEvent, TenantDeletedEvent
 from app.domain.events.user_events import UserLoggedInEvent
 
@@ -12,6 +12,10 @@ class EventDispatcher(ABC):
     def dispatch_user_created(self, UserCreatedEvent: UserCreatedEvent) -> None:
         pass
     
+    @abstractmethod
+    def dispatch_users_bulk_created(self, UsersBulkCreatedEvent: UsersBulkCreatedEvent) -> None:
+        pass
+    
     @abstractmethod
     def dispatch_user_updated(self, UserUpdatedEvent: UserUpdatedEvent) -> None:
         pass
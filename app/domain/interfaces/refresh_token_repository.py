@@ -22,6 +22,12 @@ class RefreshTokenRepository(ABC):
     async def revoke_all_user_tokens(self, user_id: UUID) -> bool:
         pass
     
+    @abstractmethod
+    async def rotate(self, token: str, user_id: UUID, new_token: str, expires_at: datetime) -> bool:
+        """Atomically revoke a valid, unexpired ``token`` of ``user_id`` and store
+        ``new_token``. False (and nothing stored) if ``token`` was not valid."""
+        pass
+    
     @abstractmethod
     async def is_token_valid(self, token: str) -> bool:
         pass
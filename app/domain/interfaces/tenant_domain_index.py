@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+
+class ITenantDomainIndex(ABC):
+    """In-process lookup of request host -> tenant_id, by the tenants' ``domain``."""
+
+    @abstractmethod
+    def resolve(self, host: str) -> Optional[UUID]:
+        """The tenant serving ``host`` (a Host header value, port allowed), or None."""
+        pass
+
+    @abstractmethod
+    def set(self, tenant_id: UUID, domain: str) -> None:
+        """Route ``domain`` to the tenant, replacing the tenant's previous domain."""
+        pass
+
+    @abstractmethod
+    def remove(self, tenant_id: UUID) -> None:
+        pass
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class ITenantProvisioner(ABC):
+    
+    @abstractmethod
+    def schedule(self, tenant_id: UUID) -> None:
+        """Start creating the tenant's schema in the background."""
+        pass
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from app.domain.entities.tenant import TenantStatus
+
+
+@dataclass(frozen=True)
+class TenantRegistryEntry:
+    tenant_id: UUID
+    schema: str
+    is_active: bool
+    status: TenantStatus = TenantStatus.READY
+
+    @property
+    def is_ready(self) -> bool:
+        return self.status == TenantStatus.READY
+
+
+class ITenantRegistry(ABC):
+    """In-process lookup of tenant_id -> (schema, is_active, status)."""
+
+    @abstractmethod
+    def get(self, tenant_id: UUID) -> Optional[TenantRegistryEntry]:
+        """Return the cached entry or None on a miss/expired entry."""
+        pass
+
+    @abstractmethod
+    def put(
+        self, tenant_id: UUID, is_active: bool, status: TenantStatus = TenantStatus.READY
+    ) -> TenantRegistryEntry:
+        """Store (or refresh) the entry for a tenant."""
+        pass
+
+    @abstractmethod
+    def invalidate(self, tenant_id: UUID) -> None:
+        """Drop the entry for a tenant so the next lookup goes to the database."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional, Any
 from uuid import UUID
 from app.domain.entities.tenant import Tenant
@@ -18,7 +19,14 @@ class TenantRepository(ABC):
         pass
     
     @abstractmethod
-    async def update(self, tenant: Tenant) -> Optional[Tenant]:
+    async def get_version(self, tenant_id: UUID) -> Optional[datetime]:
+        """The tenant's ``version`` without loading the row, None if it does not exist."""
+        pass
+    
+    @abstractmethod
+    async def update(self, tenant: Tenant, expected_version: Optional[datetime] = None) -> Optional[Tenant]:
+        """Write the changed fields; None when the tenant does not exist or, with
+        ``expected_version``, was changed by someone else since it was read."""
         pass
     
     @abstractmethod
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 from app.domain.entities.user import User
 
 
@@ -21,9 +22,21 @@ class ITokenService(ABC):
         raise NotImplementedError
     
     @abstractmethod
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Check a password off the event loop, ahead of queued hashing."""
         raise NotImplementedError
     
     @abstractmethod
     def get_password_hash(self, password: str) -> str:
+        """Hash on the calling thread; request handlers use ``hash_password``."""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def hash_password(self, password: str) -> str:
+        """Hash a password off the event loop."""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_password_hashes(self, passwords: List[str]) -> List[str]:
+        """Hash many passwords in parallel without blocking the event loop."""
         raise NotImplementedError
\ No newline at end of file
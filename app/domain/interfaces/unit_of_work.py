@@ -1,15 +1,38 @@
 from abc import ABC, abstractmethod
-from ast import List
-from typing import Any 
+from typing import Callable
+
 
 class IUnitOfWork(ABC):
+    """
+    The transaction of one use case. Repositories sharing it only write
+    (flush); the use case commits once at the end, and anything that must
+    not happen for a rolled back transaction (domain events, background
+    jobs) is registered with ``on_commit``.
+
+        async with self.unit_of_work:
+            ...
+            await self.unit_of_work.commit()
+
+    Leaving the block with an exception rolls back.
+    """
+    
+    async def __aenter__(self) -> "IUnitOfWork":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None:
+            await self.rollback()
     
     @abstractmethod
     async def commit(self) -> None:
+        """Commit, then run the ``on_commit`` callbacks in registration order."""
         pass
     
     @abstractmethod
     async def rollback(self) -> None:
+        """Roll back and drop the pending ``on_commit`` callbacks."""
         pass
     
-    repositories: List[Any]
\ No newline at end of file
+    @abstractmethod
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        pass
@@ -1,14 +1,29 @@
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Set, Tuple
 from uuid import UUID
 from app.domain.entities.user import User
+from app.shared.pagination import CursorPagedResult, PaginationDirection, TotalCountMode
 
 
 class UserRepository(ABC):
     
     @abstractmethod
     async def create(self, user: User) -> User:
+        """Insert a user, raising UserAlreadyExistsError if the email or username is taken."""
+        pass
+    
+    @abstractmethod
+    async def create_many(self, users: List[User]) -> List[User]:
+        """Insert users in one statement, skipping rows that hit a unique email/username.
+        Returns the users that were inserted."""
+        pass
+    
+    @abstractmethod
+    async def find_existing_emails_and_usernames(
+        self, emails: List[str], usernames: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
         pass
     
     @abstractmethod
@@ -24,7 +39,14 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    async def update(self, user: User) -> Optional[User]:
+    async def get_version(self, user_id: UUID) -> Optional[datetime]:
+        """The user's ``version`` without loading the row, None if it does not exist."""
+        pass
+    
+    @abstractmethod
+    async def update(self, user: User, expected_version: Optional[datetime] = None) -> Optional[User]:
+        """Write the changed fields; None when the user does not exist or, with
+        ``expected_version``, was changed by someone else since it was read."""
         pass
     
     @abstractmethod
@@ -32,6 +54,17 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_all(self, cursor: str = None, limit: int = 100) -> List[Optional[User]]:
+    async def list_all(
+        self,
+        cursor: str = None,
+        limit: int = 100,
+        direction: PaginationDirection = PaginationDirection.FORWARD,
+        include_total: TotalCountMode = TotalCountMode.NONE,
+        permission: Optional[str] = None,
+    ) -> CursorPagedResult[Any]:
+        """
+        Page of users ordered by (created_at, id), continuing after ``cursor``,
+        optionally only those holding ``permission``.
+        """
         pass
 
@@ -0,0 +1,127 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+
+class PasswordHashPriority(IntEnum):
+    """Lower runs first: a login burst is served ahead of queued signups."""
+
+    LOGIN = 0
+    SIGNUP = 1
+    BULK_IMPORT = 2
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    sequence: int
+    function: Callable = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    queued_at: float = field(compare=False)
+
+
+class _PriorityStats:
+    __slots__ = ("completed", "wait_seconds", "max_wait_seconds", "run_seconds", "recent_waits")
+
+    def __init__(self):
+        self.completed = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.run_seconds = 0.0
+        self.recent_waits: Deque[float] = deque(maxlen=1024)
+
+    def record(self, wait: float, run: float) -> None:
+        self.completed += 1
+        self.wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.run_seconds += run
+        self.recent_waits.append(wait)
+
+    def as_dict(self, queued: int) -> Dict[str, Any]:
+        completed = self.completed or 1
+        recent = sorted(self.recent_waits)
+        return {
+            "queued": queued,
+            "completed": self.completed,
+            "avg_wait_ms": self.wait_seconds / completed * 1000,
+            "p95_wait_ms": recent[int(len(recent) * 0.95)] * 1000 if recent else 0.0,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+            "avg_run_ms": self.run_seconds / completed * 1000,
+        }
+
+
+class PasswordHashExecutor:
+    """
+    Runs argon2 on ``max_workers`` threads (argon2 releases the GIL, so they
+    hash in parallel) instead of on the event loop.
+
+    At most ``max_workers`` calls are handed to the threads at a time; the
+    rest wait in a priority queue owned by the event loop, so when the pool
+    is saturated a login queued after a batch of signups still runs next.
+    A caller that goes away (cancelled request) loses its queue slot without
+    costing a hash.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._queue: List[_Job] = []
+        self._sequence = itertools.count()
+        self._running = 0
+        self._stats = {priority: _PriorityStats() for priority in PasswordHashPriority}
+
+    async def run(self, priority: PasswordHashPriority, function: Callable, *args: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._queue,
+            _Job(priority, next(self._sequence), function, args, future, time.perf_counter()),
+        )
+        self._dispatch()
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        queued = {priority: 0 for priority in PasswordHashPriority}
+        for job in self._queue:
+            if not job.future.cancelled():
+                queued[PasswordHashPriority(job.priority)] += 1
+        return {
+            "workers": self.max_workers,
+            "running": self._running,
+            "queued": sum(queued.values()),
+            "by_priority": {
+                priority.name.lower(): self._stats[priority].as_dict(queued[priority])
+                for priority in PasswordHashPriority
+            },
+        }
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_workers and self._queue:
+            job = heapq.heappop(self._queue)
+            if job.future.cancelled():
+                continue
+            self._running += 1
+            started_at = time.perf_counter()
+            task = job.future.get_loop().run_in_executor(self._executor, job.function, *job.args)
+            task.add_done_callback(partial(self._finished, job, started_at))
+
+    def _finished(self, job: _Job, started_at: float, task: asyncio.Future) -> None:
+        self._running -= 1
+        self._stats[PasswordHashPriority(job.priority)].record(
+            started_at - job.queued_at, time.perf_counter() - started_at
+        )
+        if not job.future.done():
+            if task.cancelled():
+                job.future.cancel()
+            elif task.exception() is not None:
+                job.future.set_exception(task.exception())
+            else:
+                job.future.set_result(task.result())
+        self._dispatch()
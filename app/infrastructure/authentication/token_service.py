@@ -2,9 +2,13 @@ from app.domain.interfaces.token_service import ITokenService
 from app.shared.config import Settings
 from pwdlib import PasswordHash
 import jwt
+import asyncio
+import os
 import time
+from typing import Any, Dict, List
 from datetime import datetime, timezone, timedelta
 from app.domain.entities.user import User
+from app.infrastructure.authentication.password_hashing import PasswordHashExecutor, PasswordHashPriority
 
 class TokenService(ITokenService):
     
@@ -12,6 +16,9 @@ class TokenService(ITokenService):
         self.settings = settings
         self.algorithm = settings.encryption_algorithm
         self._password_hasher = None
+        self.hash_executor = PasswordHashExecutor(
+            max_workers=settings.password_hash_workers or os.cpu_count() or 1,
+        )
     
     @property
     def password_hasher(self):
@@ -26,11 +33,26 @@ class TokenService(ITokenService):
                 ) from e
         return self._password_hasher
         
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.password_hasher.verify(plain_password, hashed_password)
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.hash_executor.run(
+            PasswordHashPriority.LOGIN, self.password_hasher.verify, plain_password, hashed_password
+        )
    
     def get_password_hash(self, password: str) -> str:
         return self.password_hasher.hash(password)
+    
+    async def hash_password(self, password: str) -> str:
+        return await self.hash_executor.run(PasswordHashPriority.SIGNUP, self.password_hasher.hash, password)
+    
+    async def get_password_hashes(self, passwords: List[str]) -> List[str]:
+        password_hasher = self.password_hasher
+        return await asyncio.gather(*(
+            self.hash_executor.run(PasswordHashPriority.BULK_IMPORT, password_hasher.hash, password)
+            for password in passwords
+        ))
+    
+    def password_hashing_stats(self) -> Dict[str, Any]:
+        return self.hash_executor.stats()
        
     def generate_token(self, user: User) -> str:
     
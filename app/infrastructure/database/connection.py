@@ -1,17 +1,63 @@
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional, Sequence
+from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlmodel import SQLModel
 
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from app.infrastructure.database.query_counter import count_query
 from app.shared.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True,
+# Schema rendered into tenant statements by the "search_path" strategy. It is
+# stripped right before execution, leaving table names unqualified.
+SEARCH_PATH_SCHEMA_TOKEN = "$search_path"
+_SEARCH_PATH_SCHEMA_PREFIX = f'"{SEARCH_PATH_SCHEMA_TOKEN}".'
+
+
+# Per-request statement counts (X-Query-Count), on every engine in the process
+event.listen(Engine, "before_cursor_execute", count_query)
+
+
+def _strip_search_path_schema(conn, cursor, statement, parameters, context, executemany):
+    if _SEARCH_PATH_SCHEMA_PREFIX in statement:
+        statement = statement.replace(_SEARCH_PATH_SCHEMA_PREFIX, "")
+    return statement, parameters
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    connect_args = {}
+    if url.startswith("postgresql+asyncpg"):
+        connect_args["prepared_statement_cache_size"] = settings.database_statement_cache_size
+    async_engine = create_async_engine(
+        url,
+        echo=settings.database_echo,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        query_cache_size=settings.database_query_cache_size,
+        connect_args=connect_args,
+    )
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _strip_search_path_schema, retval=True)
+    return async_engine
+
+
+engine = _create_engine(settings.database_url)
+
+# Read-only traffic goes to the replica when one is configured, otherwise
+# replica_engine is just the primary engine.
+replica_engine = (
+    _create_engine(settings.database_replica_url)
+    if settings.database_replica_url
+    else engine
 )
 
 async_session_factory = async_sessionmaker(
@@ -20,6 +66,20 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+replica_session_factory = async_sessionmaker(
+    replica_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+def has_read_replica() -> bool:
+    return replica_engine is not engine
+
+
+def get_tenant_schema_name(tenant_id: UUID) -> str:
+    return f"tenant_{tenant_id.hex[:16]}"
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
@@ -29,27 +89,126 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def get_tenant_db_session(
-    tenant_schema: str
-) -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_factory() as session:
+async def get_replica_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with replica_session_factory() as session:
         try:
-            # Apply schema translation at the connection level
-            await session.connection(
-                execution_options={
-                    "schema_translate_map": {"public": tenant_schema},
-                }
-            )
             yield session
         finally:
             await session.close()
 
 
+async def get_tenant_db_session(
+    tenant_schema: str,
+    session_factory: Optional[async_sessionmaker] = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    bind = (session_factory or async_session_factory).kw["bind"]
+    async with bind.connect() as connection:
+        await bind_tenant_schema(connection, tenant_schema)
+        async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+            yield session
+
+
+def get_tenant_schema_translate_map(tenant_schema: str) -> Dict[str, Optional[str]]:
+    """
+    schema_translate_map for a tenant connection, see ``tenant_schema_strategy``.
+
+    "translate_map" renders the tenant schema into every statement, so each
+    tenant gets its own SQL string and therefore its own asyncpg prepared
+    statement on every pooled connection. "search_path" renders unqualified
+    table names that the pinned search_path resolves, so all tenants share
+    one SQL string and one prepared statement per connection (PostgreSQL
+    re-plans it when the search_path changes).
+
+    Either way SQLAlchemy compiles a statement once: the schema is
+    substituted into the cached compiled form at execution time.
+    """
+    if settings.tenant_schema_strategy == "search_path":
+        return {"public": SEARCH_PATH_SCHEMA_TOKEN}
+    return {"public": tenant_schema}
+
+
+async def pin_search_path(connection: AsyncConnection, schema: str) -> None:
+    """
+    Point the pooled connection's search_path at ``schema``.
+
+    The schema a DBAPI connection last served is kept in ``connection.info``,
+    which follows the connection back into the pool, so consecutive requests
+    for the same tenant skip the SET round trip.
+    """
+    if connection.info.get("search_path", "public") == schema:
+        return
+    # set_config with a bound value is one prepared statement for all tenants,
+    # where SET would be a new statement text per schema. The tenant schema
+    # alone: with public after it, a table missing from the tenant schema
+    # would silently resolve to the shared public one.
+    search_path = "public" if schema == "public" else f'"{schema}"'
+    await connection.execute(
+        text("SELECT set_config('search_path', :search_path, false)"),
+        {"search_path": search_path},
+    )
+    connection.info["search_path"] = schema
+
+
+async def bind_tenant_schema(connection: AsyncConnection, tenant_schema: str) -> AsyncConnection:
+    """Switch an already checked-out connection to a tenant schema."""
+    await pin_search_path(connection, tenant_schema)
+    # SET is transactional: commit it (and any lookup done on this connection)
+    # so the session bound afterwards owns its own transaction.
+    await connection.commit()
+    return await connection.execution_options(
+        schema_translate_map=get_tenant_schema_translate_map(tenant_schema),
+        tenant_schema=tenant_schema,
+    )
+
+
+def get_bound_schema(connection: AsyncConnection) -> str:
+    """
+    Schema the statements of ``connection`` run against: the tenant schema it
+    was bound to by bind_tenant_schema, else public.
+
+    Unlike ``connection.info["search_path"]`` this belongs to the current
+    checkout, not to the pooled DBAPI connection, whose search_path is left
+    pinned to the last tenant while public sessions use it.
+    """
+    return connection.sync_connection.get_execution_options().get("tenant_schema", "public")
+
+
+def get_pool_statistics() -> Dict[str, Any]:
+    """Checked-out/idle/overflow counts and checkout wait times of the engine pools."""
+    return {
+        "primary": engine.pool.statistics(),
+        "replica": replica_engine.pool.statistics() if has_read_replica() else None,
+    }
+
+
 async def create_db_and_tables():
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def check_schema_version(supported_revisions: Sequence[Optional[str]]) -> str:
+    """
+    Verify the public schema is at one of ``supported_revisions`` with a
+    single query, instead of the catalog introspection create_all does on
+    every boot.
+    """
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT version_num FROM public.alembic_version"))
+            current_revision = result.scalar_one_or_none()
+    except Exception as e:
+        raise RuntimeError(f"Could not read the schema version, run 'alembic upgrade head': {e}")
+
+    if current_revision not in supported_revisions:
+        raise RuntimeError(
+            f"Database schema is at revision {current_revision}, expected one of "
+            f"{', '.join(map(str, supported_revisions))}; run 'alembic upgrade head'"
+        )
+    return current_revision
+
+
 async def close_db_connections():
     await engine.dispose()
+    if has_read_replica():
+        await replica_engine.dispose()
 
@@ -1,15 +1,27 @@
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from fastapi import Request, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from uuid import UUID
 
+from app.domain.entities.tenant import TenantStatus
+from app.domain.interfaces.tenant_registry import TenantRegistryEntry
 from app.infrastructure.database.connection import (
+    async_session_factory,
+    bind_tenant_schema,
+    engine,
     get_db_session,
-    get_tenant_db_session
+    get_replica_db_session,
+    get_tenant_db_session,
+    replica_engine,
+    replica_session_factory,
 )
-from app.infrastructure.database.repositories.tenant_repository import TenantRepository
+from app.infrastructure.database.read_routing import requires_primary
+from app.infrastructure.database.tenant_registry import TenantRegistry
 from app.ioc.container import Container
+from app.shared.config import get_settings
+
+settings = get_settings()
 
 # Lazy container initialization to avoid import-time errors
 _container = None
@@ -21,15 +33,51 @@ def _get_container():
     return _container
 
 
+def get_request_tenant_id(request: Request) -> Optional[str]:
+    """The X-Tenant-ID header, else the tenant the Host header was routed to."""
+    return request.headers.get("X-Tenant-ID") or getattr(request.state, "tenant_id", None)
+
+
 async def get_tenant_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async for session in _get_tenant_session(request, engine, async_session_factory):
+        yield session
+
+
+async def get_tenant_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Tenant session for read-only routes, served by the replica when possible."""
+    if requires_primary(request):
+        async for session in _get_tenant_session(request, engine, async_session_factory):
+            yield session
+        return
+    
+    async for session in _get_tenant_session(request, replica_engine, replica_session_factory):
+        yield session
+
+
+async def get_read_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Public-schema session for read-only routes."""
+    if requires_primary(request):
+        async for session in get_db_session():
+            yield session
+        return
+    
+    async for session in get_replica_db_session():
+        yield session
+
+
+async def _get_tenant_session(
+    request: Request,
+    bind: AsyncEngine,
+    session_factory: async_sessionmaker,
+) -> AsyncGenerator[AsyncSession, None]:
     
     try:
       
-        x_tenant_id = request.headers.get("X-Tenant-ID")
+        x_tenant_id = get_request_tenant_id(request)
         
         # Allow optional tenant_id - if not provided, use public schema
         if not x_tenant_id:
-            async for session in get_db_session():
+            async with session_factory() as session:
                 yield session
             return
     except Exception as e:
@@ -43,39 +91,84 @@ async def get_tenant_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
             detail="Invalid tenant ID format"
         )
     
-    async for public_session in get_db_session():
+    tenant_registry = _get_container().tenant_registry()
+    entry = tenant_registry.get(tenant_uuid)
+    
+    if settings.tenant_session_mode == "single_connection":
+        async for session in _get_tenant_session_on_single_connection(
+            bind, tenant_uuid, entry, tenant_registry
+        ):
+            yield session
+        return
+    
+    if entry is None:
+        # Registry miss: resolve from public.tenants on a short-lived session
+        # that is released before the tenant session is opened. Always on the
+        # primary, a lagging replica would cache a stale is_active/status.
         try:
-            container = _get_container()
-            pagination_helper = container.cursor_pagination_helper()
-            tenant_repo = TenantRepository(public_session, pagination_helper)
-            tenant = await tenant_repo.get_by_id(tenant_uuid)
-            
-            if not tenant or not tenant.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Tenant not found or inactive"
-                )
-            
-            tenant_schema = f"tenant_{tenant.tenant_id.hex[:16]}"
-            
-            async for session in get_tenant_session_with_translation(tenant_schema):
-                yield session
-                
-        except HTTPException:
-            raise
+            async with async_session_factory() as public_session:
+                entry = await tenant_registry.load(public_session, tenant_uuid)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Database error: {str(e)}"
             )
-        finally:
-            await public_session.close()
+    
+    _ensure_tenant_is_available(entry)
+    
+    try:
+        async for session in get_tenant_db_session(entry.schema, session_factory):
+            yield session
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
 
 
-async def get_tenant_session_with_translation(
-    tenant_schema: str
+async def _get_tenant_session_on_single_connection(
+    bind: AsyncEngine,
+    tenant_uuid: UUID,
+    entry: Optional[TenantRegistryEntry],
+    tenant_registry: TenantRegistry,
 ) -> AsyncGenerator[AsyncSession, None]:
+    """Run the tenant lookup and the tenant-scoped work on one pooled connection."""
+    try:
+        async with bind.connect() as connection:
+            if entry is None:
+                entry = await tenant_registry.load(
+                    connection, tenant_uuid, from_replica=bind is not engine
+                )
+            _ensure_tenant_is_available(entry)
+            
+            await bind_tenant_schema(connection, entry.schema)
+            async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+                yield session
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
 
-    async for session in get_tenant_db_session(tenant_schema):
-        yield session
 
+def _ensure_tenant_is_available(entry: Optional[TenantRegistryEntry]) -> None:
+    if not entry or not entry.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Tenant not found or inactive"
+        )
+    if entry.status == TenantStatus.PROVISIONING:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Tenant is still being provisioned",
+            headers={"Retry-After": "1"},
+        )
+    if not entry.is_ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Tenant provisioning failed"
+        )
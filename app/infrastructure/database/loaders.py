@@ -0,0 +1,118 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFunction = Callable[[List[K]], Awaitable[Dict[K, V]]]
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    DataLoader-style point lookups for one session.
+
+    Keys requested during the same event loop tick are collected and
+    fetched with a single call of ``batch_fn`` (``WHERE key = ANY(:keys)``
+    in the repositories); every key is fetched at most once and later loads
+    return the cached value, ``None`` included. Writes go through ``prime``
+    and ``clear`` so the cache never serves a row the session changed.
+    """
+
+    def __init__(self, batch_fn: BatchFunction, lock: asyncio.Lock, max_batch_size: int = 1000):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._lock = lock
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._pending: Dict[K, asyncio.Future] = {}
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            if not self._pending:
+                loop.call_soon(self._schedule_dispatch)
+            self._pending[key] = future
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: List[K]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def cached(self, key: K) -> Optional[V]:
+        """The value already loaded for ``key``, without fetching; None when not (yet) known."""
+        future = self._cache.get(key)
+        if future is None or not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+
+    def prime(self, key: K, value: Optional[V]) -> None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: Optional[K] = None) -> None:
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        # One session runs one statement at a time, loaders share the lock
+        async with self._lock:
+            for start in range(0, len(keys), self.max_batch_size):
+                chunk = keys[start:start + self.max_batch_size]
+                try:
+                    values = await self.batch_fn(chunk)
+                except Exception as e:
+                    for key in chunk:
+                        if self._cache.get(key) is pending[key]:
+                            del self._cache[key]
+                        if not pending[key].done():
+                            pending[key].set_exception(e)
+                    continue
+                for key in chunk:
+                    if not pending[key].done():
+                        pending[key].set_result(values.get(key))
+
+
+class RequestLoaders:
+    """
+    The loaders of one session, which the dependencies open per request, so
+    the cache lives exactly as long as the request. A rollback clears them.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._loaders: Dict[str, BatchLoader] = {}
+
+    def get(self, name: str, batch_fn: BatchFunction) -> BatchLoader:
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = self._loaders[name] = BatchLoader(batch_fn, self._lock)
+        return loader
+
+    def clear(self, *names: str) -> None:
+        for name in names or list(self._loaders):
+            loader = self._loaders.get(name)
+            if loader is not None:
+                loader.clear()
+
+
+def get_request_loaders(session: AsyncSession) -> RequestLoaders:
+    loaders: Any = session.info.get("loaders")
+    if loaders is None:
+        loaders = session.info["loaders"] = RequestLoaders()
+        event.listen(session.sync_session, "after_soft_rollback", lambda *args: loaders.clear())
+    return loaders
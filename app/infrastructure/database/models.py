@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID, uuid4
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 from app.domain.entities.tenant import Tenant as TenantEntity
 from sqlmodel import SQLModel, Field
@@ -9,16 +10,29 @@ from sqlmodel import SQLModel, Field
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        # Keyset pagination order of GET /users
+        sa.Index("ix_public_users_created_at_id", "created_at", "id"),
+        # permissions @> ARRAY[...] lookups
+        sa.Index("ix_public_users_permissions", "permissions", postgresql_using="gin"),
+        {"schema": "public"},
+    )
     
-    id: UUID = Field(default=uuid4(), primary_key=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     email: str = Field(unique=True, index=True, nullable=False)
     username: str = Field(unique=True, index=True, nullable=False)
     password: Optional[str] = Field(default=None, nullable=True)
     tenant_id: Optional[UUID] = Field(default=None, nullable=True, index=True)
     full_name: Optional[str] = Field(default=None, nullable=True)
     role: Optional[str] = Field(default="user", nullable=False)
-    permissions: Optional[str] = Field(default="[]", nullable=True) 
+    # Column name from the online migration off the JSON column (0005/0006),
+    # a rename cannot be rolled out without downtime
+    permissions: List[str] = Field(
+        default_factory=list,
+        sa_column=sa.Column(
+            "permissions_array", postgresql.ARRAY(sa.Text), key="permissions", nullable=False, server_default="{}"
+        )
+    )
     is_active: bool = Field(default=True, nullable=False)
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
@@ -31,11 +45,15 @@ class User(SQLModel, table=True):
 
 class RefreshToken(SQLModel, table=True):
     __tablename__ = "refresh_tokens"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        sa.Index("ix_public_refresh_tokens_token_hash", "token_hash", unique=True),
+        {"schema": "public"},
+    )
     
-    id: UUID = Field(default=uuid4(), primary_key=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key="public.users.id", index=True, nullable=False)
-    token: str = Field(unique=True, index=True, nullable=False)
+    # SHA-256 of the token, the token itself is never stored
+    token_hash: bytes = Field(sa_column=sa.Column(sa.LargeBinary(32), nullable=False))
     expires_at: datetime = Field(
         sa_column=sa.Column(sa.DateTime(timezone=True), nullable=False)
     )
@@ -57,6 +75,10 @@ class Tenant(SQLModel, table=True):
     name: str = Field(index=True)
     domain: str = Field(unique=True, index=True, nullable=False)
     is_active: bool = Field(default=True, nullable=False)
+    status: str = Field(
+        default="ready",
+        sa_column=sa.Column(sa.String(20), nullable=False, server_default="ready")
+    )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_column=sa.Column(sa.DateTime(timezone=True), nullable=False)
@@ -72,6 +94,7 @@ class Tenant(SQLModel, table=True):
             name=entity.name,
             domain=entity.domain,
             is_active=entity.is_active,
+            status=entity.status.value,
             created_at=entity.created_at,
             updated_at=entity.updated_at
         )
\ No newline at end of file
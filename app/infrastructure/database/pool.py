@@ -0,0 +1,49 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long callers wait to check out a
+    connection (queueing, overflow connects and pre-ping included).
+
+    Counters are per pool instance, so they restart when the engine is
+    disposed and the pool is recreated.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            if waited > self.max_wait_seconds:
+                self.max_wait_seconds = waited
+
+    def statistics(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "avg_wait_ms": (self.total_wait_seconds / self.checkouts * 1000) if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
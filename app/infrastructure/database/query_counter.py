@@ -0,0 +1,37 @@
+from contextvars import ContextVar
+from typing import Optional
+
+# Response header carrying the number of statements the request ran
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+
+class QueryCount:
+    """Statements sent to the database while a request was handled."""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
+_current: ContextVar[Optional[QueryCount]] = ContextVar("query_count", default=None)
+
+
+def start_query_count() -> QueryCount:
+    """
+    Count the statements of the current context from now on. Tasks started
+    afterwards (the request handler, loader dispatches) share the counter.
+    """
+    query_count = QueryCount()
+    _current.set(query_count)
+    return query_count
+
+
+def get_query_count() -> Optional[QueryCount]:
+    return _current.get()
+
+
+def count_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    query_count = _current.get()
+    if query_count is not None:
+        query_count.count += 1
@@ -0,0 +1,57 @@
+import base64
+import hashlib
+import hmac
+import math
+import time
+
+from fastapi import Request
+
+from app.infrastructure.database.connection import has_read_replica
+from app.shared.config import get_settings
+
+settings = get_settings()
+
+# Returned on successful writes and echoed back by clients that need to read
+# their own writes. The value is the unix time until which reads go to the
+# primary, so the replica has had time to catch up once it expires, followed
+# by an HMAC of it: a client cannot mint a token that pins its reads to the
+# primary for longer.
+READ_YOUR_WRITES_HEADER = "X-Primary-Until"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+SIGNATURE_SIZE = 16
+
+# Derived key, the token never shares a MAC key with the JWTs or cursors
+_SIGNING_KEY = hashlib.sha256(b"read-your-writes:" + settings.secret_key.encode("utf-8")).digest()
+
+
+def _sign(expires_at: str) -> bytes:
+    digest = hmac.new(_SIGNING_KEY, expires_at.encode("latin-1"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest[:SIGNATURE_SIZE]).rstrip(b"=")
+
+
+def issue_read_your_writes_token() -> str:
+    # Truncated, not rounded: the token must not reach past one window
+    expires_at = f"{math.floor((time.time() + settings.read_your_writes_window_seconds) * 1000) / 1000:.3f}"
+    return f"{expires_at}.{_sign(expires_at).decode('ascii')}"
+
+
+def requires_primary(request: Request) -> bool:
+    if not has_read_replica():
+        return True
+
+    token = request.headers.get(READ_YOUR_WRITES_HEADER)
+    if not token:
+        return False
+    expires_at, _, signature = token.rpartition(".")
+    # Header values arrive latin-1 decoded, so this round-trips any value
+    if not hmac.compare_digest(signature.encode("latin-1"), _sign(expires_at)):
+        return False
+    try:
+        expires = float(expires_at)
+    except ValueError:
+        return False
+    # A token the API issued never reaches further than one window ahead
+    now = time.time()
+    return now < expires <= now + settings.read_your_writes_window_seconds
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.domain.entities.tenant import TenantStatus
+from app.infrastructure.database.connection import bind_tenant_schema, get_tenant_schema_name
+from app.infrastructure.database.models import RefreshToken, Tenant
+
+# Partitions of refresh_tokens whose upper expires_at bound has passed. The
+# bound is read from the partition definition ("FOR VALUES FROM (..) TO (..)"),
+# DEFAULT and MAXVALUE partitions never match.
+_EXPIRED_PARTITIONS = text("""
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    JOIN pg_namespace ON pg_namespace.oid = parent.relnamespace
+    WHERE pg_namespace.nspname = :schema
+      AND parent.relname = 'refresh_tokens'
+      AND substring(pg_get_expr(child.relpartbound, child.oid) FROM 'TO \\(''([^'']+)''\\)')::timestamptz <= now()
+    ORDER BY child.relname
+""")
+
+# NULL when refresh_tokens is a plain table, otherwise whether it has a
+# DEFAULT partition (which rules out DETACH ... CONCURRENTLY).
+_PARTITIONING = text("""
+    SELECT pg_partitioned_table.partdefid <> 0
+    FROM pg_partitioned_table
+    JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid
+    JOIN pg_namespace ON pg_namespace.oid = pg_class.relnamespace
+    WHERE pg_namespace.nspname = :schema AND pg_class.relname = 'refresh_tokens'
+""")
+
+
+@dataclass
+class SweepReport:
+    started_at: datetime
+    seconds: float
+    schemas: int
+    deleted_rows: int
+    dropped_partitions: int
+    failed_schemas: int
+
+
+class RefreshTokenSweeper:
+    """
+    Periodically removes expired and revoked refresh tokens from public and
+    every ready tenant schema.
+
+    Rows go in batches of ``batch_size`` (``DELETE ... WHERE id IN (SELECT
+    ... LIMIT n FOR UPDATE SKIP LOCKED)``), each batch in its own short
+    transaction with a ``pause_seconds`` sleep in between, so the sweeper
+    never holds many row locks or waits on a token being rotated.
+
+    When ``refresh_tokens`` in a schema is range-partitioned by
+    ``expires_at``, partitions that are entirely past their upper bound are
+    dropped first and only revoked rows in the live partitions are deleted.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        interval_seconds: float = 3600.0,
+        batch_size: int = 1000,
+        pause_seconds: float = 0.05,
+    ):
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.last_report: Optional[SweepReport] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval_seconds,
+            "batch_size": self.batch_size,
+            "last_run": asdict(self.last_report) if self.last_report else None,
+        }
+
+    async def sweep(self) -> SweepReport:
+        """One pass over every schema; rows and partitions reclaimed are in the report."""
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        deleted_rows = dropped_partitions = failed_schemas = 0
+
+        schemas = await self._list_schemas()
+        for schema in schemas:
+            try:
+                async with self.engine.connect() as connection:
+                    connection = await bind_tenant_schema(connection, schema)
+                    has_default_partition = await self._partitioning(connection, schema)
+                    partitioned = has_default_partition is not None
+                    if partitioned:
+                        dropped_partitions += await self._drop_expired_partitions(
+                            connection, schema, concurrently=not has_default_partition
+                        )
+                    deleted_rows += await self._delete_in_batches(connection, revoked_only=partitioned)
+            except Exception as e:
+                failed_schemas += 1
+                print(f"Error sweeping refresh tokens in {schema}: {e}")
+
+        self.last_report = SweepReport(
+            started_at=started_at,
+            seconds=round(time.perf_counter() - start, 3),
+            schemas=len(schemas),
+            deleted_rows=deleted_rows,
+            dropped_partitions=dropped_partitions,
+            failed_schemas=failed_schemas,
+        )
+        return self.last_report
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                report = await self.sweep()
+                print(
+                    f"Refresh token sweep: {report.deleted_rows} rows deleted, "
+                    f"{report.dropped_partitions} partitions dropped in {report.schemas} schemas "
+                    f"({report.seconds:.1f}s)"
+                )
+            except Exception as e:
+                print(f"Error sweeping refresh tokens: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _list_schemas(self) -> List[str]:
+        async with self.engine.connect() as connection:
+            result = await connection.execute(
+                select(Tenant.id).where(Tenant.status == TenantStatus.READY.value)
+            )
+            return ["public"] + [get_tenant_schema_name(row.id) for row in result]
+
+    async def _delete_in_batches(self, connection: AsyncConnection, revoked_only: bool) -> int:
+        condition = RefreshToken.is_revoked
+        if not revoked_only:
+            condition = or_(RefreshToken.expires_at < func.now(), RefreshToken.is_revoked)
+        batch = (
+            select(RefreshToken.id)
+            .where(condition)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        statement = delete(RefreshToken).where(RefreshToken.id.in_(batch.scalar_subquery()))
+
+        deleted = 0
+        while True:
+            result = await connection.execute(statement)
+            await connection.commit()
+            deleted += result.rowcount
+            if result.rowcount < self.batch_size:
+                return deleted
+            await asyncio.sleep(self.pause_seconds)
+
+    @staticmethod
+    async def _partitioning(connection: AsyncConnection, schema: str) -> Optional[bool]:
+        result = await connection.execute(_PARTITIONING, {"schema": schema})
+        has_default_partition = result.scalar_one_or_none()
+        await connection.commit()
+        return has_default_partition
+
+    async def _drop_expired_partitions(self, connection: AsyncConnection, schema: str, concurrently: bool) -> int:
+        result = await connection.execute(_EXPIRED_PARTITIONS, {"schema": schema})
+        partitions = result.scalars().all()
+        await connection.commit()
+        if not partitions:
+            return 0
+
+        async with self.engine.connect() as ddl_connection:
+            for partition in partitions:
+                detach = f'ALTER TABLE "{schema}".refresh_tokens DETACH PARTITION "{schema}"."{partition}"'
+                if concurrently:
+                    # Only a SHARE UPDATE EXCLUSIVE lock on the parent, but it
+                    # cannot run inside a transaction block.
+                    autocommit = await ddl_connection.execution_options(isolation_level="AUTOCOMMIT")
+                    await autocommit.exec_driver_sql(detach + " CONCURRENTLY")
+                    await autocommit.exec_driver_sql(f'DROP TABLE "{schema}"."{partition}"')
+                else:
+                    # A plain DETACH locks the parent exclusively: give up
+                    # rather than queue behind (and block) token traffic.
+                    async with ddl_connection.begin():
+                        await ddl_connection.exec_driver_sql("SET LOCAL lock_timeout = '2s'")
+                        await ddl_connection.exec_driver_sql(detach)
+                        await ddl_connection.exec_driver_sql(f'DROP TABLE "{schema}"."{partition}"')
+                await asyncio.sleep(self.pause_seconds)
+        return len(partitions)
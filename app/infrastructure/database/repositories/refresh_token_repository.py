@@ -1,34 +1,54 @@
-from typing import Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
 from datetime import datetime, timezone
+import hashlib
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, not_
+from sqlalchemy import LargeBinary, any_, bindparam, false, insert, not_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from app.domain.interfaces.refresh_token_repository import RefreshTokenRepository
+from app.infrastructure.database.loaders import BatchLoader, get_request_loaders
 from app.infrastructure.database.models import RefreshToken as RefreshTokenModel
 
+TOKEN_LOADER = "refresh_tokens.token_hash"
+
+
+def hash_token(token: str) -> bytes:
+    """Fixed 32-byte key the token is stored and looked up by."""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
 
 class RefreshTokenRepositoryImpl(RefreshTokenRepository):
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.loaders = get_request_loaders(session)
+    
+    def _loader(self) -> BatchLoader:
+        return self.loaders.get(TOKEN_LOADER, self._load_by_hash)
+    
+    async def _load_by_hash(self, token_hashes: List[bytes]) -> Dict[bytes, Any]:
+        result = await self.session.execute(
+            select(*RefreshTokenModel.__table__.c).where(
+                RefreshTokenModel.token_hash == any_(bindparam("token_hashes", token_hashes, type_=ARRAY(LargeBinary)))
+            )
+        )
+        return {row.token_hash: row for row in result}
     
     async def create(self, user_id: UUID, token: str, expires_at: datetime) -> None:
         db_token = RefreshTokenModel(
             user_id=user_id,
-            token=token,
+            token_hash=hash_token(token),
             expires_at=expires_at,
             is_revoked=False
         )
         self.session.add(db_token)
-        await self.session.commit()
+        await self.session.flush()
+        self._loader().clear(db_token.token_hash)
     
     async def get_by_token(self, token: str) -> Optional[dict]:
-        result = await self.session.execute(
-            select(RefreshTokenModel).where(RefreshTokenModel.token == token)
-        )
-        db_token = result.scalar_one_or_none()
+        db_token = await self._loader().load(hash_token(token))
         
         if not db_token:
             return None
@@ -36,7 +56,7 @@ class RefreshTokenRepositoryImpl(RefreshTokenRepository):
         return {
             "id": db_token.id,
             "user_id": db_token.user_id,
-            "token": db_token.token,
+            "token": token,
             "expires_at": db_token.expires_at,
             "is_revoked": db_token.is_revoked,
             "created_at": db_token.created_at
@@ -45,43 +65,77 @@ class RefreshTokenRepositoryImpl(RefreshTokenRepository):
     async def revoke_token(self, token: str) -> bool:
     
         result = await self.session.execute(
-            select(RefreshTokenModel).where(RefreshTokenModel.token == token)
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.token_hash == hash_token(token))
+            .values(is_revoked=True, revoked_at=datetime.now(timezone.utc))
+            .returning(RefreshTokenModel.id)
         )
-        db_token = result.scalar_one_or_none()
-        
-        if not db_token:
-            return False
-        
-        db_token.is_revoked = True
-        db_token.revoked_at = datetime.now(timezone.utc)
-        await self.session.commit()
-        return True
+        revoked = result.first() is not None
+        self._loader().clear(hash_token(token))
+        return revoked
     
     async def revoke_all_user_tokens(self, user_id: UUID) -> bool:
         result = await self.session.execute(
-            select(RefreshTokenModel).where(
+            update(RefreshTokenModel)
+            .where(
                 RefreshTokenModel.user_id == user_id,
                 not_(RefreshTokenModel.is_revoked)
             )
+            .values(is_revoked=True, revoked_at=datetime.now(timezone.utc))
         )
-        db_tokens = result.scalars().all()
-        
-        if not db_tokens:
-            return False
-        
-        for db_token in db_tokens:
-            db_token.is_revoked = True
-            db_token.revoked_at = datetime.now(timezone.utc)
-        
-        await self.session.commit()
-        return True
+        self._loader().clear()
+        return result.rowcount > 0
+    
+    async def rotate(self, token: str, user_id: UUID, new_token: str, expires_at: datetime) -> bool:
+        """
+        Revoke ``token`` and store ``new_token`` in one statement:
+
+            WITH revoked AS (UPDATE ... WHERE token_hash = :hash AND NOT is_revoked
+                             AND expires_at > :now RETURNING user_id)
+            INSERT INTO refresh_tokens (...) SELECT ... FROM revoked
+
+        Nothing is inserted unless the old token was still valid. A
+        concurrent rotation of the same token waits on the row lock and then
+        finds it revoked, so a token can only be exchanged once.
+        """
+        now = datetime.now(timezone.utc)
+        columns = RefreshTokenModel.__table__.c
+        revoked = (
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.token_hash == hash_token(token),
+                RefreshTokenModel.user_id == user_id,
+                not_(RefreshTokenModel.is_revoked),
+                RefreshTokenModel.expires_at > now,
+            )
+            .values(is_revoked=True, revoked_at=now)
+            .returning(RefreshTokenModel.user_id)
+            .cte("revoked")
+        )
+        statement = (
+            insert(RefreshTokenModel)
+            .from_select(
+                ["id", "user_id", "token_hash", "expires_at", "is_revoked", "created_at"],
+                select(
+                    bindparam("new_id", uuid4(), type_=columns.id.type),
+                    revoked.c.user_id,
+                    bindparam("new_token_hash", hash_token(new_token), type_=columns.token_hash.type),
+                    bindparam("new_expires_at", expires_at, type_=columns.expires_at.type),
+                    false(),
+                    bindparam("new_created_at", now, type_=columns.created_at.type),
+                ).select_from(revoked),
+            )
+            .returning(RefreshTokenModel.id)
+        )
+        result = await self.session.execute(statement)
+        rotated = result.first() is not None
+        self._loader().clear(hash_token(token))
+        self._loader().clear(hash_token(new_token))
+        return rotated
     
     async def is_token_valid(self, token: str) -> bool:
     
-        result = await self.session.execute(
-            select(RefreshTokenModel).where(RefreshTokenModel.token == token)
-        )
-        db_token = result.scalar_one_or_none()
+        db_token = await self._loader().load(hash_token(token))
         
         if not db_token:
             return False
@@ -1,17 +1,51 @@
 from app.domain.interfaces.tenant_repository import TenantRepository
 from app.infrastructure.database.models import Tenant
 from app.domain.entities.tenant import Tenant as TenantEntity
-from app.shared.pagination import CursorPagedResult, PaginationDirection, ICursorPaginationHelper
+from app.infrastructure.database.loaders import BatchLoader, get_request_loaders
+from app.infrastructure.database.row_counts import RowCounter
+from app.infrastructure.database.row_mappers import compile_row_mapper
+from app.domain.entities.tenant import TenantStatus
+from app.shared.pagination import CursorPagedResult, PaginationDirection, ICursorPaginationHelper, TotalCountMode
 from sqlmodel import select
+from sqlalchemy import any_, bindparam, func, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from functools import partial
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import Optional, Any
+from datetime import datetime
+from typing import Optional, Any, Dict, List
+
+TENANT_COLUMNS = tuple(Tenant.__table__.c)
+
+TENANT_VERSION = func.coalesce(Tenant.updated_at, Tenant.created_at)
+
+_map_tenant = compile_row_mapper(
+    TenantEntity,
+    ["tenant_id" if column.name == "id" else column.name for column in TENANT_COLUMNS],
+    {"status": TenantStatus},
+)
 
 
 class TenantRepository(TenantRepository):
-    def __init__(self, session: AsyncSession, pagination_helper: ICursorPaginationHelper):
+    def __init__(self, session: AsyncSession, pagination_helper: ICursorPaginationHelper, row_counter: RowCounter = None):
         self.db = session
         self.pagination_helper = pagination_helper
+        self.row_counter = row_counter or RowCounter()
+        self.loaders = get_request_loaders(session)
+    
+    def _loader(self, column_name: str) -> BatchLoader:
+        return self.loaders.get(f"tenants.{column_name}", partial(self._load_by, column_name))
+    
+    async def _load_by(self, column_name: str, keys: List[Any]) -> Dict[Any, TenantEntity]:
+        column = Tenant.__table__.c[column_name]
+        result = await self.db.execute(
+            select(*TENANT_COLUMNS).where(column == any_(bindparam("keys", keys, type_=ARRAY(column.type))))
+        )
+        return {getattr(row, column_name): _map_tenant(row) for row in result}
+    
+    def _remember(self, tenant: Optional[TenantEntity], tenant_id: UUID) -> None:
+        self.loaders.clear("tenants.domain")
+        self._loader("id").prime(tenant_id, tenant)
         
     async def create(self, tenant: TenantEntity) -> TenantEntity:
         
@@ -20,92 +54,83 @@ class TenantRepository(TenantRepository):
             name=tenant.name,
             domain=tenant.domain,
             is_active=tenant.is_active,
+            status=tenant.status.value,
             created_at=tenant.created_at,
             updated_at=tenant.updated_at
         )
         self.db.add(db_tenant)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(db_tenant)
         
     
-        return TenantEntity(
+        created_tenant = TenantEntity(
             tenant_id=db_tenant.id, 
             name=db_tenant.name,
             domain=db_tenant.domain,
             is_active=db_tenant.is_active,
+            status=db_tenant.status,
             created_at=db_tenant.created_at,
             updated_at=db_tenant.updated_at
         )
+        self._remember(created_tenant, created_tenant.tenant_id)
+        return created_tenant
     
     async def get_by_id(self, tenant_id: UUID) -> Optional[TenantEntity]:
-        
-        tenant = await self.db.get(Tenant, tenant_id)
-        if not tenant:
-            return None
-        
-    
-        return TenantEntity(
-            tenant_id=tenant.id,
-            name=tenant.name,
-            domain=tenant.domain,
-            is_active=tenant.is_active,
-            created_at=tenant.created_at,
-            updated_at=tenant.updated_at
-        )
+        return await self._loader("id").load(tenant_id)
     
     async def get_by_domain(self, domain: str) -> Optional[TenantEntity]:
+        return await self._loader("domain").load(domain)
     
-        result = await self.db.execute(select(Tenant).where(Tenant.domain == domain))
-        db_tenant = result.scalar_one_or_none()
-        if not db_tenant:
-            return None
-        
-      
-        return TenantEntity(
-            tenant_id=db_tenant.id,
-            name=db_tenant.name,
-            domain=db_tenant.domain,
-            is_active=db_tenant.is_active,
-            created_at=db_tenant.created_at,
-            updated_at=db_tenant.updated_at
-        )
-    
-    async def update(self, tenant: TenantEntity) -> Optional[TenantEntity]:
-        
-        existing_tenant = await self.db.get(Tenant, tenant.tenant_id)
-        
-        if not existing_tenant:
-            return None
-
+    async def get_version(self, tenant_id: UUID) -> Optional[datetime]:
+        tenant = self._loader("id").cached(tenant_id)
+        if tenant is not None:
+            return tenant.version
+        result = await self.db.execute(select(TENANT_VERSION).where(Tenant.id == tenant_id))
+        return result.scalar_one_or_none()
     
-        existing_tenant.name = tenant.name
-        existing_tenant.domain = tenant.domain
-        existing_tenant.is_active = tenant.is_active
-        existing_tenant.updated_at = tenant.updated_at
+    async def update(self, tenant: TenantEntity, expected_version: Optional[datetime] = None) -> Optional[TenantEntity]:
         
-        await self.db.commit()
-        await self.db.refresh(existing_tenant)
+        if not tenant.has_changes:
+            return tenant
         
-        return TenantEntity(
-            tenant_id=existing_tenant.id,
-            name=existing_tenant.name,
-            domain=existing_tenant.domain,
-            is_active=existing_tenant.is_active,
-            created_at=existing_tenant.created_at,
-            updated_at=existing_tenant.updated_at
+        # Only the changed columns, in one UPDATE ... RETURNING; with
+        # expected_version it matches nothing once another write got in first
+        statement = (
+            update(Tenant)
+            .where(Tenant.id == tenant.tenant_id)
+            .values({field: getattr(tenant, field) for field in tenant.changed_fields})
+            .returning(*TENANT_COLUMNS)
         )
+        if expected_version is not None:
+            statement = statement.where(TENANT_VERSION == expected_version)
+        result = await self.db.execute(statement)
+        existing_tenant = result.one_or_none()
+        
+        updated_tenant = _map_tenant(existing_tenant) if existing_tenant else None
+        self._remember(updated_tenant, tenant.tenant_id)
+        return updated_tenant
     
     async def delete(self, tenant_id: UUID) -> bool:
        
         tenant = await self.db.get(Tenant, tenant_id)
         if not tenant:
             return None
-        self.db.delete(tenant)
-        await self.db.commit()
+        await self.db.delete(tenant)
+        await self.db.flush()
+        self._remember(None, tenant_id)
         return True
     
-    async def list_all_with_cursor(self, cursor: str = None, limit: int = 100, direction: PaginationDirection = PaginationDirection.FORWARD) -> CursorPagedResult[Any]:
-        query = select(Tenant)
+    async def list_all_with_cursor(
+        self,
+        cursor: str = None,
+        limit: int = 100,
+        direction: PaginationDirection = PaginationDirection.FORWARD,
+        include_total: TotalCountMode = TotalCountMode.NONE,
+    ) -> CursorPagedResult[Any]:
+        query = select(*TENANT_COLUMNS)
+        total_count, total_is_estimate = await self.row_counter.count(
+            self.db, query, include_total, cache_key="tenants"
+        )
         
         if cursor:
           
@@ -119,23 +144,12 @@ class TenantRepository(TenantRepository):
             query = query.limit(limit + 1)
             
         result = await self.db.execute(query)
-        tenants = result.scalars().all()
+        tenants = result.all()
         
         paginated_result = self.pagination_helper.apply_cursor_pagination_to_query_result(
             tenants, "id", cursor, limit, direction
         )
-        
-        domain_tenants = []
-        for tenant in paginated_result.items:
-            domain_tenant = TenantEntity(
-                name=tenant.name,
-                domain=tenant.domain,
-                is_active=tenant.is_active,
-                tenant_id=tenant.id,
-                created_at=tenant.created_at,
-                updated_at=tenant.updated_at
-            )
-            domain_tenants.append(domain_tenant)
+        domain_tenants = [_map_tenant(tenant) for tenant in paginated_result.items]
         
         return CursorPagedResult[Any](
             items=domain_tenants,
@@ -143,7 +157,9 @@ class TenantRepository(TenantRepository):
             previous_cursor=paginated_result.previous_cursor,
             has_next_page=paginated_result.has_next_page,
             has_previous_page=paginated_result.has_previous_page,
-            page_size=paginated_result.page_size
+            page_size=paginated_result.page_size,
+            total_count=total_count,
+            total_is_estimate=total_is_estimate,
         )
         
     async def list_all_with_pagination(self, page: int = 1, page_size: int = 10) -> Any:
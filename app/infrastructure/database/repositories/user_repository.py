@@ -1,160 +1,194 @@
 
-from typing import List, Optional
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
-import json
 
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import String, any_, bindparam, func, or_, select, update
 
+from app.application.exceptions.user_exceptions import UserAlreadyExistsError
+from app.application.extensions.pagination import CursorPaginationHelper
 from app.domain.entities.user import User
 from app.domain.interfaces.user_repository import UserRepository
+from app.infrastructure.database.loaders import BatchLoader, get_request_loaders
 from app.infrastructure.database.models import User as UserModel
+from app.infrastructure.database.row_mappers import compile_row_mapper
+from app.infrastructure.database.row_counts import RowCounter
+from app.shared.pagination import CursorPagedResult, ICursorPaginationHelper, PaginationDirection, TotalCountMode
+
+UNIQUE_VIOLATION = "23505"
+
+# Keyset of GET /users, backed by ix_public_users_created_at_id
+LIST_KEY = ["created_at", "id"]
+
+# Reads select these Core columns and map the row tuples straight to
+# entities, no ORM instances involved.
+USER_COLUMNS = tuple(UserModel.__table__.c)
+
+# Point lookups go through the session's loaders, one per unique column
+USER_LOADERS = ("users.id", "users.email", "users.username")
+
+# User.version as SQL, the ETag source: conditional requests read only this
+USER_VERSION = func.coalesce(UserModel.updated_at, UserModel.created_at)
+
+_map_user = compile_row_mapper(User, [column.key for column in USER_COLUMNS])
+
 
 class UserRepositoryImpl(UserRepository):
     
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        pagination_helper: ICursorPaginationHelper = None,
+        row_counter: RowCounter = None,
+    ):
         self.session = session
+        self.pagination_helper = pagination_helper or CursorPaginationHelper()
+        self.row_counter = row_counter or RowCounter()
+        self.loaders = get_request_loaders(session)
     
-    async def create(self, user: User) -> User:
-        
-        db_user = UserModel(
-            email=user.email,
-            username=user.username,
-            password=user.password,
-            tenant_id=user.tenant_id,
-            full_name=user.full_name,
-            role=user.role,
-            permissions=json.dumps(user.permissions) if user.permissions else "[]",
-            is_active=user.is_active,
-            created_at=user.created_at,
-            updated_at=user.updated_at
-        )
-        self.session.add(db_user)
-        await self.session.commit()
-        await self.session.refresh(db_user)
-        
-        return User(
-            user_id=db_user.id,
-            email=db_user.email,
-            username=db_user.username,
-            tenant_id=db_user.tenant_id,
-            password=db_user.password,
-            full_name=db_user.full_name,
-            role=db_user.role,
-            permissions=json.loads(db_user.permissions) if db_user.permissions else [],
-            is_active=db_user.is_active,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at
-        )
+    def _loader(self, column_name: str) -> BatchLoader:
+        return self.loaders.get(f"users.{column_name}", partial(self._load_by, column_name))
     
-    async def get_by_id(self, user_id: UUID) -> Optional[User]:
-     
-        result = await self.session.get(UserModel, user_id)
-  
-        
-        if not result:
-            return None
-        
-        return User(
-            user_id=result.id,
-            email=result.email,
-            username=result.username,
-            tenant_id=result.tenant_id,
-            password=result.password,
-            full_name=result.full_name,
-            role=result.role,
-            permissions=json.loads(result.permissions) if result.permissions else [],
-            is_active=result.is_active,
-            created_at=result.created_at,
-            updated_at=result.updated_at
-        )
-    
-    async def get_by_email(self, email: str) -> Optional[User]:
-      
+    async def _load_by(self, column_name: str, keys: List[Any]) -> Dict[Any, User]:
+        column = UserModel.__table__.c[column_name]
         result = await self.session.execute(
-            select(UserModel).where(UserModel.email == email)
+            select(*USER_COLUMNS).where(column == any_(bindparam("keys", keys, type_=ARRAY(column.type))))
         )
-        db_user = result.scalar_one_or_none()
+        return {getattr(row, column_name): _map_user(row) for row in result}
+    
+    def _remember(self, user: Optional[User], user_id: UUID) -> None:
+        """After a write: the id maps to the new state, email/username lookups are re-read."""
+        self.loaders.clear("users.email", "users.username")
+        self._loader("id").prime(user_id, user)
+    
+    @staticmethod
+    def _to_values(user: User) -> dict:
+        return {
+            "id": user.id,
+            "email": user.email,
+            "username": user.username,
+            "password": user.password,
+            "tenant_id": user.tenant_id,
+            "full_name": user.full_name,
+            "role": user.role,
+            "permissions": list(user.permissions),
+            "is_active": user.is_active,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+    
+    async def create(self, user: User) -> User:
         
-        if not db_user:
-            return None
+        # A single INSERT ... RETURNING: the unique indexes on email and
+        # username detect duplicates, so there is no check-then-insert race.
+        # The unit of work commits, or rolls back on the raised error.
+        statement = insert(UserModel).values(self._to_values(user)).returning(*USER_COLUMNS)
+        try:
+            result = await self.session.execute(statement)
+            db_user = result.one()
+        except IntegrityError as e:
+            raise self._conflict_error(e, user) from e
         
-        return User(
-            user_id=db_user.id,
-            email=db_user.email,
-            username=db_user.username,
-            tenant_id=db_user.tenant_id,
-            password=db_user.password,
-            full_name=db_user.full_name,
-            role=db_user.role,
-            permissions=json.loads(db_user.permissions) if db_user.permissions else [],
-            is_active=db_user.is_active,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at
-        )
+        created_user = _map_user(db_user)
+        self._remember(created_user, created_user.id)
+        return created_user
     
-    async def get_by_username(self, username: str) -> Optional[User]:
+    async def create_many(self, users: List[User]) -> List[User]:
+        if not users:
+            return []
         
-        result = await self.session.execute(
-            select(UserModel).where(UserModel.username == username)
+        # One multi-row INSERT; rows hitting the unique email/username indexes
+        # (in the table or earlier in the same batch) are skipped, not raised.
+        statement = (
+            insert(UserModel)
+            .values([self._to_values(user) for user in users])
+            .on_conflict_do_nothing()
+            .returning(UserModel.id)
         )
-        db_user = result.scalar_one_or_none()
-        
-        if not db_user:
-            return None
+        result = await self.session.execute(statement)
+        created_ids = set(result.scalars().all())
+        self.loaders.clear(*USER_LOADERS)
         
-        return User(
-            user_id=db_user.id,
-            email=db_user.email,
-            username=db_user.username,
-            tenant_id=db_user.tenant_id,
-            password=db_user.password,
-            full_name=db_user.full_name,
-            role=db_user.role,
-            permissions=json.loads(db_user.permissions) if db_user.permissions else [],
-            is_active=db_user.is_active,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at
-        )
+        return [user for user in users if user.id in created_ids]
     
-    async def update(self, user: User) -> Optional[User]:
-       
+    @staticmethod
+    def _conflict_error(error: IntegrityError, user: User) -> Exception:
+        """UserAlreadyExistsError for unique violations on email/username, else the error itself."""
+        if getattr(error.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+            return error
+        # asyncpg reports the violated index (ix_public_users_email/_username)
+        constraint = getattr(error.orig.__cause__, "constraint_name", None) or str(error.orig)
+        if "username" in constraint:
+            return UserAlreadyExistsError(f"User with username {user.username} already exists")
+        if "email" in constraint:
+            return UserAlreadyExistsError(f"User with email {user.email} already exists")
+        return error
+    
+    async def find_existing_emails_and_usernames(
+        self, emails: List[str], usernames: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        # = ANY(array) keeps one statement text whatever the batch size, unlike IN (...)
         result = await self.session.execute(
-            select(UserModel).where(UserModel.id == user.id)
+            select(UserModel.email, UserModel.username).where(
+                or_(
+                    UserModel.email == any_(bindparam("emails", emails, type_=ARRAY(String))),
+                    UserModel.username == any_(bindparam("usernames", usernames, type_=ARRAY(String))),
+                )
+            )
         )
-        db_user = result.scalar_one_or_none()
-        
-        if not db_user:
-            return None
+        rows = result.all()
+        return {row.email for row in rows}, {row.username for row in rows}
+    
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        return await self._loader("id").load(user_id)
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self._loader("email").load(email)
+    
+    async def get_by_username(self, username: str) -> Optional[User]:
+        return await self._loader("username").load(username)
+    
+    async def get_version(self, user_id: UUID) -> Optional[datetime]:
+        user = self._loader("id").cached(user_id)
+        if user is not None:
+            return user.version
+        result = await self.session.execute(select(USER_VERSION).where(UserModel.id == user_id))
+        return result.scalar_one_or_none()
+    
+    async def update(self, user: User, expected_version: Optional[datetime] = None) -> Optional[User]:
         
-        db_user.email = user.email
-        db_user.username = user.username
-        db_user.full_name = user.full_name
-        if user.password:
-            db_user.password = user.password
-        if user.tenant_id:
-            db_user.tenant_id = user.tenant_id
-        if user.role:
-            db_user.role = user.role
-        if user.permissions:
-            db_user.permissions = json.dumps(user.permissions)
-        db_user.updated_at = user.updated_at
-        await self.session.commit()
-        await self.session.refresh(db_user)
+        if not user.has_changes:
+            return user
         
-        return User(
-            user_id=db_user.id,
-            email=db_user.email,
-            username=db_user.username,
-            tenant_id=db_user.tenant_id,
-            password=db_user.password,
-            full_name=db_user.full_name,
-            role=db_user.role,
-            permissions=json.loads(db_user.permissions) if db_user.permissions else [],
-            is_active=db_user.is_active,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at
+        # Only the columns the entity reports as changed, in one
+        # UPDATE ... RETURNING; None when the row does not exist or, with
+        # expected_version, another write got in first.
+        changes = {
+            column: value
+            for column, value in self._to_values(user).items()
+            if column in user.changed_fields
+        }
+        statement = (
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(changes)
+            .returning(*USER_COLUMNS)
         )
+        if expected_version is not None:
+            statement = statement.where(USER_VERSION == expected_version)
+        try:
+            result = await self.session.execute(statement)
+            db_user = result.one_or_none()
+        except IntegrityError as e:
+            raise self._conflict_error(e, user) from e
+        
+        updated_user = _map_user(db_user) if db_user is not None else None
+        self._remember(updated_user, user.id)
+        return updated_user
     
     async def delete(self, user_id: UUID) -> bool:
        
@@ -167,32 +201,48 @@ class UserRepositoryImpl(UserRepository):
             return False
         
         await self.session.delete(db_user)
-        await self.session.commit()
+        await self.session.flush()
+        self._remember(None, user_id)
         return True
     
     
-    # TO DO: Implement cursor pagination
-    async def list_all(self, skip: int = 0, limit: int = 15) -> List[User]:
-       
-        result = await self.session.execute(
-            select(UserModel).offset(skip).limit(limit)
+    async def list_all(
+        self,
+        cursor: str = None,
+        limit: int = 100,
+        direction: PaginationDirection = PaginationDirection.FORWARD,
+        include_total: TotalCountMode = TotalCountMode.NONE,
+        permission: Optional[str] = None,
+    ) -> CursorPagedResult[Any]:
+        
+        base_query = select(*USER_COLUMNS)
+        cache_key = "users"
+        if permission is not None:
+            # permissions @> ARRAY[:permission], served by ix_public_users_permissions
+            base_query = base_query.where(UserModel.permissions.contains([permission]))
+            cache_key = f"users:permission:{permission}"
+        total_count, total_is_estimate = await self.row_counter.count(
+            self.session, base_query, include_total, cache_key=cache_key
+        )
+        query = self.pagination_helper.build_keyset_query(
+            base_query, UserModel, LIST_KEY, cursor, limit, direction
         )
-        db_users = result.scalars().all()
+        result = await self.session.execute(query)
+        rows = result.all()
         
-        return [
-            User(
-                user_id=db_user.id,
-                email=db_user.email,
-                username=db_user.username,
-                tenant_id=db_user.tenant_id,
-                password=db_user.password,
-                full_name=db_user.full_name,
-                role=db_user.role,
-                permissions=json.loads(db_user.permissions) if db_user.permissions else [],
-                is_active=db_user.is_active,
-                created_at=db_user.created_at,
-                updated_at=db_user.updated_at
-            )
-            for db_user in db_users
-        ]
+        paginated_result = self.pagination_helper.apply_keyset_pagination_to_query_result(
+            rows, LIST_KEY, cursor, limit, direction
+        )
+        users = [_map_user(row) for row in paginated_result.items]
+        
+        return CursorPagedResult[Any](
+            items=users,
+            next_cursor=paginated_result.next_cursor,
+            previous_cursor=paginated_result.previous_cursor,
+            has_next_page=paginated_result.has_next_page,
+            has_previous_page=paginated_result.has_previous_page,
+            page_size=paginated_result.page_size,
+            total_count=total_count,
+            total_is_estimate=total_is_estimate,
+        )
 
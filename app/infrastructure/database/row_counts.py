@@ -0,0 +1,95 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import Table, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.infrastructure.database.connection import get_bound_schema
+from app.shared.pagination import TotalCountMode
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class RowCounter:
+    """
+    Totals for list endpoints without a COUNT(*) on every page request.
+
+    "estimate" reads planner statistics: pg_class.reltuples for a whole
+    table, the EXPLAIN row estimate for a filtered query (or a table that was
+    never analyzed). "exact" runs COUNT(*) and keeps the result per schema for
+    ``ttl_seconds``, so a client paging through a list counts once.
+
+    The cache is per process and is not invalidated by writes, totals may lag
+    by up to the TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = 10.0, max_size: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._exact: "OrderedDict[Tuple[str, str], Tuple[int, float]]" = OrderedDict()
+
+    async def count(
+        self, session: AsyncSession, query, mode: TotalCountMode, cache_key: str
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Total rows of ``query`` (without its ORDER BY/LIMIT) as
+        (count, is_estimate). ``cache_key`` names the query within a schema.
+        """
+        if mode == TotalCountMode.NONE:
+            return None, False
+
+        connection = await session.connection()
+        schema = get_bound_schema(connection)
+
+        if mode == TotalCountMode.ESTIMATE and connection.dialect.name == "postgresql":
+            return await self._estimate(connection, query, schema), True
+
+        key = (schema, cache_key)
+        cached = self._exact.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            self._exact.move_to_end(key)
+            return cached[0], False
+
+        result = await connection.execute(
+            select(func.count()).select_from(query.order_by(None).limit(None).subquery())
+        )
+        total = result.scalar_one()
+        self._exact[key] = (total, time.monotonic() + self.ttl_seconds)
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.max_size:
+            self._exact.popitem(last=False)
+        return total, False
+
+    async def _estimate(self, connection: AsyncConnection, query, schema: str) -> int:
+        froms = query.get_final_froms()
+        if query.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+            result = await connection.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+                {"name": f'"{schema}".{froms[0].name}'},
+            )
+            reltuples = result.scalar_one_or_none()
+            # -1 until the table is first vacuumed or analyzed
+            if reltuples is not None and reltuples >= 0:
+                return reltuples
+
+        result = await connection.execute(_Explain(query.order_by(None).limit(None)))
+        plan: Any = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,50 @@
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Optional, Sequence
+
+
+def compile_row_mapper(
+    entity_class: type,
+    attributes: Sequence[str],
+    converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+) -> Callable[[Sequence[Any]], Any]:
+    """
+    Build ``map_row(row) -> entity`` for rows holding ``attributes`` in order.
+
+    The function is generated once per entity: it unpacks the row tuple and
+    stores each value (through its converter, if any) straight into the
+    entity's slots, skipping ``__init__`` and the change-tracking
+    ``__setattr__``, so mapped entities start with no pending changes.
+    Every public slot of ``entity_class`` must be covered by ``attributes``.
+    """
+    converters = converters or {}
+    slots = {
+        name
+        for klass in entity_class.__mro__
+        for name in getattr(klass, "__slots__", ())
+        if not name.startswith("_")
+    }
+    missing = slots - set(attributes)
+    if missing:
+        raise ValueError(f"{entity_class.__name__} mapper does not fill {sorted(missing)}")
+
+    namespace: Dict[str, Any] = {"new": object.__new__, "entity_class": entity_class}
+    names = [f"v{i}" for i in range(len(attributes))]
+    lines = [
+        "def map_row(row):",
+        f"    {', '.join(names)}, = row",
+        "    entity = new(entity_class)",
+    ]
+    for i, (attribute, name) in enumerate(zip(attributes, names)):
+        descriptor = getattr(entity_class, attribute, None)
+        if not isinstance(descriptor, MemberDescriptorType):
+            raise ValueError(f"{entity_class.__name__}.{attribute} is not a slot")
+        namespace[f"set{i}"] = descriptor.__set__
+        value = name
+        if attribute in converters:
+            namespace[f"convert{i}"] = converters[attribute]
+            value = f"convert{i}({name})"
+        lines.append(f"    set{i}(entity, {value})")
+    lines.append("    return entity")
+
+    exec(compile("\n".join(lines), f"<{entity_class.__name__} row mapper>", "exec"), namespace)
+    return namespace["map_row"]
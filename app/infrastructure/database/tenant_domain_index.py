@@ -0,0 +1,168 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.interfaces.tenant_domain_index import ITenantDomainIndex
+from app.infrastructure.database.models import Tenant
+
+WILDCARD = "*"
+
+
+class _Node:
+    __slots__ = ("children", "tenant_id", "wildcard_tenant_id")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Tenant of exactly this domain / of every name below it (*.domain)
+        self.tenant_id: Optional[UUID] = None
+        self.wildcard_tenant_id: Optional[UUID] = None
+
+
+def normalize_host(host: str) -> str:
+    """Lowercase host name without port or trailing dot."""
+    host = host.strip().lower()
+    if host.startswith("["):
+        # IPv6 literal, never a tenant domain
+        return host.split("]", 1)[0] + "]"
+    return host.split(":", 1)[0].rstrip(".")
+
+
+class TenantDomainIndex(ITenantDomainIndex):
+    """
+    Resolves the request host to a tenant without touching the database.
+
+    Domains live in a trie over their reversed labels (``com`` ->
+    ``example`` -> ``acme``), so a lookup is one dict step per label however
+    many tenants there are. ``*.example.com`` matches every name below
+    example.com (not example.com itself); an exact domain wins over a
+    wildcard and a deeper wildcard over a shallower one.
+
+    Loaded at startup, then kept current by the tenant.* events of this
+    process and, for changes made by other workers, a full reload every
+    ``reload_seconds``.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, reload_seconds: float = 60.0):
+        self.session_factory = session_factory
+        self.reload_seconds = reload_seconds
+        self._root = _Node()
+        self._domains: Dict[UUID, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str) -> Optional[UUID]:
+        node = self._root
+        match = None
+        for label in reversed(normalize_host(host).split(".")):
+            # There is at least one more label: node's wildcard applies
+            if node.wildcard_tenant_id is not None:
+                match = node.wildcard_tenant_id
+            node = node.children.get(label)
+            if node is None:
+                break
+        else:
+            if node.tenant_id is not None:
+                match = node.tenant_id
+
+        if match is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return match
+
+    def set(self, tenant_id: UUID, domain: str) -> None:
+        self.remove(tenant_id)
+        self._insert(self._root, self._domains, tenant_id, domain)
+
+    def remove(self, tenant_id: UUID) -> None:
+        domain = self._domains.pop(tenant_id, None)
+        if domain is None:
+            return
+        node = self._find(domain)
+        if node is None:
+            return
+        if node.tenant_id == tenant_id:
+            node.tenant_id = None
+        if node.wildcard_tenant_id == tenant_id:
+            node.wildcard_tenant_id = None
+
+    async def load(self, session: AsyncSession) -> int:
+        """Rebuild the index from public.tenants, swapping it in at once."""
+        result = await session.execute(select(Tenant.id, Tenant.domain))
+        root: _Node = _Node()
+        domains: Dict[UUID, str] = {}
+        for row in result:
+            self._insert(root, domains, row.id, row.domain)
+        self._root, self._domains = root, domains
+        return len(domains)
+
+    def start(self) -> None:
+        if self.reload_seconds and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "tenants": len(self._domains),
+            "reload_seconds": self.reload_seconds,
+            "running": self._task is not None and not self._task.done(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_seconds)
+            try:
+                async with self.session_factory() as session:
+                    await self.load(session)
+            except Exception as e:
+                print(f"Error reloading tenant domain index: {e}")
+
+    @staticmethod
+    def _labels(domain: str) -> List[str]:
+        labels = normalize_host(domain).split(".")
+        labels.reverse()
+        return labels
+
+    @classmethod
+    def _insert(cls, root: _Node, domains: Dict[UUID, str], tenant_id: UUID, domain: str) -> None:
+        labels = cls._labels(domain)
+        wildcard = labels[-1] == WILDCARD
+        if wildcard:
+            labels.pop()
+        if not labels or not all(labels):
+            print(f"Tenant {tenant_id} has no routable domain: {domain!r}")
+            return
+
+        node = root
+        for label in labels:
+            node = node.children.setdefault(label, _Node())
+        if wildcard:
+            node.wildcard_tenant_id = tenant_id
+        else:
+            node.tenant_id = tenant_id
+        domains[tenant_id] = domain
+
+    def _find(self, domain: str) -> Optional[_Node]:
+        labels = self._labels(domain)
+        if labels[-1] == WILDCARD:
+            labels.pop()
+        node = self._root
+        for label in labels:
+            node = node.children.get(label)
+            if node is None:
+                return None
+        return node
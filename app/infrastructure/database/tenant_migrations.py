@@ -0,0 +1,227 @@
+"""
+Run Alembic migrations across every tenant schema.
+
+    python -m app.infrastructure.database.tenant_migrations --workers 8
+
+Each tenant schema keeps its own ``alembic_version`` table, so schemas that
+are already at the target revision are skipped up front and a run that
+crashed halfway can simply be started again.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, pool, text
+from sqlalchemy.engine import Engine
+
+from app.shared.config import get_settings
+
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[3] / "alembic.ini"
+TENANT_SCHEMA_PATTERN = "tenant\\_%"
+VERSION_QUERY_CHUNK_SIZE = 500
+
+# Engine of the current worker process, created by _init_worker
+_worker_engine: Optional[Engine] = None
+
+
+def get_sync_database_url(database_url: Optional[str] = None) -> str:
+    """Alembic needs a synchronous driver, convert the async URL."""
+    db_url = database_url or get_settings().database_url
+    if db_url.startswith("sqlite+aiosqlite"):
+        db_url = db_url.replace("sqlite+aiosqlite", "sqlite")
+    elif db_url.startswith("postgresql+asyncpg"):
+        db_url = db_url.replace("postgresql+asyncpg", "postgresql+psycopg2")
+    return db_url
+
+
+def get_alembic_config(tenant_schema: Optional[str] = None):
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    config.attributes["tenant_schema"] = tenant_schema
+    return config
+
+
+@lru_cache()
+def get_head_revision() -> Optional[str]:
+    """Head revision of the migration scripts, None if they are not shipped."""
+    if not ALEMBIC_INI_PATH.exists():
+        return None
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+
+@lru_cache()
+def get_supported_revisions() -> Tuple[Optional[str], ...]:
+    """
+    Revisions the application runs against: head, and below a run of
+    contract revisions (``contract = True``: they only drop what the code no
+    longer uses) the revision they start from, so a release can roll out
+    before its contract migrations are applied.
+    """
+    if not ALEMBIC_INI_PATH.exists():
+        return (None,)
+    from alembic.script import ScriptDirectory
+
+    revisions = []
+    for script in ScriptDirectory.from_config(get_alembic_config()).walk_revisions():
+        revisions.append(script.revision)
+        if not getattr(script.module, "contract", False):
+            break
+    return tuple(revisions)
+
+
+def is_tenant_schema_migration() -> bool:
+    """True while a migration script runs against a tenant schema (public.tenants is shared)."""
+    from alembic import context
+
+    return bool(context.config.attributes.get("tenant_schema"))
+
+
+def migration_schema() -> str:
+    """
+    Schema the running migration targets. create_table/create_index follow
+    the schema_translate_map set up by env.py, but Alembic renders the schema
+    of add_column/alter_column/drop_column literally, so pass this instead of
+    'public' to those.
+    """
+    from alembic import context
+
+    return context.config.attributes.get("tenant_schema") or "public"
+
+
+def list_tenant_schemas(engine: Engine) -> List[str]:
+    with engine.connect() as connection:
+        result = connection.execute(
+            text("SELECT nspname FROM pg_namespace WHERE nspname LIKE :pattern ORDER BY nspname"),
+            {"pattern": TENANT_SCHEMA_PATTERN},
+        )
+        return [row[0] for row in result]
+
+
+def get_schema_versions(engine: Engine, schemas: List[str]) -> Dict[str, Optional[str]]:
+    """Current revision of every schema, fetched in a few UNION ALL queries."""
+    versions: Dict[str, Optional[str]] = {schema: None for schema in schemas}
+    with engine.connect() as connection:
+        result = connection.execute(
+            text(
+                "SELECT table_schema FROM information_schema.tables "
+                "WHERE table_name = 'alembic_version' AND table_schema LIKE :pattern"
+            ),
+            {"pattern": TENANT_SCHEMA_PATTERN},
+        )
+        versioned = [row[0] for row in result if row[0] in versions]
+
+        for start in range(0, len(versioned), VERSION_QUERY_CHUNK_SIZE):
+            chunk = versioned[start:start + VERSION_QUERY_CHUNK_SIZE]
+            query = " UNION ALL ".join(
+                f"SELECT '{schema}' AS schema_name, version_num FROM \"{schema}\".alembic_version"
+                for schema in chunk
+            )
+            for schema_name, version_num in connection.execute(text(query)):
+                versions[schema_name] = version_num
+    return versions
+
+
+def _init_worker(database_url: str) -> None:
+    global _worker_engine
+    _worker_engine = create_engine(database_url, poolclass=pool.NullPool)
+
+
+def migrate_schema(tenant_schema: str, revision: str, stamp_unversioned: Optional[str]) -> Tuple[str, float]:
+    """
+    Upgrade one schema. Runs in a worker process.
+
+    Alembic owns the transaction, so migrations that batch their backfill
+    with ``autocommit_block()`` can commit as they go.
+    """
+    from alembic import command
+
+    start = time.perf_counter()
+    config = get_alembic_config(tenant_schema)
+    with _worker_engine.connect() as connection:
+        config.attributes["connection"] = connection
+        unversioned = stamp_unversioned and not _has_version_table(connection, tenant_schema)
+        connection.commit()
+        if unversioned:
+            command.stamp(config, stamp_unversioned)
+        command.upgrade(config, revision)
+    return tenant_schema, time.perf_counter() - start
+
+
+def _has_version_table(connection, tenant_schema: str) -> bool:
+    result = connection.execute(
+        text(
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_schema = :schema AND table_name = 'alembic_version'"
+        ),
+        {"schema": tenant_schema},
+    )
+    return result.first() is not None
+
+
+def run(workers: int, revision: str = "head", stamp_unversioned: Optional[str] = None,
+        database_url: Optional[str] = None) -> int:
+    database_url = get_sync_database_url(database_url)
+    engine = create_engine(database_url, poolclass=pool.NullPool)
+
+    target = get_head_revision() if revision == "head" else revision
+    schemas = list_tenant_schemas(engine)
+    versions = get_schema_versions(engine, schemas)
+    engine.dispose()
+
+    pending = [schema for schema in schemas if versions[schema] != target]
+    print(f"{len(schemas)} tenant schemas, {len(schemas) - len(pending)} already at {target}, "
+          f"{len(pending)} to migrate with {workers} workers")
+    if not pending:
+        return 0
+
+    failures: List[Tuple[str, str]] = []
+    done = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(database_url,)) as executor:
+        futures = {
+            executor.submit(migrate_schema, schema, revision, stamp_unversioned): schema
+            for schema in pending
+        }
+        for future in as_completed(futures):
+            schema = futures[future]
+            done += 1
+            try:
+                future.result()
+            except Exception as e:
+                failures.append((schema, str(e)))
+                print(f"FAILED {schema}: {e}")
+
+            elapsed = time.perf_counter() - started
+            rate = done / elapsed if elapsed else 0.0
+            eta = (len(pending) - done) / rate if rate else 0.0
+            print(f"[{done}/{len(pending)}] {schema} - {rate:.1f} schemas/s, ETA {eta:.0f}s")
+
+    elapsed = time.perf_counter() - started
+    print(f"Migrated {done - len(failures)} schemas in {elapsed:.1f}s, {len(failures)} failed")
+    return 1 if failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Upgrade every tenant_* schema with Alembic")
+    parser.add_argument("--workers", type=int, default=4, help="worker processes (one connection each)")
+    parser.add_argument("--revision", default="head")
+    parser.add_argument(
+        "--stamp-unversioned",
+        metavar="REVISION",
+        help="stamp schemas without an alembic_version table at REVISION before upgrading",
+    )
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL")
+    args = parser.parse_args(argv)
+    return run(args.workers, args.revision, args.stamp_unversioned, args.database_url)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import Table, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.domain.entities.tenant import TenantStatus
+from app.domain.interfaces.tenant_provisioner import ITenantProvisioner
+from app.infrastructure.database.connection import get_tenant_schema_name
+from app.infrastructure.database.models import RefreshToken, Tenant, User
+from app.infrastructure.database.tenant_migrations import get_head_revision
+from app.infrastructure.database.tenant_registry import TenantRegistry
+
+# Tables that live in every tenant schema (public.tenants stays shared).
+TENANT_TABLES: List[Table] = [User.__table__, RefreshToken.__table__]
+
+
+def build_tenant_schema_ddl(dialect, tenant_schema: str, alembic_revision: Optional[str] = None) -> str:
+    """
+    CREATE SCHEMA plus every tenant table and index as a single script.
+
+    The tables are built from the current models, so the schema is stamped
+    with ``alembic_revision`` for the tenant migration runner to start from.
+    """
+    translate_map = {"public": tenant_schema}
+    statements = [f'CREATE SCHEMA IF NOT EXISTS "{tenant_schema}"']
+    for table in TENANT_TABLES:
+        statements.append(str(CreateTable(table).compile(
+            dialect=dialect, schema_translate_map=translate_map, render_schema_translate=True
+        )).strip())
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            statements.append(str(CreateIndex(index).compile(
+                dialect=dialect, schema_translate_map=translate_map, render_schema_translate=True
+            )).strip())
+    if alembic_revision:
+        statements.append(
+            f'CREATE TABLE "{tenant_schema}".alembic_version ('
+            f'version_num VARCHAR(32) NOT NULL, '
+            f'CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))'
+        )
+        statements.append(
+            f'INSERT INTO "{tenant_schema}".alembic_version (version_num) VALUES (\'{alembic_revision}\')'
+        )
+    return ";\n".join(statements) + ";"
+
+
+class TenantSchemaProvisioner(ITenantProvisioner):
+    """
+    Creates tenant schemas in background tasks so tenant creation returns
+    without waiting on DDL.
+
+    At most ``max_concurrency`` schemas are built at once. The schema, its
+    tables and the switch to ``ready`` commit in one transaction, so a crash
+    leaves the tenant in ``provisioning`` and ``resume`` picks it up again.
+    """
+
+    def __init__(self, engine: AsyncEngine, tenant_registry: TenantRegistry, max_concurrency: int = 4):
+        self.engine = engine
+        self.tenant_registry = tenant_registry
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def schedule(self, tenant_id: UUID) -> None:
+        self.tenant_registry.put(tenant_id, True, TenantStatus.PROVISIONING)
+        task = asyncio.create_task(self._provision(tenant_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def resume(self) -> int:
+        """Reschedule tenants left in provisioning by a previous process."""
+        async with self.engine.connect() as connection:
+            result = await connection.execute(
+                select(Tenant.id).where(Tenant.status == TenantStatus.PROVISIONING)
+            )
+            rows = result.all()
+        for row in rows:
+            self.schedule(row.id)
+        return len(rows)
+
+    async def shutdown(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _provision(self, tenant_id: UUID) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            tenant_schema = get_tenant_schema_name(tenant_id)
+            try:
+                async with self.engine.begin() as connection:
+                    await self._set_status(connection, tenant_id, TenantStatus.READY)
+                    await self._run_script(
+                        connection,
+                        build_tenant_schema_ddl(connection.dialect, tenant_schema, get_head_revision()),
+                    )
+            except Exception as e:
+                print(f"Error provisioning schema {tenant_schema}: {e}")
+                try:
+                    async with self.engine.begin() as connection:
+                        await self._set_status(connection, tenant_id, TenantStatus.FAILED)
+                except Exception as status_error:
+                    print(f"Error marking tenant {tenant_id} as failed: {status_error}")
+                self.tenant_registry.put(tenant_id, True, TenantStatus.FAILED)
+                return
+
+            # Re-read is_active from the database on the next request.
+            self.tenant_registry.invalidate(tenant_id)
+            print(f"Provisioned schema {tenant_schema}")
+
+    @staticmethod
+    async def _set_status(connection: AsyncConnection, tenant_id: UUID, status: TenantStatus) -> None:
+        await connection.execute(
+            update(Tenant)
+            .where(Tenant.id == tenant_id)
+            .values(status=status.value, updated_at=datetime.now(timezone.utc))
+        )
+
+    @staticmethod
+    async def _run_script(connection: AsyncConnection, script: str) -> None:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if hasattr(driver_connection, "execute") and connection.dialect.driver == "asyncpg":
+            # asyncpg runs a multi-statement script in a single round trip,
+            # inside the transaction already opened on this connection.
+            await driver_connection.execute(script)
+            return
+        for statement in script.split(";\n"):
+            await connection.exec_driver_sql(statement.rstrip(";"))
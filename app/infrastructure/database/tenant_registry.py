@@ -0,0 +1,122 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.domain.entities.tenant import TenantStatus
+from app.domain.interfaces.tenant_registry import ITenantRegistry, TenantRegistryEntry
+from app.infrastructure.database.connection import get_tenant_schema_name
+from app.infrastructure.database.models import Tenant
+
+
+# Tenants that are still provisioning are only cached briefly when they come
+# from the database, since another worker is the one that will flip them. The
+# same goes for any tenant read from a replica, which may lag the primary.
+NOT_READY_TTL_SECONDS = 1.0
+
+
+class TenantRegistry(ITenantRegistry):
+    """
+    Bounded LRU with TTL used by get_tenant_db to resolve a tenant without
+    touching the database.
+
+    The registry is per process: invalidation only reaches the worker that ran
+    the update, other workers pick the change up once the TTL expires.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 60.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, Tuple[TenantRegistryEntry, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, tenant_id: UUID) -> Optional[TenantRegistryEntry]:
+        item = self._entries.get(tenant_id)
+        if item is None:
+            self.misses += 1
+            return None
+
+        entry, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._entries[tenant_id]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(tenant_id)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        tenant_id: UUID,
+        is_active: bool,
+        status: TenantStatus = TenantStatus.READY,
+        ttl_seconds: Optional[float] = None,
+    ) -> TenantRegistryEntry:
+        entry = TenantRegistryEntry(
+            tenant_id=tenant_id,
+            schema=get_tenant_schema_name(tenant_id),
+            is_active=is_active,
+            status=TenantStatus(status),
+        )
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[tenant_id] = (entry, time.monotonic() + ttl)
+        self._entries.move_to_end(tenant_id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return entry
+
+    def invalidate(self, tenant_id: UUID) -> None:
+        self._entries.pop(tenant_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    async def load(
+        self, session: Union[AsyncSession, AsyncConnection], tenant_id: UUID, from_replica: bool = False
+    ) -> Optional[TenantRegistryEntry]:
+        """Resolve a miss from public.tenants and cache the result."""
+        result = await session.execute(
+            select(Tenant.id, Tenant.is_active, Tenant.status).where(Tenant.id == tenant_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        ttl = None if row.status == TenantStatus.READY and not from_replica else NOT_READY_TTL_SECONDS
+        return self.put(row.id, row.is_active, row.status, ttl_seconds=ttl)
+
+    async def warm(self, session: AsyncSession) -> int:
+        """Preload up to max_size tenants, active ones first."""
+        result = await session.execute(
+            select(Tenant.id, Tenant.is_active, Tenant.status)
+            .where(Tenant.status == TenantStatus.READY)
+            .order_by(Tenant.is_active.desc(), Tenant.updated_at.desc().nulls_last())
+            .limit(self.max_size)
+        )
+        rows = result.all()
+        for row in reversed(rows):
+            self.put(row.id, row.is_active, row.status)
+        return len(rows)
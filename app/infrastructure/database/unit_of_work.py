@@ -0,0 +1,34 @@
+from typing import Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.interfaces.unit_of_work import IUnitOfWork
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    """
+    Unit of work over the request's session: the repositories built on the
+    same session flush into its transaction, ``commit`` ends it with a
+    single COMMIT.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._on_commit: List[Callable[[], None]] = []
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        self._on_commit.append(callback)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            # The data is committed: a failing callback is reported, not raised
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error running on_commit callback {callback}: {e}")
+
+    async def rollback(self) -> None:
+        self._on_commit.clear()
+        await self.session.rollback()
@@ -1,7 +1,7 @@
 
 from fastapi_events.dispatcher import dispatch
 
-from app.domain.events.user_events import UserCreatedEvent, UserLoggedInEvent, UserUpdatedEvent
+from app.domain.events.user_events import UserCreatedEvent, UserLoggedInEvent, UserUpdatedEvent, UsersBulkCreatedEvent
 from app.domain.interfaces.event_dispatcher import EventDispatcher as IEventDispatcher
 from app.domain.events.tenant_events import TenantCreatedEvent, TenantUpdatedEvent, TenantDeletedEvent
 
@@ -12,6 +12,9 @@ class EventDispatcher(IEventDispatcher):
         
         dispatch("user.created", payload=event.__dict__)
     
+    def dispatch_users_bulk_created(self, event: UsersBulkCreatedEvent) -> None:
+        dispatch("user.bulk_created", payload=event.__dict__)
+    
     def dispatch_user_updated(self, event: UserUpdatedEvent) -> None:
     
         dispatch("user.updated", payload=event.__dict__)
@@ -1,6 +1,5 @@
 import json
 from typing import Any, Dict
-from aio_pika import connect, Message, ExchangeType
 from app.domain.interfaces.message_queue_service import IMessageQueueService
 from app.shared.config import Settings
 
@@ -14,6 +13,8 @@ class RabbitMQService(IMessageQueueService):
         self.exchange = None
     
     async def connect(self) -> None:
+        # aio_pika is imported on first use to keep it off the import path of the app
+        from aio_pika import connect, ExchangeType
        
         try:
             self.connection = await connect(self.settings.rabbitmq_url)
@@ -52,6 +53,7 @@ class RabbitMQService(IMessageQueueService):
             print(f"Error disconnecting from RabbitMQ: {e}")
     
     async def publish(self, routing_key: str, message: Dict[str, Any]) -> None:
+        from aio_pika import Message
         
         if not self.exchange:
             await self.connect()
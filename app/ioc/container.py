@@ -2,7 +2,15 @@
 from dependency_injector import containers, providers
 from fastapi_events.handlers.local import local_handler
 
-from app.application.use_cases.user_use_cases import CreateUserUseCase, GetUserUseCase, LoginUseCase, UpdateUserUseCase, RefreshTokenUseCase
+from app.application.use_cases.user_use_cases import (
+    BulkCreateUsersUseCase,
+    CreateUserUseCase,
+    GetUserUseCase,
+    ListUsersUseCase,
+    LoginUseCase,
+    UpdateUserUseCase,
+    RefreshTokenUseCase,
+)
 from app.application.use_cases.tenant_use_cases import (
     CreateTenantUseCase,
     GetTenantUseCase,
@@ -10,16 +18,24 @@ from app.application.use_cases.tenant_use_cases import (
     ListTenantsUseCase,
     DeleteTenantUseCase
 )
+from app.application.handlers.tenant_event_handlers import TenantDomainIndexEventHandler
 from app.application.handlers.user_event_handlers import (
+    UsersBulkCreatedEventHandler,
     UserCreatedEventHandler,
     UserUpdatedEventHandler,
     UserLoggedInEventHandler,
 )
 from app.infrastructure.authentication.token_service import TokenService
-from app.infrastructure.database.connection import get_db_session
+from app.infrastructure.database.connection import async_session_factory, engine, get_db_session, get_replica_db_session
 from app.infrastructure.database.repositories.user_repository import UserRepositoryImpl
 from app.infrastructure.database.repositories.tenant_repository import TenantRepository
 from app.infrastructure.database.repositories.refresh_token_repository import RefreshTokenRepositoryImpl
+from app.infrastructure.database.refresh_token_sweeper import RefreshTokenSweeper
+from app.infrastructure.database.row_counts import RowCounter
+from app.infrastructure.database.tenant_domain_index import TenantDomainIndex
+from app.infrastructure.database.tenant_registry import TenantRegistry
+from app.infrastructure.database.tenant_provisioning import TenantSchemaProvisioner
+from app.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
 from app.infrastructure.events.event_dispatcher import EventDispatcher
 from app.infrastructure.external_services.resend_email_service import ResendEmailService
 from app.infrastructure.external_services.rabbitmq_service import RabbitMQService
@@ -38,10 +54,32 @@ class Container(containers.DeclarativeContainer):
     
     db_session = providers.Resource(get_db_session)
     
+    # Read-only use cases are served by the replica (the primary when none is configured)
+    read_db_session = providers.Resource(get_replica_db_session)
+    
    
+    cursor_pagination_helper = providers.Singleton(
+        CursorPaginationHelper,
+        secret_key=settings.provided.cursor_secret_key,
+    )
+    
+    row_counter = providers.Singleton(
+        RowCounter,
+        ttl_seconds=settings.provided.total_count_cache_ttl_seconds,
+    )
+    
     user_repository = providers.Factory(
         UserRepositoryImpl,
         session=db_session,
+        pagination_helper=cursor_pagination_helper,
+        row_counter=row_counter,
+    )
+    
+    read_user_repository = providers.Factory(
+        UserRepositoryImpl,
+        session=read_db_session,
+        pagination_helper=cursor_pagination_helper,
+        row_counter=row_counter,
     )
     
     refresh_token_repository = providers.Factory(
@@ -49,6 +87,12 @@ class Container(containers.DeclarativeContainer):
         session=db_session,
     )
     
+    # One transaction per write use case, over the repositories' session
+    unit_of_work = providers.Factory(
+        SqlAlchemyUnitOfWork,
+        session=db_session,
+    )
+    
     token_service = providers.Singleton(TokenService, settings=settings)
 
     
@@ -56,23 +100,57 @@ class Container(containers.DeclarativeContainer):
         LoginUseCase, 
         user_repository=user_repository, 
         token_service=token_service,
-        refresh_token_repository=refresh_token_repository
+        refresh_token_repository=refresh_token_repository,
+        unit_of_work=unit_of_work,
     )
     
     refresh_token_use_case = providers.Factory(
         RefreshTokenUseCase,
         user_repository=user_repository,
         token_service=token_service,
-        refresh_token_repository=refresh_token_repository
+        refresh_token_repository=refresh_token_repository,
+        unit_of_work=unit_of_work,
     )
     
-    
-    cursor_pagination_helper = providers.Singleton(CursorPaginationHelper)
-    
     tenant_repository = providers.Factory(
         TenantRepository,
         session=db_session,
         pagination_helper=cursor_pagination_helper,
+        row_counter=row_counter,
+    )
+    
+    read_tenant_repository = providers.Factory(
+        TenantRepository,
+        session=read_db_session,
+        pagination_helper=cursor_pagination_helper,
+        row_counter=row_counter,
+    )
+    
+    tenant_registry = providers.Singleton(
+        TenantRegistry,
+        max_size=settings.provided.tenant_registry_max_size,
+        ttl_seconds=settings.provided.tenant_registry_ttl_seconds,
+    )
+    
+    tenant_domain_index = providers.Singleton(
+        TenantDomainIndex,
+        session_factory=providers.Object(async_session_factory),
+        reload_seconds=settings.provided.tenant_domain_index_reload_seconds,
+    )
+    
+    tenant_provisioner = providers.Singleton(
+        TenantSchemaProvisioner,
+        engine=providers.Object(engine),
+        tenant_registry=tenant_registry,
+        max_concurrency=settings.provided.tenant_provisioning_concurrency,
+    )
+    
+    refresh_token_sweeper = providers.Singleton(
+        RefreshTokenSweeper,
+        engine=providers.Object(engine),
+        interval_seconds=settings.provided.refresh_token_sweep_interval_seconds,
+        batch_size=settings.provided.refresh_token_sweep_batch_size,
+        pause_seconds=settings.provided.refresh_token_sweep_pause_seconds,
     )
     
     
@@ -95,6 +173,12 @@ class Container(containers.DeclarativeContainer):
         message_queue_service=rabbitmq_service,
     )
     
+    users_bulk_created_event_handler = providers.Factory(
+        UsersBulkCreatedEventHandler,
+        email_service=email_service,
+        message_queue_service=rabbitmq_service,
+    )
+    
     user_updated_event_handler = providers.Factory(
         UserUpdatedEventHandler,
         email_service=email_service,
@@ -107,55 +191,87 @@ class Container(containers.DeclarativeContainer):
         email_service=email_service,
     )
     
+    tenant_domain_index_event_handler = providers.Factory(
+        TenantDomainIndexEventHandler,
+        tenant_domain_index=tenant_domain_index,
+    )
+    
     # Use Cases
     create_user_use_case = providers.Factory(
         CreateUserUseCase,
         user_repository=user_repository,
         event_dispatcher=event_dispatcher,
+        unit_of_work=unit_of_work,
+    )
+    
+    bulk_create_users_use_case = providers.Factory(
+        BulkCreateUsersUseCase,
+        user_repository=user_repository,
+        token_service=token_service,
+        event_dispatcher=event_dispatcher,
+        unit_of_work=unit_of_work,
+        batch_size=settings.provided.bulk_import_batch_size,
     )
     
     get_user_use_case = providers.Factory(
         GetUserUseCase,
-        user_repository=user_repository,
+        user_repository=read_user_repository,
+    )
+    
+    list_users_use_case = providers.Factory(
+        ListUsersUseCase,
+        user_repository=read_user_repository,
     )
     
     update_user_use_case = providers.Factory(
         UpdateUserUseCase,
         user_repository=user_repository,
         event_dispatcher=event_dispatcher,
+        unit_of_work=unit_of_work,
     )
     
     # Tenant Use Cases
     create_tenant_use_case = providers.Factory(
         CreateTenantUseCase,
         tenant_repository=tenant_repository,
+        unit_of_work=unit_of_work,
+        tenant_provisioner=tenant_provisioner,
+        event_dispatcher=event_dispatcher,
     )
     
     get_tenant_use_case = providers.Factory(
         GetTenantUseCase,
-        tenant_repository=tenant_repository,
+        tenant_repository=read_tenant_repository,
     )
     
     update_tenant_use_case = providers.Factory(
         UpdateTenantUseCase,
         tenant_repository=tenant_repository,
+        unit_of_work=unit_of_work,
+        tenant_registry=tenant_registry,
+        event_dispatcher=event_dispatcher,
     )
     
     list_tenants_use_case = providers.Factory(
         ListTenantsUseCase,
-        tenant_repository=tenant_repository,
+        tenant_repository=read_tenant_repository,
     )
     
     delete_tenant_use_case = providers.Factory(
         DeleteTenantUseCase,
         tenant_repository=tenant_repository,
+        unit_of_work=unit_of_work,
+        tenant_registry=tenant_registry,
+        event_dispatcher=event_dispatcher,
     )
 
 
 # Helper functions to create repositories with custom session
-def create_user_repository_with_session(session: AsyncSession) -> UserRepositoryImpl:
+def create_user_repository_with_session(
+    session: AsyncSession, pagination_helper: CursorPaginationHelper = None, row_counter: RowCounter = None
+) -> UserRepositoryImpl:
     """Create user repository with a specific session."""
-    return UserRepositoryImpl(session=session)
+    return UserRepositoryImpl(session=session, pagination_helper=pagination_helper, row_counter=row_counter)
 
 
 def create_refresh_token_repository_with_session(session: AsyncSession) -> RefreshTokenRepositoryImpl:
@@ -163,12 +279,18 @@ def create_refresh_token_repository_with_session(session: AsyncSession) -> Refre
     return RefreshTokenRepositoryImpl(session=session)
 
 
+def create_unit_of_work_with_session(session: AsyncSession) -> SqlAlchemyUnitOfWork:
+    """Create a unit of work over a specific session."""
+    return SqlAlchemyUnitOfWork(session=session)
+
+
 def create_tenant_repository_with_session(container: Container, session: AsyncSession) -> TenantRepository:
     """Create tenant repository with a specific session."""
     pagination_helper = container.cursor_pagination_helper()
     return TenantRepository(
         session=session,
-        pagination_helper=pagination_helper
+        pagination_helper=pagination_helper,
+        row_counter=container.row_counter(),
     )
 
 
@@ -177,7 +299,23 @@ def get_create_user_use_case_with_session(container: Container, session: AsyncSe
     """Get create user use case with a specific session."""
     user_repo = create_user_repository_with_session(session)
     event_dispatcher = container.event_dispatcher()
-    return CreateUserUseCase(user_repository=user_repo, event_dispatcher=event_dispatcher)
+    return CreateUserUseCase(
+        user_repository=user_repo,
+        event_dispatcher=event_dispatcher,
+        unit_of_work=create_unit_of_work_with_session(session),
+    )
+
+
+def get_bulk_create_users_use_case_with_session(container: Container, session: AsyncSession) -> BulkCreateUsersUseCase:
+    """Get bulk create users use case with a specific session."""
+    user_repo = create_user_repository_with_session(session)
+    return BulkCreateUsersUseCase(
+        user_repository=user_repo,
+        token_service=container.token_service(),
+        event_dispatcher=container.event_dispatcher(),
+        unit_of_work=create_unit_of_work_with_session(session),
+        batch_size=container.settings().bulk_import_batch_size,
+    )
 
 
 def get_get_user_use_case_with_session(container: Container, session: AsyncSession) -> GetUserUseCase:
@@ -186,11 +324,23 @@ def get_get_user_use_case_with_session(container: Container, session: AsyncSessi
     return GetUserUseCase(user_repository=user_repo)
 
 
+def get_list_users_use_case_with_session(container: Container, session: AsyncSession) -> ListUsersUseCase:
+    """Get list users use case with a specific session."""
+    user_repo = create_user_repository_with_session(
+        session, container.cursor_pagination_helper(), container.row_counter()
+    )
+    return ListUsersUseCase(user_repository=user_repo)
+
+
 def get_update_user_use_case_with_session(container: Container, session: AsyncSession) -> UpdateUserUseCase:
     """Get update user use case with a specific session."""
     user_repo = create_user_repository_with_session(session)
     event_dispatcher = container.event_dispatcher()
-    return UpdateUserUseCase(user_repository=user_repo, event_dispatcher=event_dispatcher)
+    return UpdateUserUseCase(
+        user_repository=user_repo,
+        event_dispatcher=event_dispatcher,
+        unit_of_work=create_unit_of_work_with_session(session),
+    )
 
 
 def get_login_use_case_with_session(container: Container, session: AsyncSession) -> LoginUseCase:
@@ -203,7 +353,8 @@ def get_login_use_case_with_session(container: Container, session: AsyncSession)
         user_repository=user_repo,
         token_service=token_service,
         refresh_token_repository=refresh_token_repo,
-        event_dispatcher=event_dispatcher
+        event_dispatcher=event_dispatcher,
+        unit_of_work=create_unit_of_work_with_session(session),
     )
 
 
@@ -215,7 +366,8 @@ def get_refresh_token_use_case_with_session(container: Container, session: Async
     return RefreshTokenUseCase(
         user_repository=user_repo,
         token_service=token_service,
-        refresh_token_repository=refresh_token_repo
+        refresh_token_repository=refresh_token_repo,
+        unit_of_work=create_unit_of_work_with_session(session),
     )
 
 
@@ -223,7 +375,12 @@ def get_refresh_token_use_case_with_session(container: Container, session: Async
 def get_create_tenant_use_case_with_session(container: Container, session: AsyncSession) -> CreateTenantUseCase:
     """Get create tenant use case with a specific session."""
     tenant_repo = create_tenant_repository_with_session(container, session)
-    return CreateTenantUseCase(tenant_repository=tenant_repo)
+    return CreateTenantUseCase(
+        tenant_repository=tenant_repo,
+        unit_of_work=create_unit_of_work_with_session(session),
+        tenant_provisioner=container.tenant_provisioner(),
+        event_dispatcher=container.event_dispatcher(),
+    )
 
 
 def get_get_tenant_use_case_with_session(container: Container, session: AsyncSession) -> GetTenantUseCase:
@@ -235,7 +392,12 @@ def get_get_tenant_use_case_with_session(container: Container, session: AsyncSes
 def get_update_tenant_use_case_with_session(container: Container, session: AsyncSession) -> UpdateTenantUseCase:
     """Get update tenant use case with a specific session."""
     tenant_repo = create_tenant_repository_with_session(container, session)
-    return UpdateTenantUseCase(tenant_repository=tenant_repo)
+    return UpdateTenantUseCase(
+        tenant_repository=tenant_repo,
+        unit_of_work=create_unit_of_work_with_session(session),
+        tenant_registry=container.tenant_registry(),
+        event_dispatcher=container.event_dispatcher(),
+    )
 
 
 def get_list_tenants_use_case_with_session(container: Container, session: AsyncSession) -> ListTenantsUseCase:
@@ -247,7 +409,12 @@ def get_list_tenants_use_case_with_session(container: Container, session: AsyncS
 def get_delete_tenant_use_case_with_session(container: Container, session: AsyncSession) -> DeleteTenantUseCase:
     """Get delete tenant use case with a specific session."""
     tenant_repo = create_tenant_repository_with_session(container, session)
-    return DeleteTenantUseCase(tenant_repository=tenant_repo)
+    return DeleteTenantUseCase(
+        tenant_repository=tenant_repo,
+        unit_of_work=create_unit_of_work_with_session(session),
+        tenant_registry=container.tenant_registry(),
+        event_dispatcher=container.event_dispatcher(),
+    )
 
 
 def register_event_handlers(container: Container):
@@ -257,6 +424,11 @@ def register_event_handlers(container: Container):
         handler = container.user_created_event_handler()
         await handler.handle(event)
     
+    @local_handler.register(event_name="user.bulk_created")
+    async def handle_users_bulk_created(event):
+        handler = container.users_bulk_created_event_handler()
+        await handler.handle(event)
+    
     @local_handler.register(event_name="user.updated")
     async def handle_user_updated(event):
         handler = container.user_updated_event_handler()
@@ -267,6 +439,13 @@ def register_event_handlers(container: Container):
         handler = container.user_logged_in_event_handler()
         await handler.handle(event)
     
+    @local_handler.register(event_name="tenant.created")
+    @local_handler.register(event_name="tenant.updated")
+    @local_handler.register(event_name="tenant.deleted")
+    async def handle_tenant_domain_changed(event):
+        handler = container.tenant_domain_index_event_handler()
+        await handler.handle(event)
+    
     @local_handler.register(event_name="*")
     async def handle_all_events(event) -> None:
         event_name, payload = event
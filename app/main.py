@@ -1,4 +1,5 @@
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,11 +10,23 @@ import traceback
 import sys
 from app.api.routes.user_routes import router as user_router
 from app.api.routes.tenant_routes import router as tenant_router
-from app.ioc.container import Container, register_event_handlers
+from app.api.routes.internal_routes import router as internal_router
+from app.ioc.container import register_event_handlers
 from app.infrastructure.database.connection import (
+    async_session_factory,
+    check_schema_version,
     create_db_and_tables,
     close_db_connections,
 )
+from app.infrastructure.database.dependencies import _get_container
+from app.infrastructure.database.connection import has_read_replica
+from app.infrastructure.database.tenant_migrations import get_supported_revisions
+from app.infrastructure.database.query_counter import QUERY_COUNT_HEADER, start_query_count
+from app.infrastructure.database.read_routing import (
+    READ_YOUR_WRITES_HEADER,
+    SAFE_METHODS,
+    issue_read_your_writes_token,
+)
 from fastapi_events.handlers.local import local_handler
 from app.shared.config import get_settings
 import uvicorn
@@ -21,18 +34,80 @@ import uvicorn
 settings = get_settings()
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    container = Container()
+async def _connect_rabbitmq(container) -> None:
     try:
         rabbitmq_service = container.rabbitmq_service()
         await rabbitmq_service.connect()
     except Exception as e:
         print(f"Warning: Could not connect to RabbitMQ: {e}")
+
+
+async def _prepare_database(container) -> None:
+    if settings.database_startup_mode == "check_version":
+        revision = await check_schema_version(get_supported_revisions())
+        print(f"Database schema at revision {revision}")
+    else:
+        await create_db_and_tables()
+    
+    try:
+        async with async_session_factory() as session:
+            warmed = await container.tenant_registry().warm(session)
+        print(f"Tenant registry warmed with {warmed} tenants")
+    except Exception as e:
+        print(f"Warning: Could not warm tenant registry: {e}")
+    
+    if settings.tenant_host_routing_enabled:
+        try:
+            async with async_session_factory() as session:
+                indexed = await container.tenant_domain_index().load(session)
+            print(f"Tenant domain index loaded with {indexed} domains")
+        except Exception as e:
+            print(f"Warning: Could not load tenant domain index: {e}")
+    
+    try:
+        resumed = await container.tenant_provisioner().resume()
+        if resumed:
+            print(f"Resumed provisioning for {resumed} tenants")
+    except Exception as e:
+        print(f"Warning: Could not resume tenant provisioning: {e}")
+
+
+async def _startup(app: FastAPI, container) -> None:
+    """RabbitMQ and database warmup run concurrently; /ready flips once both are done."""
+    try:
+        await asyncio.gather(_connect_rabbitmq(container), _prepare_database(container))
+    except Exception as e:
+        app.state.startup_error = str(e)
+        print(f"Error during startup: {e}")
+        return
+    app.state.ready = True
+    
+    if settings.refresh_token_sweep_enabled:
+        container.refresh_token_sweeper().start()
+    if settings.tenant_host_routing_enabled:
+        container.tenant_domain_index().start()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    container = _get_container()
+    app.state.ready = False
+    app.state.startup_error = None
+    
+    # The server starts accepting connections right away (/health answers),
+    # traffic should be routed once /ready returns 200.
+    startup_task = asyncio.create_task(_startup(app, container))
     
-    await create_db_and_tables()
     yield
     
+    if not startup_task.done():
+        startup_task.cancel()
+    await asyncio.gather(startup_task, return_exceptions=True)
+    
+    await container.tenant_provisioner().shutdown()
+    await container.refresh_token_sweeper().shutdown()
+    await container.tenant_domain_index().shutdown()
+    
     try:
         rabbitmq_service = container.rabbitmq_service()
         await rabbitmq_service.disconnect()
@@ -43,7 +118,7 @@ async def lifespan(app: FastAPI):
 
 
 def create_app() -> FastAPI:
-    container = Container()
+    container = _get_container()
     register_event_handlers(container)
 
     app = FastAPI(
@@ -59,9 +134,11 @@ def create_app() -> FastAPI:
             sys.stdout.flush()
             print(f"\n{'='*60}", flush=True)
             print(f"🌐 REQUEST: {request.method} {request.url.path}", flush=True)
+            query_count = start_query_count()
             try:
                 response = await call_next(request)
-                print(f"✅ RESPONSE: {response.status_code}", flush=True)
+                response.headers[QUERY_COUNT_HEADER] = str(query_count.count)
+                print(f"✅ RESPONSE: {response.status_code} ({query_count.count} queries)", flush=True)
                 print(f"{'='*60}\n", flush=True)
                 return response
             except Exception as inner_e:
@@ -77,12 +154,34 @@ def create_app() -> FastAPI:
             print(f"{'='*60}\n", flush=True)
             raise
 
+    if settings.tenant_host_routing_enabled:
+        tenant_domain_index = container.tenant_domain_index()
+
+        @app.middleware("http")
+        async def route_tenant_by_host(request: Request, call_next):
+            # An explicit X-Tenant-ID wins; otherwise the Host header picks
+            # the tenant from the in-memory domain index, no query involved.
+            if "x-tenant-id" not in request.headers:
+                tenant_id = tenant_domain_index.resolve(request.headers.get("host", ""))
+                if tenant_id is not None:
+                    request.state.tenant_id = str(tenant_id)
+            return await call_next(request)
+
+    if has_read_replica():
+        @app.middleware("http")
+        async def read_your_writes(request: Request, call_next):
+            response = await call_next(request)
+            if request.method not in SAFE_METHODS and response.status_code < 400:
+                response.headers[READ_YOUR_WRITES_HEADER] = issue_read_your_writes_token()
+            return response
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[READ_YOUR_WRITES_HEADER, QUERY_COUNT_HEADER, "ETag"],
     )
 
     if settings.events_enabled:
@@ -119,11 +218,26 @@ def create_app() -> FastAPI:
 
     app.include_router(user_router)
     app.include_router(tenant_router)
+    if settings.internal_endpoints_enabled:
+        app.include_router(internal_router)
 
     @app.get("/health")
     async def health_check():
         return {"status": "healthy", "app": settings.app_name}
 
+    @app.get("/ready")
+    async def readiness_check():
+        if getattr(app.state, "ready", False):
+            return {"status": "ready"}
+        startup_error = getattr(app.state, "startup_error", None)
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "failed" if startup_error else "starting",
+                "detail": startup_error,
+            },
+        )
+
     return app
 
 
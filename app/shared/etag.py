@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def make_etag(entity_id: UUID, version: datetime) -> str:
+    """
+    Strong ETag of an entity state from its id and ``updated_at``: every
+    change to a user or tenant moves ``updated_at``, so equal tags mean an
+    identical representation.
+    """
+    if version.tzinfo is None:
+        version = version.replace(tzinfo=timezone.utc)
+    return f'"{entity_id.hex}.{(version - _EPOCH) // _MICROSECOND:x}"'
+
+
+def etag_matches(header: Optional[str], etag: str, weak: bool) -> bool:
+    """
+    Whether an If-None-Match (``weak=True``) or If-Match (``weak=False``)
+    header value matches ``etag``. ``*`` matches any current representation;
+    strong comparison never matches a ``W/`` tag.
+    """
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
@@ -11,6 +11,14 @@ class PaginationDirection(str, Enum):
     BACKWARD = "backward"
 
 
+class TotalCountMode(str, Enum):
+    """How list endpoints fill in total_count."""
+
+    NONE = "none"
+    ESTIMATE = "estimate"  # planner statistics, no scan
+    EXACT = "exact"  # COUNT(*), cached briefly
+
+
 class ICursorPaginationHelper(ABC):
     """Interface for cursor-based pagination operations."""
 
@@ -49,6 +57,31 @@ class ICursorPaginationHelper(ABC):
         """Apply cursor pagination logic to query results."""
         pass
 
+    @abstractmethod
+    def build_keyset_query(
+        self,
+        query: Any,
+        model_class: Type[Any],
+        key_selectors: List[str],
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        direction: PaginationDirection = PaginationDirection.FORWARD,
+    ) -> Any:
+        """Build a query paginated on a composite key (e.g. created_at, id)."""
+        pass
+
+    @abstractmethod
+    def apply_keyset_pagination_to_query_result(
+        self,
+        items: List[Any],
+        key_selectors: List[str],
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        direction: PaginationDirection = PaginationDirection.FORWARD,
+    ) -> Any:
+        """Apply keyset pagination logic to query results."""
+        pass
+
 
 class CursorPagedResult(BaseModel, Generic[T]):
     items: List[T] = Field(default_factory=list)
@@ -57,6 +90,8 @@ class CursorPagedResult(BaseModel, Generic[T]):
     has_next_page: bool = False
     has_previous_page: bool = False
     page_size: int = 10
+    total_count: Optional[int] = None
+    total_is_estimate: bool = False
 
     @staticmethod
     def from_entity(
@@ -1,8 +1,10 @@
+from uuid import UUID
 from httpx import AsyncClient
 import pytest
 from fastapi import status
 
 from app.application.dtos.tenant_dtos import CursorPagedTenantResponse
+from app.infrastructure.database.dependencies import _get_container
 
 
 class TestListCreateTenants:
@@ -65,7 +67,35 @@ class TestGetUpdateDeleteTenants:
         assert response.json()["name"] == "test2"
         assert response.json()["domain"] == "test2.com"
 
+    @pytest.mark.asyncio
+    async def test_tenant_conditional_requests(self, client: AsyncClient, create_tenant):
+        url = self.url.format(tenant_id=create_tenant.id)
+        etag = (await client.get(url=url)).headers["ETag"]
+        response = await client.get(url=url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        response = await client.put(url=url, json={"name": "Renamed"}, headers={"If-Match": '"stale"'})
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        response = await client.put(url=url, json={"name": "Renamed"}, headers={"If-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+    
     @pytest.mark.asyncio
     async def test_delete_tenant(self, client: AsyncClient, create_tenant):
         response = await client.delete(self.url.format(tenant_id=create_tenant.id))
         assert response.status_code == status.HTTP_204_NO_CONTENT
+    
+    @pytest.mark.asyncio
+    async def test_tenant_domain_index_follows_events(self, client: AsyncClient):
+        index = _get_container().tenant_domain_index()
+        response = await client.post("/tenants/", json={"name": "acme", "domain": "*.acme.test"})
+        tenant_id = UUID(response.json()["id"])
+        assert index.resolve("shop.acme.test:8000") == tenant_id
+        assert index.resolve("Deep.Shop.ACME.test") == tenant_id
+        assert index.resolve("acme.test") is None
+        
+        await client.put(self.url.format(tenant_id=tenant_id), json={"domain": "acme.test"})
+        assert index.resolve("acme.test") == tenant_id
+        assert index.resolve("shop.acme.test") is None
+        
+        await client.delete(self.url.format(tenant_id=tenant_id))
+        assert index.resolve("acme.test") is None
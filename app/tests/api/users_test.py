@@ -1,7 +1,20 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from uuid import uuid4
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.application.extensions.pagination import CursorPaginationHelper
+from app.infrastructure.database.connection import get_tenant_db_session
+from app.infrastructure.database.models import User
+from app.infrastructure.database.row_counts import RowCounter
+from app.ioc.container import create_user_repository_with_session
+from app.shared.pagination import TotalCountMode
+from app.tests.conftest import UserFactory
 
 
 class TestCreateUsers:
@@ -52,6 +65,186 @@ class TestCreateUsers:
         assert response2.status_code == status.HTTP_400_BAD_REQUEST
         assert "already exists" in response2.json()["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_create_user_duplicate_username(self, client: AsyncClient, create_user):
+        username = create_user.username
+        response = await client.post(
+            url=self.url,
+            json={
+                "email": "other@test.com",
+                "username": username,
+                "password": "test",
+            },
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == f"User with username {username} already exists"
+
+
+class TestBulkCreateUsers:
+    url = "/users/bulk"
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_users_ndjson(self, client: AsyncClient):
+        body = "\n".join([
+            '{"email": "bulk1@test.com", "username": "bulk1", "password": "test"}',
+            '{"email": "bulk2@test.com", "username": "bulk2"}',
+            '{"email": "bulk1@test.com", "username": "bulk3", "password": "test"}',
+            '{"email": "bulk4@test.com", "username": "bulk4", "password": "test", "full_name": "Bulk"}',
+        ])
+        response = await client.post(
+            url=self.url,
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["received"] == 4
+        assert data["created"] == 2
+        assert [error["line"] for error in data["errors"]] == [2, 3]
+        assert "already exists" in data["errors"][1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_users_csv(self, client: AsyncClient):
+        body = "email,username,password,full_name\ncsv1@test.com,csv1,test,\ncsv2@test.com,csv2,test,\"Doe, Jane\"\n"
+        response = await client.post(
+            url=self.url,
+            content=body,
+            headers={"Content-Type": "text/csv"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_users_unsupported_media_type(self, client: AsyncClient):
+        response = await client.post(url=self.url, json=[])
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+class TestListUsers:
+    url = "/users/"
+
+    @pytest.mark.asyncio
+    async def test_list_users_pages_through_ties(self, client: AsyncClient, db_session):
+        # Same created_at on every row: the id tie-breaker keeps the pages disjoint
+        UserFactory._meta.sqlalchemy_session = db_session
+        created_at = datetime.now(timezone.utc)
+        for i in range(5):
+            await UserFactory.create_async(
+                id=uuid4(), email=f"list{i}@test.com", username=f"list{i}", created_at=created_at
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"page_size": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(url=self.url, params=params)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if not data["has_next_page"]:
+                break
+
+        assert len(seen) == 5
+        assert seen == sorted(seen)
+
+        response = await client.get(url=self.url, params={"page_size": 10, "direction": "backward"})
+        assert [item["id"] for item in response.json()["items"]] == list(reversed(seen))
+
+    @pytest.mark.asyncio
+    async def test_list_users_include_total(self, client: AsyncClient, create_user):
+        response = await client.get(url=self.url)
+        assert response.json()["total_count"] is None
+
+        response = await client.get(url=self.url, params={"include_total": "exact"})
+        data = response.json()
+        assert data["total_count"] == 1
+        assert data["total_is_estimate"] is False
+
+        response = await client.get(url=self.url, params={"include_total": "estimate"})
+        data = response.json()
+        assert isinstance(data["total_count"], int)
+        assert data["total_is_estimate"] is True
+
+    @pytest.mark.asyncio
+    async def test_list_users_with_permission(self, client: AsyncClient, create_user, db_session):
+        UserFactory._meta.sqlalchemy_session = db_session
+        await UserFactory.create_async(
+            id=uuid4(), email="readonly@test.com", username="readonly", permissions=["read"]
+        )
+
+        response = await client.get(url=self.url, params={"permission": "write", "include_total": "exact"})
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["email"] for item in data["items"]] == ["test@test.com"]
+        assert data["total_count"] == 1
+
+        response = await client.get(url=self.url, params={"permission": "read"})
+        assert len(response.json()["items"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_list_users_totals_alternating_tenant_and_public(
+        self, tenant_engine, tenant_schema, create_user
+    ):
+        # The public sessions get the connection whose search_path the tenant
+        # session left pinned to the tenant schema.
+        session_factory = async_sessionmaker(tenant_engine, expire_on_commit=False)
+        async with tenant_engine.begin() as connection:
+            await connection.execution_options(schema_translate_map={"public": tenant_schema})
+            await connection.run_sync(User.__table__.create)
+
+        tenant_session = asynccontextmanager(get_tenant_db_session)
+        row_counter = RowCounter()
+
+        async def list_total(tenant: bool, include_total: TotalCountMode) -> int:
+            sessions = tenant_session(tenant_schema, session_factory) if tenant else session_factory()
+            async with sessions as session:
+                repository = create_user_repository_with_session(session, row_counter=row_counter)
+                return (await repository.list_all(include_total=include_total)).total_count
+
+        async with tenant_session(tenant_schema, session_factory) as session:
+            session.add_all([
+                User(id=uuid4(), email=f"tenant{i}@test.com", username=f"tenant{i}") for i in range(2)
+            ])
+            await session.commit()
+
+        for _ in range(2):
+            assert await list_total(True, TotalCountMode.EXACT) == 2
+            assert await list_total(False, TotalCountMode.EXACT) == 1
+
+        async with tenant_engine.begin() as connection:
+            await connection.execute(text(f'ANALYZE "{tenant_schema}".users'))
+            await connection.execute(text("ANALYZE public.users"))
+        assert await list_total(True, TotalCountMode.ESTIMATE) == 2
+        assert await list_total(False, TotalCountMode.ESTIMATE) == 1
+
+    @pytest.mark.asyncio
+    async def test_list_users_invalid_cursor(self, client: AsyncClient):
+        response = await client.get(url=self.url, params={"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        forged = CursorPaginationHelper(secret_key="not-the-server-key").encode_cursor(
+            [datetime.now(timezone.utc), uuid4()]
+        )
+        response = await client.get(url=self.url, params={"cursor": forged})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestTenantIsolation:
+
+    @pytest.mark.asyncio
+    async def test_tenant_schema_missing_a_table_does_not_fall_back_to_public(
+        self, tenant_engine, tenant_schema, create_user
+    ):
+        # tenant_schema has no users table (a tenant migration that has not
+        # reached it yet): public.users must not answer in its place
+        tenant_session = asynccontextmanager(get_tenant_db_session)
+        async with tenant_session(tenant_schema, async_sessionmaker(tenant_engine)) as session:
+            with pytest.raises(ProgrammingError, match="does not exist"):
+                await session.execute(select(User.id))
+
 
 class TestUpdateDeleteUsers:
     url = "/users/{user_id}"
@@ -73,6 +266,62 @@ class TestUpdateDeleteUsers:
         assert data["full_name"] == "Updated Name"
         assert data["id"] == str(create_user.id)
 
+    @pytest.mark.asyncio
+    async def test_update_user_without_changes(self, client: AsyncClient, create_user):
+        url = self.url.format(user_id=create_user.id)
+        response = await client.put(url=url, json={"full_name": "Partial"})
+        assert response.status_code == status.HTTP_200_OK
+        first = response.json()
+        assert first["full_name"] == "Partial"
+        assert first["email"] == "test@test.com"
+
+        # Same value again: nothing is written, updated_at stays put
+        response = await client.put(url=url, json={"full_name": "Partial"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["updated_at"] == first["updated_at"]
+
+    @pytest.mark.asyncio
+    async def test_update_user_reports_query_count(self, client: AsyncClient, create_user):
+        # get_by_id plus one UPDATE ... RETURNING
+        response = await client.put(
+            url=self.url.format(user_id=create_user.id), json={"full_name": "Counted"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Query-Count"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_get_user_if_none_match(self, client: AsyncClient, create_user):
+        url = self.url.format(user_id=create_user.id)
+        response = await client.get(url=url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+
+        # Version-only query at most (the tests share a session, so its
+        # loader may already hold the user), no full row
+        response = await client.get(url=url, headers={"If-None-Match": f"W/{etag}"})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert int(response.headers["X-Query-Count"]) <= 1
+
+        await client.put(url=url, json={"full_name": "Changed"})
+        response = await client.get(url=url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_update_user_if_match(self, client: AsyncClient, create_user):
+        url = self.url.format(user_id=create_user.id)
+        etag = (await client.get(url=url)).headers["ETag"]
+
+        response = await client.put(url=url, json={"full_name": "First"}, headers={"If-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
+        # Stale copy: rejected, the first write stays
+        response = await client.put(url=url, json={"full_name": "Second"}, headers={"If-Match": etag})
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert (await client.get(url=url)).json()["full_name"] == "First"
+
     @pytest.mark.asyncio
     async def test_update_user_invalid_user_id(self, client: AsyncClient):
         # Usar un UUID válido que no existe
@@ -99,3 +348,27 @@ class TestUpdateDeleteUsers:
             },
         )
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestRefreshToken:
+    url = "/users/refresh"
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_rotates_once(self, client: AsyncClient):
+        await client.post(
+            url="/users/",
+            json={"email": "refresh@test.com", "username": "refresh", "password": "test"},
+        )
+        login = await client.post(
+            url="/users/login", json={"email": "refresh@test.com", "password": "test"}
+        )
+        assert login.status_code == status.HTTP_200_OK
+        refresh_token = login.json()["refresh_token"]
+
+        response = await client.post(url=self.url, json={"refresh_token": refresh_token})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["refresh_token"] != refresh_token
+
+        # The exchanged token cannot be used again
+        response = await client.post(url=self.url, json={"refresh_token": refresh_token})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
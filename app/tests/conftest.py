@@ -12,6 +12,7 @@ import pytest
 import pytest_asyncio
 from fastapi import Request
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -19,12 +20,23 @@ from sqlalchemy.ext.asyncio import (
 )
 from testcontainers.postgres import PostgresContainer
 
-from app.infrastructure.database.dependencies import get_tenant_db
+from app.infrastructure.database.dependencies import (
+    _get_container,
+    get_read_db_session,
+    get_tenant_db,
+    get_tenant_read_db,
+)
+from app.infrastructure.database.tenant_provisioning import TenantSchemaProvisioner
+from dependency_injector import providers
 from app.infrastructure.database.models import Tenant, User
 from app.main import create_app
 from factory.alchemy import SQLAlchemyModelFactory
 from sqlmodel import SQLModel
-from app.infrastructure.database.connection import get_db_session
+from app.infrastructure.database.connection import (
+    _strip_search_path_schema,
+    get_db_session,
+    get_tenant_schema_name,
+)
 
 
 @pytest.fixture(scope="session")
@@ -74,6 +86,29 @@ async def db_session(
     await async_engine.dispose()
 
 
+@pytest_asyncio.fixture
+async def tenant_engine(db_session: AsyncSession):
+    """
+    Engine on the test database set up like the app's, with a single pooled
+    connection so tenant and public sessions take turns on it.
+    """
+    engine = create_async_engine(db_session.bind.url, pool_size=1, max_overflow=0)
+    event.listen(engine.sync_engine, "before_cursor_execute", _strip_search_path_schema, retval=True)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def tenant_schema(tenant_engine):
+    """An empty tenant schema, dropped after the test."""
+    schema = get_tenant_schema_name(uuid4())
+    async with tenant_engine.begin() as connection:
+        await connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    yield schema
+    async with tenant_engine.begin() as connection:
+        await connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(
     db_session: AsyncSession,
@@ -86,7 +121,16 @@ async def client(
         yield db_session
 
     app.dependency_overrides[get_tenant_db] = override_db
+    app.dependency_overrides[get_tenant_read_db] = override_db
     app.dependency_overrides[get_db_session] = override_db
+    app.dependency_overrides[get_read_db_session] = override_db
+
+    # Provision tenant schemas in the test database, not the configured one
+    container = _get_container()
+    tenant_provisioner = TenantSchemaProvisioner(
+        engine=db_session.bind, tenant_registry=container.tenant_registry()
+    )
+    container.tenant_provisioner.override(providers.Object(tenant_provisioner))
     transport = ASGITransport(app=app)
 
     async with AsyncClient(
@@ -94,6 +138,8 @@ async def client(
     ) as client:
         yield client
 
+    await tenant_provisioner.shutdown()
+    container.tenant_provisioner.reset_override()
     app.dependency_overrides.clear()
 
 
@@ -129,8 +175,6 @@ class TenantFactory(AsyncBaseFactory):
 @pytest_asyncio.fixture
 async def create_user(db_session: AsyncSession):
     """Create a test user using the factory."""
-    import json
-
     UserFactory._meta.sqlalchemy_session = db_session
     user = await UserFactory.create_async(
         email="test@test.com",
@@ -139,7 +183,7 @@ async def create_user(db_session: AsyncSession):
         tenant_id=uuid4(),
         full_name="test",
         role="user",
-        permissions=json.dumps(["read", "write"]),  # Convert list to JSON string
+        permissions=["read", "write"],
         is_active=True,
         id=uuid4(),
         created_at=datetime.now(timezone.utc),
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.authentication.password_hashing import PasswordHashExecutor, PasswordHashPriority
+
+
+class TestPasswordHashExecutor:
+
+    @pytest.fixture
+    def executor(self):
+        executor = PasswordHashExecutor(max_workers=1)
+        yield executor
+        executor._executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_login_runs_ahead_of_queued_signups(self, executor, monkeypatch):
+        submitted = []
+        submit = executor._executor.submit
+
+        def spy(function, *args):
+            submitted.append(args)
+            return submit(function, *args)
+
+        monkeypatch.setattr(executor._executor, "submit", spy)
+
+        # The only worker is busy until released, everything after it queues
+        release = threading.Event()
+        blocker = asyncio.create_task(executor.run(PasswordHashPriority.BULK_IMPORT, release.wait, 5))
+        await asyncio.sleep(0)
+        signups = [
+            asyncio.create_task(executor.run(PasswordHashPriority.SIGNUP, str, f"signup{i}"))
+            for i in range(3)
+        ]
+        cancelled = asyncio.create_task(executor.run(PasswordHashPriority.SIGNUP, str, "cancelled"))
+        login = asyncio.create_task(executor.run(PasswordHashPriority.LOGIN, str, "login"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        stats = executor.stats()
+        assert stats["running"] == 1
+        assert stats["queued"] == 4
+        assert stats["by_priority"]["login"]["queued"] == 1
+        assert stats["by_priority"]["signup"]["queued"] == 3
+
+        release.set()
+        assert await login == "login"
+        assert await asyncio.gather(*signups) == ["signup0", "signup1", "signup2"]
+        assert await blocker is True
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        assert submitted == [(5,), ("login",), ("signup0",), ("signup1",), ("signup2",)]
+        stats = executor.stats()
+        assert stats["running"] == 0
+        assert stats["queued"] == 0
+        assert stats["by_priority"]["login"]["completed"] == 1
+        assert stats["by_priority"]["signup"]["completed"] == 3
+        assert stats["by_priority"]["bulk_import"]["completed"] == 1
@@ -0,0 +1,48 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import Request
+
+from app.infrastructure.database import read_routing
+from app.infrastructure.database.read_routing import (
+    READ_YOUR_WRITES_HEADER,
+    issue_read_your_writes_token,
+    requires_primary,
+)
+
+
+def _request(token: str) -> Request:
+    headers = [(READ_YOUR_WRITES_HEADER.lower().encode(), token.encode("latin-1"))]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestReadYourWritesToken:
+
+    @pytest.fixture(autouse=True)
+    def replica(self, monkeypatch):
+        monkeypatch.setattr(read_routing, "has_read_replica", lambda: True)
+
+    def test_issued_token_routes_to_primary_until_it_expires(self, monkeypatch):
+        token = issue_read_your_writes_token()
+        assert requires_primary(_request(token))
+
+        later = time.time() + read_routing.settings.read_your_writes_window_seconds + 1
+        monkeypatch.setattr(read_routing, "time", SimpleNamespace(time=lambda: later))
+        assert not requires_primary(_request(token))
+
+    def test_forged_tokens_are_ignored(self):
+        token = issue_read_your_writes_token()
+        expires_at, _, signature = token.rpartition(".")
+        far_future = f"{time.time() + 86400:.3f}"
+
+        assert not requires_primary(_request(far_future))
+        assert not requires_primary(_request(f"{far_future}.{signature}"))
+        assert not requires_primary(_request(f"{expires_at}.{signature[:-1]}"))
+        assert not requires_primary(_request("é.é"))
+        assert not requires_primary(_request(""))
+
+    def test_signed_token_beyond_one_window_is_ignored(self):
+        far_future = f"{time.time() + 86400:.3f}"
+        token = f"{far_future}.{read_routing._sign(far_future).decode('ascii')}"
+        assert not requires_primary(_request(token))
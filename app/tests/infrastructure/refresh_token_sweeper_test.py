@@ -0,0 +1,44 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.infrastructure.database.models import RefreshToken
+from app.infrastructure.database.refresh_token_sweeper import RefreshTokenSweeper
+
+
+class TestRefreshTokenSweeper:
+
+    @pytest.mark.asyncio
+    async def test_sweep_deletes_expired_and_revoked_tokens(self, db_session, tenant_engine, create_user):
+        now = datetime.now(timezone.utc)
+
+        def token(expires_at: datetime, is_revoked: bool = False) -> RefreshToken:
+            return RefreshToken(
+                user_id=create_user.id, token_hash=os.urandom(32), expires_at=expires_at, is_revoked=is_revoked
+            )
+
+        live = [token(now + timedelta(days=1)) for _ in range(3)]
+        db_session.add_all(
+            live
+            + [token(now - timedelta(days=1)) for _ in range(7)]
+            + [token(now + timedelta(days=1), is_revoked=True) for _ in range(5)]
+        )
+        await db_session.commit()
+        live_ids = {refresh_token.id for refresh_token in live}
+
+        # 12 rows to reclaim, three full batches and an empty one
+        sweeper = RefreshTokenSweeper(tenant_engine, batch_size=4, pause_seconds=0)
+        report = await sweeper.sweep()
+        assert report.schemas == 1
+        assert report.failed_schemas == 0
+        assert report.deleted_rows == 12
+        assert report.dropped_partitions == 0
+
+        remaining = await db_session.execute(select(RefreshToken.id))
+        assert set(remaining.scalars()) == live_ids
+
+        report = await sweeper.sweep()
+        assert report.deleted_rows == 0
+        assert sweeper.stats()["last_run"]["deleted_rows"] == 0
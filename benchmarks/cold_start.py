@@ -0,0 +1,150 @@
+"""
+Cold-start report for the application.
+
+    python -m benchmarks.cold_start [--runs 10] [--target-ms 800]
+
+Each measurement runs in a fresh interpreter:
+
+- worker start: time of ``import app.main`` (which calls create_app) and
+  the number of modules it loads, best of ``--runs``
+- imports: ``python -X importtime`` grouped by top-level package, plus the
+  heaviest app modules with everything they pull in
+- create_app: cProfile of a create_app() call once imports are done,
+  grouped by module
+
+Exits with status 1 when the worker start exceeds ``--target-ms``, so it can
+guard the start time in CI.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# ~650 ms (799 modules) on a single-vCPU dev container once the email and
+# queue clients load lazily, down from ~830 ms (1089 modules); the target
+# leaves headroom for slower CI machines.
+TARGET_START_MS = 800.0
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+TIME_IMPORT = """
+import sys, time
+start = time.perf_counter()
+import app.main
+print((time.perf_counter() - start) * 1000, len(sys.modules))
+"""
+
+PROFILE_CREATE_APP = """
+import cProfile, pstats, sys
+import app.main
+profiler = cProfile.Profile()
+profiler.enable()
+app.main.create_app()
+profiler.disable()
+stats = pstats.Stats(profiler)
+for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items():
+    print(f"{tottime * 1000:.4f}\\t{filename}")
+"""
+
+
+def _run_python(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def measure_start(runs: int) -> Tuple[float, int]:
+    """Best import time of app.main (ms) and the number of loaded modules."""
+    best = float("inf")
+    modules = 0
+    for _ in range(runs):
+        milliseconds, modules = _run_python(["-c", TIME_IMPORT]).stdout.split()
+        best = min(best, float(milliseconds))
+    return best, int(modules)
+
+
+def import_breakdown() -> Tuple[Dict[str, float], List[Tuple[str, float]]]:
+    """Self time per top-level package and cumulative time of app modules (ms)."""
+    stderr = _run_python(["-X", "importtime", "-c", "import app.main"]).stderr
+    by_package: Dict[str, float] = defaultdict(float)
+    app_modules: List[Tuple[str, float]] = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, module = match.groups()
+        by_package[module.split(".")[0]] += int(self_us) / 1000
+        if module.startswith("app."):
+            app_modules.append((module, int(cumulative_us) / 1000))
+    return by_package, app_modules
+
+
+def create_app_breakdown() -> Dict[str, float]:
+    """Own time spent in each module while running create_app (ms)."""
+    stdout = _run_python(["-c", PROFILE_CREATE_APP]).stdout
+    by_module: Dict[str, float] = defaultdict(float)
+    for line in stdout.splitlines():
+        milliseconds, filename = line.split("\t", 1)
+        by_module[_module_name(filename)] += float(milliseconds)
+    return by_module
+
+
+def _module_name(filename: str) -> str:
+    if filename.startswith("<") or filename == "~":
+        return "<builtins>"
+    path = filename.replace(os.sep, "/")
+    for marker in ("/site-packages/", "/lib/python"):
+        if marker in path:
+            path = path.split(marker, 1)[1]
+            if marker == "/lib/python":
+                path = path.split("/", 1)[-1]
+            break
+    else:
+        cwd = os.getcwd().replace(os.sep, "/") + "/"
+        path = path.replace(cwd, "")
+    return path.rsplit(".py", 1)[0].replace("/", ".").removesuffix(".__init__")
+
+
+def _print_top(title: str, rows: List[Tuple[str, float]], limit: int) -> None:
+    print(f"\n{title}")
+    for name, milliseconds in rows[:limit]:
+        print(f"  {milliseconds:8.1f} ms  {name}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start report for app.main")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--target-ms", type=float, default=TARGET_START_MS)
+    parser.add_argument("--limit", type=int, default=15, help="rows per section")
+    args = parser.parse_args()
+
+    by_package, app_modules = import_breakdown()
+    _print_top(
+        "Import self time by top-level package",
+        sorted(by_package.items(), key=lambda item: item[1], reverse=True),
+        args.limit,
+    )
+    _print_top(
+        "Heaviest app modules (cumulative, includes what they import)",
+        sorted(app_modules, key=lambda item: item[1], reverse=True),
+        args.limit,
+    )
+    _print_top(
+        "create_app() own time by module",
+        sorted(create_app_breakdown().items(), key=lambda item: item[1], reverse=True),
+        args.limit,
+    )
+
+    start_ms, modules = measure_start(args.runs)
+    within_target = start_ms <= args.target_ms
+    print(
+        f"\nWorker start (import app.main incl. create_app, best of {args.runs}): "
+        f"{start_ms:.0f} ms, {modules} modules, target {args.target_ms:.0f} ms "
+        f"-> {'OK' if within_target else 'OVER TARGET'}"
+    )
+    return 0 if within_target else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Micro-benchmark of pagination cursor encoding and decoding.
+
+    python -m benchmarks.cursor_codec [--number 100000]
+
+Compares the signed binary cursors of CursorPaginationHelper with the
+previous base64 JSON encoding (values passed through str()) for the keys
+used by the list endpoints, and reports the cursor length.
+"""
+import argparse
+import base64
+import json
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from app.application.extensions.pagination import CursorPaginationHelper
+
+
+def legacy_encode(value: Any) -> str:
+    return base64.b64encode(json.dumps(value, default=str).encode("utf-8")).decode("utf-8")
+
+
+def legacy_decode(cursor: str) -> Any:
+    return json.loads(base64.b64decode(cursor.encode("utf-8")).decode("utf-8"))
+
+
+KEYS: Dict[str, Any] = {
+    "uuid": uuid4(),
+    "created_at, id": [datetime.now(timezone.utc), uuid4()],
+    "int": 123456789,
+}
+
+
+def _per_call_us(function: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1_000_000
+
+
+def run(number: int) -> List[Tuple[str, str, float, float, int]]:
+    helper = CursorPaginationHelper(secret_key="benchmark")
+    codecs = [
+        ("legacy json", legacy_encode, legacy_decode),
+        ("signed binary", helper.encode_cursor, helper.decode_cursor),
+    ]
+    rows = []
+    for key_name, value in KEYS.items():
+        for codec_name, encode, decode in codecs:
+            cursor = encode(value)
+            rows.append((
+                key_name,
+                codec_name,
+                _per_call_us(lambda: encode(value), number),
+                _per_call_us(lambda: decode(cursor), number),
+                len(cursor),
+            ))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cursor encode/decode micro-benchmark")
+    parser.add_argument("--number", type=int, default=100_000, help="calls per measurement")
+    args = parser.parse_args()
+
+    print(f"{'key':>15} {'codec':>14} {'encode us':>10} {'decode us':>10} {'length':>7}")
+    for key_name, codec_name, encode_us, decode_us, length in run(args.number):
+        print(f"{key_name:>15} {codec_name:>14} {encode_us:10.2f} {decode_us:10.2f} {length:7d}")
+
+
+if __name__ == "__main__":
+    main()
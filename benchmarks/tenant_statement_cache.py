@@ -0,0 +1,156 @@
+"""
+Compare the tenant_schema_strategy options across many tenant schemas.
+
+    python -m benchmarks.tenant_statement_cache --schemas 1000 --requests 20000
+
+Creates ``--schemas`` tenant schemas (once, reused by later runs), then sends
+the same repository queries to random tenants through the pool with each
+strategy, and reports throughput, latency and how many statements asyncpg
+had to prepare. "translate_map+lru" is translate_map with a per-connection
+prepared statement cache big enough to hold every schema's statements.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Dict, List
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.infrastructure.database.connection import _create_engine, bind_tenant_schema
+from app.infrastructure.database.repositories.user_repository import UserRepositoryImpl
+from app.infrastructure.database.tenant_provisioning import build_tenant_schema_ddl
+from app.shared.config import get_settings
+
+settings = get_settings()
+
+SCHEMA_PREFIX = "bench_tenant_"
+STATEMENTS_PER_REQUEST = 2
+
+
+class PrepareCounter:
+    """Counts server-side prepares issued by asyncpg (cache misses)."""
+
+    def __init__(self):
+        self.count = 0
+        self._original = asyncpg.Connection.prepare
+
+    def __enter__(self):
+        original = self._original
+
+        async def prepare(connection, *args, **kwargs):
+            self.count += 1
+            return await original(connection, *args, **kwargs)
+
+        asyncpg.Connection.prepare = prepare
+        return self
+
+    def __exit__(self, *exc):
+        asyncpg.Connection.prepare = self._original
+
+
+async def create_schemas(engine: AsyncEngine, count: int) -> List[str]:
+    schemas = [f"{SCHEMA_PREFIX}{i:05d}" for i in range(count)]
+    async with engine.connect() as connection:
+        result = await connection.exec_driver_sql(
+            f"SELECT nspname FROM pg_namespace WHERE nspname LIKE '{SCHEMA_PREFIX}%'"
+        )
+        existing = {row[0] for row in result}
+        missing = [schema for schema in schemas if schema not in existing]
+        for i, schema in enumerate(missing, 1):
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.execute(
+                build_tenant_schema_ddl(connection.dialect, schema)
+            )
+            if i % 50 == 0:
+                # Keep the lock table small, each schema takes several locks
+                await connection.commit()
+        await connection.commit()
+    print(f"{len(schemas)} schemas ({len(missing)} created)")
+    return schemas
+
+
+async def drop_schemas(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        result = await connection.exec_driver_sql(
+            f"SELECT nspname FROM pg_namespace WHERE nspname LIKE '{SCHEMA_PREFIX}%'"
+        )
+        for (schema,) in result.all():
+            await connection.exec_driver_sql(f'DROP SCHEMA "{schema}" CASCADE')
+
+
+async def run_strategy(
+    strategy: str, statement_cache_size: int, schemas: List[str], requests: int, concurrency: int
+) -> Dict[str, float]:
+    settings.tenant_schema_strategy = strategy
+    settings.database_statement_cache_size = statement_cache_size
+    engine = _create_engine(settings.database_url)
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def worker(rng: random.Random) -> None:
+        for _ in remaining:
+            schema = rng.choice(schemas)
+            start = time.perf_counter()
+            async with engine.connect() as connection:
+                await bind_tenant_schema(connection, schema)
+                async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+                    repository = UserRepositoryImpl(session)
+                    await repository.get_by_email("nobody@example.com")
+                    await repository.get_by_username("nobody")
+            latencies.append(time.perf_counter() - start)
+
+    with PrepareCounter() as prepares:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(random.Random(i)) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    compiled_cache = engine.sync_engine._compiled_cache
+    await engine.dispose()
+
+    latencies.sort()
+    return {
+        "requests/s": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "prepares": prepares.count,
+        "compiled_statements": len(compiled_cache) if compiled_cache is not None else 0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schemas", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=settings.database_pool_size)
+    parser.add_argument("--drop", action="store_true", help="drop the benchmark schemas and exit")
+    args = parser.parse_args()
+
+    setup_engine = _create_engine(settings.database_url)
+    if args.drop:
+        await drop_schemas(setup_engine)
+        await setup_engine.dispose()
+        return
+    schemas = await create_schemas(setup_engine, args.schemas)
+    await setup_engine.dispose()
+
+    default_cache_size = settings.database_statement_cache_size
+    runs = [
+        ("translate_map", "translate_map", default_cache_size),
+        ("translate_map+lru", "translate_map", len(schemas) * STATEMENTS_PER_REQUEST + 10),
+        ("search_path", "search_path", default_cache_size),
+    ]
+    print(f"{args.requests} requests, concurrency {args.concurrency}, pool size {settings.database_pool_size}, "
+          f"statement cache {default_cache_size}")
+    for label, strategy, cache_size in runs:
+        result = await run_strategy(strategy, cache_size, schemas, args.requests, args.concurrency)
+        print(f"{label:>17}: statement_cache={cache_size}, " + ", ".join(
+            f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in result.items()
+        ))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""
+Latency of user creation: check-then-insert versus a single INSERT ... RETURNING.
+
+    python -m benchmarks.user_create --users 2000
+
+Creates users in a scratch tenant schema (dropped afterwards) through:
+
+- "check+insert": the previous path, get_by_email, get_by_username, then an
+  ORM add, commit and refresh
+- "insert returning": UserRepositoryImpl.create
+
+and reports latency percentiles and database round trips per user
+(statements plus BEGIN/COMMIT/ROLLBACK, including the rollback when the
+session closes). Against a local server the gap is small; every saved round
+trip is worth a network RTT in production.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.application.exceptions.user_exceptions import UserAlreadyExistsError
+from app.domain.entities.user import User
+from app.infrastructure.database.connection import _create_engine, bind_tenant_schema
+from app.infrastructure.database.models import User as UserModel
+from app.infrastructure.database.repositories.user_repository import UserRepositoryImpl
+from app.infrastructure.database.tenant_provisioning import build_tenant_schema_ddl
+from app.shared.config import get_settings
+
+settings = get_settings()
+
+SCHEMA = "bench_user_create"
+
+
+class RoundTripCounter:
+    def __init__(self, engine: AsyncEngine):
+        self.count = 0
+        self._engine = engine.sync_engine
+        self._events = ["before_cursor_execute", "begin", "commit", "rollback"]
+
+    def _increment(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        for name in self._events:
+            event.listen(self._engine, name, self._increment)
+        return self
+
+    def __exit__(self, *exc):
+        for name in self._events:
+            event.remove(self._engine, name, self._increment)
+
+
+async def check_and_insert(session: AsyncSession, user: User) -> None:
+    repository = UserRepositoryImpl(session)
+    if await repository.get_by_email(user.email):
+        raise UserAlreadyExistsError(f"User with email {user.email} already exists")
+    if await repository.get_by_username(user.username):
+        raise UserAlreadyExistsError(f"User with username {user.username} already exists")
+    db_user = UserModel(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        password=user.password,
+        tenant_id=user.tenant_id,
+        full_name=user.full_name,
+        role=user.role,
+        permissions=user.permissions,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+    session.add(db_user)
+    await session.commit()
+    await session.refresh(db_user)
+
+
+async def insert_returning(session: AsyncSession, user: User) -> None:
+    await UserRepositoryImpl(session).create(user)
+    await session.commit()
+
+
+async def run_path(
+    engine: AsyncEngine, label: str, create: Callable[[AsyncSession, User], Awaitable[None]], users: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    async with engine.connect() as connection:
+        connection = await bind_tenant_schema(connection, SCHEMA)
+        with RoundTripCounter(engine) as round_trips:
+            for i in range(users):
+                user = User(email=f"{label}-{i}@example.com", username=f"{label}-{i}", password="x")
+                start = time.perf_counter()
+                async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+                    await create(session, user)
+                latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "round_trips": round_trips.count / users,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = _create_engine(settings.database_url)
+    async with engine.begin() as connection:
+        await connection.exec_driver_sql(f'DROP SCHEMA IF EXISTS "{SCHEMA}" CASCADE')
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.execute(build_tenant_schema_ddl(connection.dialect, SCHEMA))
+
+    try:
+        for label, create in (("check+insert", check_and_insert), ("insert returning", insert_returning)):
+            result = await run_path(engine, label.replace(" ", "-").replace("+", "-"), create, args.users)
+            print(f"{label:>16}: " + ", ".join(f"{key}={value:.2f}" for key, value in result.items()))
+    finally:
+        async with engine.begin() as connection:
+            await connection.exec_driver_sql(f'DROP SCHEMA IF EXISTS "{SCHEMA}" CASCADE')
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+"""
+Read-path cost of loading users: ORM instances versus Core rows plus the
+compiled row mapper.
+
+    python -m benchmarks.user_mapping --users 10000 --runs 5
+
+Fills a scratch tenant schema (dropped afterwards) with ``--users`` rows and
+loads all of them as domain entities through:
+
+- "orm": the previous path, ``select(UserModel)`` then ``User(...)`` per ORM
+  instance
+- "core+mapper": ``select(*USER_COLUMNS)`` through the generated mapper, what
+  UserRepositoryImpl does now
+
+For each it reports users per second for the whole load (best of
+``--runs``), users per second for the mapping step alone (rows already
+fetched), and memory per 10k users held while the session is still open,
+which for the ORM path includes the identity map.
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.domain.entities.user import User
+from app.infrastructure.database.connection import _create_engine, bind_tenant_schema
+from app.infrastructure.database.models import User as UserModel
+from app.infrastructure.database.repositories.user_repository import USER_COLUMNS, _map_user
+from app.infrastructure.database.tenant_provisioning import build_tenant_schema_ddl
+from app.shared.config import get_settings
+
+settings = get_settings()
+
+SCHEMA = "bench_user_mapping"
+
+FILL_USERS = """
+INSERT INTO users (id, email, username, password, full_name, role, permissions_array, is_active, created_at, updated_at)
+SELECT gen_random_uuid(), 'user' || i || '@example.com', 'user' || i, 'x', 'User ' || i, 'user',
+       '{users:read,users:write}', true, now(), now()
+FROM generate_series(1, $1) AS i
+"""
+
+
+def orm_to_entity(db_user: UserModel) -> User:
+    return User(
+        user_id=db_user.id,
+        email=db_user.email,
+        username=db_user.username,
+        tenant_id=db_user.tenant_id,
+        password=db_user.password,
+        full_name=db_user.full_name,
+        role=db_user.role,
+        permissions=db_user.permissions,
+        is_active=db_user.is_active,
+        created_at=db_user.created_at,
+        updated_at=db_user.updated_at,
+    )
+
+
+async def fetch_orm(session: AsyncSession) -> List[Any]:
+    return (await session.execute(select(UserModel))).scalars().all()
+
+
+async def fetch_core(session: AsyncSession) -> List[Any]:
+    return (await session.execute(select(*USER_COLUMNS))).all()
+
+
+PATHS: Dict[str, Tuple[Callable, Callable]] = {
+    "orm": (fetch_orm, orm_to_entity),
+    "core+mapper": (fetch_core, _map_user),
+}
+
+
+async def run_path(connection: AsyncConnection, fetch: Callable, to_entity: Callable, runs: int) -> Dict[str, float]:
+    best_load = best_map = float("inf")
+    for _ in range(runs):
+        async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+            start = time.perf_counter()
+            rows = await fetch(session)
+            mapped_at = time.perf_counter()
+            users = [to_entity(row) for row in rows]
+            end = time.perf_counter()
+        best_load = min(best_load, end - start)
+        best_map = min(best_map, end - mapped_at)
+
+    gc.collect()
+    tracemalloc.start()
+    async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+        baseline = tracemalloc.get_traced_memory()[0]
+        users = [to_entity(row) for row in await fetch(session)]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(users)
+    return {
+        "users/s": count / best_load,
+        "mapped/s": count / best_map,
+        "MB_per_10k": retained / count * 10_000 / 2**20,
+        "peak_MB_per_10k": (peak - baseline) / count * 10_000 / 2**20,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = _create_engine(settings.database_url)
+    async with engine.begin() as connection:
+        await connection.exec_driver_sql(f'DROP SCHEMA IF EXISTS "{SCHEMA}" CASCADE')
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.execute(build_tenant_schema_ddl(connection.dialect, SCHEMA))
+        await raw_connection.driver_connection.execute(f'SET LOCAL search_path = "{SCHEMA}"')
+        await raw_connection.driver_connection.execute(FILL_USERS, args.users)
+
+    try:
+        async with engine.connect() as connection:
+            connection = await bind_tenant_schema(connection, SCHEMA)
+            print(f"{args.users} users, best of {args.runs}")
+            for label, (fetch, to_entity) in PATHS.items():
+                result = await run_path(connection, fetch, to_entity, args.runs)
+                print(f"{label:>11}: " + ", ".join(f"{key}={value:,.1f}" for key, value in result.items()))
+    finally:
+        async with engine.begin() as connection:
+            await connection.exec_driver_sql(f'DROP SCHEMA IF EXISTS "{SCHEMA}" CASCADE')
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())